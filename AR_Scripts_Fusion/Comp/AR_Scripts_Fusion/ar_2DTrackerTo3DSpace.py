@@ -4,8 +4,8 @@ ar_2DTrackerTo3DSpace
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: 2D Tracker To 3D Space
-Version: 1.1.0
-Description-US: Creates a setup that converts active 2D tracker's point to 3D space.
+Version: 1.2.1
+Description-US: Creates a setup that converts active 2D tracker's point to 3D space.\nBake (or All Points) projects the points over the render range and writes Locator3D keyframes.
 
 Written for Blackmagic Design Fusion Studio 19.1.4 build 6.
 Python version 3.10.8 (64-bit).
@@ -13,11 +13,26 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.2.1 (18.10.2026) - Baked Locator3Ds are pasted with their splines at once, fixed sampling the tracker's outputs.
+1.2.0 (18.10.2026) - Added bake mode and All Points, all points are projected at once with NumPy (ar_lib.bake).
+                   - Added diagonal angle of view, fixed horizontal angle of view Y expression.
 1.1.0 (04.04.2025) - Added GUI to select the tracker point.
 1.0.0 (06.10.2024) - Initial realease.
 """
 # Libraries
 import re
+import sys
+import inspect
+from pathlib import Path
+
+import numpy as np
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import bake
+from ar_lib import settings
 
 
 # Global variables
@@ -29,6 +44,10 @@ ALT: str = "ALT"
 CTRL: str = "CTRL"
 SHIFT: str = "SHIFT"
 
+aov_types = {"Vertical": 0.0, "Horizontal": 1.0, "Diagonal": 2.0}
+all_points = "All Points"
+default_depth = -10
+
 
 # Functions
 def get_key_modifiers(ev: dict) -> list:
@@ -48,11 +67,6 @@ def get_key_modifiers(ev: dict) -> list:
 def tracker_to_3d_space(tracker, tracker_id, aov_type) -> None:
     """Creates a setup that converts 2D tracker data to 3D space."""
 
-    # Aov types.
-    # 0 = Vertical (supported).
-    # 1 = Horizontal (supported).
-    # 2 = Diagonal.
-
     # Camera3D.
     camera3d = comp.AddTool("Camera3D")
     camera3d_name = camera3d.Name
@@ -62,17 +76,24 @@ def tracker_to_3d_space(tracker, tracker_id, aov_type) -> None:
     shape3d_name = shape3d.Name
     shape3d.SetInput("Shape", "SurfaceSphereInputs")
 
+    camera3d.SetInput("AovType", aov_types[aov_type])
+    tangent = f"math.tan({camera3d_name}.AoV * (math.pi / 180) * 0.5)"
+    aspect = f"({camera3d_name}.ApertureW / {camera3d_name}.ApertureH)"
+
     if aov_type == "Vertical":
-        camera3d.SetInput("AovType", 0.0)
-        shape3d.Transform3DOp.Translate.X.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.X-0.5) * -(Transform3DOp.Translate.Z * (2 * math.tan({camera3d_name}.AoV * (math.pi / 180) * 0.5) * ({camera3d_name}.ApertureW / {camera3d_name}.ApertureH)))")
-        shape3d.Transform3DOp.Translate.Y.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.Y-0.5) * -(Transform3DOp.Translate.Z * (math.tan({camera3d_name}.AoV * (math.pi / 180) * 0.5) * 2.0))")
+        shape3d.Transform3DOp.Translate.X.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.X-0.5) * -(Transform3DOp.Translate.Z * (2 * {tangent} * {aspect}))")
+        shape3d.Transform3DOp.Translate.Y.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.Y-0.5) * -(Transform3DOp.Translate.Z * ({tangent} * 2.0))")
 
     elif aov_type == "Horizontal":
-        camera3d.SetInput("AovType", 1.0)
-        shape3d.Transform3DOp.Translate.X.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.X-0.5) * -(Transform3DOp.Translate.Z * (math.tan({camera3d_name}.AoV * (math.pi / 180) * 0.5) * 2.0))")
-        shape3d.Transform3DOp.Translate.Y.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.Y-0.5) * -(Transform3DOp.Translate.Z * (2 * math.atan(math.tan({camera3d_name}.AoV * (math.pi / 180) / 2) / ({camera3d_name}.ApertureW / {camera3d_name}.ApertureH))))")
+        shape3d.Transform3DOp.Translate.X.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.X-0.5) * -(Transform3DOp.Translate.Z * ({tangent} * 2.0))")
+        shape3d.Transform3DOp.Translate.Y.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.Y-0.5) * -(Transform3DOp.Translate.Z * (2 * {tangent} / {aspect}))")
 
-    shape3d.SetInput("Transform3DOp.Translate.Z", -10)
+    elif aov_type == "Diagonal":
+        diagonal = f"math.sqrt(1 + {aspect} * {aspect})"
+        shape3d.Transform3DOp.Translate.X.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.X-0.5) * -(Transform3DOp.Translate.Z * (2 * {tangent} * {aspect} / {diagonal}))")
+        shape3d.Transform3DOp.Translate.Y.SetExpression(f"({tracker.Name}.TrackedCenter{tracker_id}.Y-0.5) * -(Transform3DOp.Translate.Z * (2 * {tangent} / {diagonal}))")
+
+    shape3d.SetInput("Transform3DOp.Translate.Z", default_depth)
     
     # Connect nodes.
     camera3d.SceneInput = shape3d.Output
@@ -86,6 +107,89 @@ def tracker_to_3d_space(tracker, tracker_id, aov_type) -> None:
     return None
 
 
+def get_tangents(camera_values: np.ndarray, aov_type: str) -> np.ndarray:
+    """Returns tangents of the half angles of view (horizontal, vertical) per frame.
+    Camera values are (frames, 3): angle of view, aperture width and aperture height."""
+
+    aov, aperture_w, aperture_h = camera_values.T
+    aspect = aperture_w / aperture_h
+    tangent = np.tan(np.radians(aov) * 0.5)
+
+    if aov_type == "Horizontal":
+        return np.stack([tangent, tangent / aspect], axis=1)
+    if aov_type == "Diagonal":
+        diagonal = np.sqrt(1 + aspect * aspect)
+        return np.stack([tangent * aspect / diagonal, tangent / diagonal], axis=1)
+
+    return np.stack([tangent * aspect, tangent], axis=1)
+
+
+def project_points(points: np.ndarray, tangents: np.ndarray, depth: float) -> np.ndarray:
+    """Projects tracker points (frames, points, 2) to the plane at the depth in front of the camera.
+    Returns translate X and Y (frames, points, 2)."""
+
+    return (points - 0.5) * (-depth * 2 * tangents[:, np.newaxis, :])
+
+
+def bake_tracker_to_3d_space(tracker, tracker_ids: list[str], aov_type: str, camera3d=None) -> None:
+    """Creates a setup that converts 2D tracker data to 3D space with baked keyframes.
+    All points are projected at once and the Locator3Ds are pasted with their translate splines in one paste.
+    Uses the given camera (e.g. animated angle of view) or creates a new one."""
+
+    flow = comp.CurrentFrame.FlowView
+    x, y = flow.GetPosTable(tracker).values()
+    taken = {tool.Name for tool in comp.GetToolList(False).values()}
+    columns = 10
+
+    # The camera is needed first, the projection depends on its angle of view.
+    if camera3d is None:
+        camera3d = comp.AddTool("Camera3D", x + columns + 2, y)
+        camera3d.SetAttrs({'TOOLS_Name': bake.get_unique_name(f"{tracker.Name}Camera3D", taken)})
+        camera3d.SetInput("AovType", aov_types[aov_type])
+    else:
+        aov_type = next((key for key, value in aov_types.items() if value == camera3d.GetInput("AovType")), aov_type)
+
+    # Tracker and camera sampled once, all points projected at once.
+    frames = bake.get_frames(comp)
+    points = bake.sample([getattr(tracker, f"TrackedCenter{tracker_id}") for tracker_id in tracker_ids], frames)
+    camera_values = bake.sample([camera3d.AoV, camera3d.ApertureW, camera3d.ApertureH], frames)[:, :, 0]
+    translates = project_points(points, get_tangents(camera_values, aov_type), default_depth)
+
+    # The network and its splines, pasted at once.
+    tools = {}
+    locator_names = []
+    for i, tracker_id in enumerate(tracker_ids):
+        name = bake.get_unique_name(f"{tracker.Name}Point{tracker_id}", taken)
+        locator_names.append(name)
+        inputs = {
+            "Transform3DOp.Translate.X": bake.add_number(tools, f"{name}X", frames, translates[:, i, 0]),
+            "Transform3DOp.Translate.Y": bake.add_number(tools, f"{name}Y", frames, translates[:, i, 1]),
+            "Transform3DOp.Translate.Z": settings.make_input(default_depth),
+        }
+        tools[name] = settings.make_tool("Locator3D", inputs, position=(x + 1 + i % columns, y + 1 + i // columns))
+
+    merge_inputs = {}
+    previous = camera3d.SceneInput.GetConnectedOutput()
+    if previous is not None:
+        merge_inputs["SceneInput1"] = settings.make_connection(previous.GetTool().Name)
+    for name in locator_names:
+        merge_inputs[f"SceneInput{len(merge_inputs) + 1}"] = settings.make_connection(name)
+    merge_name = bake.get_unique_name(f"{tracker.Name}Merge3D", taken)
+    tools[merge_name] = settings.make_tool("Merge3D", merge_inputs, position=(x + columns + 1, y))
+
+    flow.Select()
+    comp.Paste(bmd.readstring(settings.build_setting(tools)))
+    camera3d.SceneInput = comp.FindTool(merge_name).Output
+
+    return None
+
+
+def get_point_number(tracker_point: str) -> str:
+    """Returns the number of the tracker point (e.g. "Point 3" -> "3")."""
+
+    return "".join(re.findall(r"\d+", tracker_point))
+
+
 def get_tracker_points(tracker) -> list:
     """Returns a list of tracker points."""
 
@@ -132,7 +236,7 @@ def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
     return {"width": gui_width, "height": gui_height, "x": gui_x, "y": gui_y}
 
 
-gui_geo = gui_geometry(325, 100, 0.5, 0.5)
+gui_geo = gui_geometry(325, 125, 0.5, 0.5)
 
 
 # GUI
@@ -180,6 +284,11 @@ dlg  = disp.AddWindow({"WindowTitle": "Tracker Thing",
                 ),
             ]),
 
+            ui.HGroup(
+            [
+                ui.CheckBox({"Text": "Bake Keyframes", "ID": "CheckBox_Bake", "Checked": False}),
+            ]),
+
             # Import and Cancel buttons.
             ui.HGroup(
             [
@@ -209,8 +318,8 @@ except:
         print("Something went wrong.")
 
 combo_aovtype = itm['ComboBox_AovType']
-combo_aovtype.AddItem("Vertical")
-combo_aovtype.AddItem("Horizontal")
+for aov_type in aov_types:
+    combo_aovtype.AddItem(aov_type)
 
 # Populate combobox with tracker points.
 if tracker is not None:
@@ -218,6 +327,11 @@ if tracker is not None:
     combo_tracker = itm['ComboBox_Tracker']
     for tracker_point in tracker_points:
         combo_tracker.AddItem(tracker_point)
+    if len(tracker_points) > 1:
+        combo_tracker.AddItem(all_points)
+
+    # Selected camera is used when baking.
+    selected_cameras = list(comp.GetToolList(True, "Camera3D").values())
 
     # Keys are pressed.
     def _func(ev):
@@ -236,10 +350,19 @@ if tracker is not None:
     # Ok.
     def _func(ev):
         selected_tracker = combo_tracker.CurrentText
-        selected_tracker_number = "".join(re.findall(r"\d+", selected_tracker))
         aov_type = combo_aovtype.CurrentText
         comp.StartUndo("Tracker to 3D space")
-        tracker_to_3d_space(tracker, selected_tracker_number, aov_type)
+        if selected_tracker == all_points:
+            tracker_ids = [get_point_number(tracker_point) for tracker_point in tracker_points]
+            comp.Lock()
+            bake_tracker_to_3d_space(tracker, tracker_ids, aov_type, next(iter(selected_cameras), None))
+            comp.Unlock()
+        elif itm['CheckBox_Bake'].Checked:
+            comp.Lock()
+            bake_tracker_to_3d_space(tracker, [get_point_number(selected_tracker)], aov_type, next(iter(selected_cameras), None))
+            comp.Unlock()
+        else:
+            tracker_to_3d_space(tracker, get_point_number(selected_tracker), aov_type)
         comp.EndUndo(True)
         disp.ExitLoop()
     dlg.On.Button_Ok.Clicked = _func
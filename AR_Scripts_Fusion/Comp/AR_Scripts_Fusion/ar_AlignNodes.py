@@ -4,7 +4,7 @@ ar_AlignNodes
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Align Nodes
-Version: 1.2.2
+Version: 1.4.0
 Description-US: Align selected nodes.
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -13,6 +13,9 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.4.0 (18.10.2026) - Layout is computed with ar_lib.layout (NumPy), only moved nodes are written in one locked batch.
+                   - Added distribute and snap to grid buttons.
+1.3.0 (18.10.2026) - Node positions are read from one composition snapshot, the live composition is used only to move the nodes.
 1.2.2 (28.01.2026) - Replaced texts with icons.
 1.2.1 (07.05.2025) - Added hotkey Ctrl+Q to close the dialog.
 1.2.0 (28.02.2025) - Added rotate buttons. Also added pivot point handling when activetool is selected.
@@ -21,7 +24,15 @@ Changelog:
 1.0.0 (02.09.2024) - Initial realease.
 """
 # Libraries
-import math
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import layout
 
 
 # Global variables
@@ -54,160 +65,41 @@ def align_nodes(direction: str, gap: int) -> None:
     If an active tool is selected, it is used as the origin point for alignment.
     Otherwise, the outermost node in the specified direction is used as the pivot."""
 
-    flow = comp.CurrentFrame.FlowView
-    tools = comp.GetToolList(True).values()
-    collected_nodes = []
-
-    active_tool = comp.ActiveTool
-
-    if active_tool:
-        # Use active tool's position as the origin point.
-        origin_x, origin_y = flow.GetPosTable(active_tool).values()
-    else:
-        # Determine the pivot point based on the direction.
-        if direction == "Button_Right":
-            # Select the node with the smallest x (leftmost).
-            origin_x = min(flow.GetPosTable(tool)[1] for tool in tools)
-            origin_y = [flow.GetPosTable(tool)[2] for tool in tools if flow.GetPosTable(tool)[1] == origin_x][0]
-        elif direction == "Button_Left":
-            # Select the node with the largest x (rightmost).
-            origin_x = max(flow.GetPosTable(tool)[1] for tool in tools)
-            origin_y = [flow.GetPosTable(tool)[2] for tool in tools if flow.GetPosTable(tool)[1] == origin_x][0]
-        elif direction == "Button_Up":
-            # Select the node with the largest y (topmost).
-            origin_y = max(flow.GetPosTable(tool)[2] for tool in tools)
-            origin_x = [flow.GetPosTable(tool)[1] for tool in tools if flow.GetPosTable(tool)[2] == origin_y][0]
-        elif direction == "Button_Down":
-            # Select the node with the smallest y (bottommost).
-            origin_y = min(flow.GetPosTable(tool)[2] for tool in tools)
-            origin_x = [flow.GetPosTable(tool)[1] for tool in tools if flow.GetPosTable(tool)[2] == origin_y][0]
-
-    # Collect node positions.
-    for tool in tools:
-        x, y = flow.GetPosTable(tool).values()
-        collected_nodes.append([tool, x, y])
-
-    sortedByX = []
-    sortedByY = []
-
-    if direction == "Button_Right":
-        sortedByX = sorted(collected_nodes, key=lambda x: x[1], reverse=False)
-        val = origin_x
-        for i, item in enumerate(sortedByX):
-            x = val
-            y = sortedByX[0][2]
-            flow.SetPos(item[0], x, y)
-            val = val + gap
-
-    if direction == "Button_Left":
-        sortedByX = sorted(collected_nodes, key=lambda x: x[1], reverse=True)
-        val = origin_x
-        for i, item in enumerate(sortedByX):
-            x = val
-            y = sortedByX[0][2]
-            flow.SetPos(item[0], x, y)
-            val = val - gap
-
-    if direction == "Button_Up":
-        sortedByY = sorted(collected_nodes, key=lambda x: x[2], reverse=True)
-        val = origin_y
-        for i, item in enumerate(sortedByY):
-            x = sortedByY[0][1]
-            y = val
-            flow.SetPos(item[0], x, y)
-            val = val - gap
-
-    if direction == "Button_Down":
-        sortedByY = sorted(collected_nodes, key=lambda x: x[2], reverse=False)
-        val = origin_y
-        for i, item in enumerate(sortedByY):
-            x = sortedByY[0][1]
-            y = val
-            flow.SetPos(item[0], x, y)
-            val = val + gap
+    directions = {"Button_Left": layout.LEFT, "Button_Right": layout.RIGHT, "Button_Up": layout.UP, "Button_Down": layout.DOWN}
+    nodes = layout.get_layout(comp)
+    layout.apply(comp, nodes, layout.align(nodes['positions'], directions[direction], gap, nodes['pivot']))
 
 
 def flip_nodes(direction: str) -> None:
     """Flips selected nodes. If an active tool is selected, it is used as the pivot point. 
-    Otherwise, the average center of the selected nodes is used."""
-    
-    flow = comp.CurrentFrame.FlowView
-    tools = comp.GetToolList(True).values()
-
-    # Get active tool, if available.
-    active_tool = comp.ActiveTool
-    
-    if active_tool:
-        # Use active tool's position as pivot point.
-        pivot_x, pivot_y = flow.GetPosTable(active_tool).values()
-    else:
-        # Calculate the average center of all selected nodes.
-        min_x = min(flow.GetPosTable(tool)[1] for tool in tools)
-        max_x = max(flow.GetPosTable(tool)[1] for tool in tools)
-        pivot_x = (min_x + max_x) / 2
-
-        min_y = min(flow.GetPosTable(tool)[2] for tool in tools)
-        max_y = max(flow.GetPosTable(tool)[2] for tool in tools)
-        pivot_y = (min_y + max_y) / 2
-    
-    # Flip all selected nodes around the pivot point.
-    for tool in tools:
-        pos = flow.GetPosTable(tool)
-        if direction == "Button_Flip_H":
-            # Flip horizontally using pivot_x.
-            new_x = pivot_x - (pos[1] - pivot_x)
-            flow.SetPos(tool, new_x, pos[2])
-
-        elif direction == "Button_Flip_V":
-            # Flip vertically using pivot_y.
-            new_y = pivot_y - (pos[2] - pivot_y)
-            flow.SetPos(tool, pos[1], new_y)
+    Otherwise, the center of the selected nodes is used."""
+
+    axis = layout.HORIZONTAL if direction == "Button_Flip_H" else layout.VERTICAL
+    nodes = layout.get_layout(comp)
+    layout.apply(comp, nodes, layout.flip(nodes['positions'], axis, nodes['pivot']))
 
 
 def rotate_nodes(angle: float) -> None:
     """Rotates selected nodes around the active tool's position by the given angle (in degrees).
        If no active tool is selected, uses the average center of all selected nodes."""
-    
-    flow = comp.CurrentFrame.FlowView
-    tools = comp.GetToolList(True).values()
-    
-    # Get active tool, if available.
-    active_tool = comp.ActiveTool
-    
-    if active_tool:
-        # Use active tool's position as pivot point.
-        pivot_x, pivot_y = flow.GetPosTable(active_tool).values()
-    else:
-        # Calculate the average center of all selected nodes.
-        sum_x = 0
-        sum_y = 0
-        count = len(tools)
-        
-        for tool in tools:
-            x, y = flow.GetPosTable(tool).values()
-            sum_x += x
-            sum_y += y
-        
-        pivot_x = sum_x / count
-        pivot_y = sum_y / count
-    
-    # Rotate all selected nodes around the pivot point.
-    for tool in tools:
-        x, y = flow.GetPosTable(tool).values()
-        
-        # Calculate offset from pivot point.
-        offset_x = x - pivot_x
-        offset_y = y - pivot_y
-        
-        # Convert angle to radians.
-        angle_rad = math.radians(angle)
-        
-        # Apply 90-degree rotation matrix (clockwise).
-        new_x = pivot_x + (offset_x * math.cos(angle_rad) - offset_y * math.sin(angle_rad))
-        new_y = pivot_y + (offset_x * math.sin(angle_rad) + offset_y * math.cos(angle_rad))
-        
-        # Set the new position for the node.
-        flow.SetPos(tool, new_x, new_y)
+
+    nodes = layout.get_layout(comp)
+    layout.apply(comp, nodes, layout.rotate(nodes['positions'], angle, nodes['pivot']))
+
+
+def distribute_nodes(direction: str) -> None:
+    """Spaces selected nodes evenly between the outermost nodes."""
+
+    axis = layout.HORIZONTAL if direction == "Button_Distribute_H" else layout.VERTICAL
+    nodes = layout.get_layout(comp)
+    layout.apply(comp, nodes, layout.distribute(nodes['positions'], axis))
+
+
+def snap_nodes() -> None:
+    """Snaps selected nodes to the grid."""
+
+    nodes = layout.get_layout(comp)
+    layout.apply(comp, nodes, layout.snap(nodes['positions']))
 
 
 def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
@@ -234,7 +126,7 @@ def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
     return {"width": gui_width, "height": gui_height, "x": gui_x, "y": gui_y}
 
 
-gui_geo = gui_geometry(100, 100, 0.5, 0.5)
+gui_geo = gui_geometry(100, 150, 0.5, 0.5)
 
 
 # GUI 
@@ -277,6 +169,13 @@ dlg  = disp.AddWindow({"WindowTitle": "Align Nodes",
                 ui.Button({"Text": "↺", "ID": "Button_Rotate_CCW", "ToolTip": "Rotate Counter Clockwise"}),
                 ui.Button({"Text": "↻", "ID": "Button_Rotate_CW", "ToolTip": "Rotate Clockwise"}),
             ]),
+            ui.HGroup([
+                ui.Button({"Text": "⇹", "ID": "Button_Distribute_H", "ToolTip": "Distribute Horizontally"}),
+                ui.Button({"Text": "⤒", "ID": "Button_Distribute_V", "ToolTip": "Distribute Vertically"}),
+            ]),
+            ui.HGroup([
+                ui.Button({"Text": "#", "ID": "Button_Snap", "ToolTip": "Snap to Grid"}),
+            ]),
         ]),
     ])
 
@@ -330,6 +229,21 @@ dlg.On.Button_Rotate_CW.Clicked = _func
 dlg.On.Button_Rotate_CCW.Clicked = _func
 
 
+def _func(ev):
+    comp.StartUndo("Distribute nodes")
+    distribute_nodes(ev['who'])
+    comp.EndUndo(True)
+dlg.On.Button_Distribute_H.Clicked = _func
+dlg.On.Button_Distribute_V.Clicked = _func
+
+
+def _func(ev):
+    comp.StartUndo("Snap nodes")
+    snap_nodes()
+    comp.EndUndo(True)
+dlg.On.Button_Snap.Clicked = _func
+
+
 # Open the dialog.
 dlg.Show()
 disp.RunLoop()
@@ -0,0 +1,47 @@
+"""
+ar_AutoLayout
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Name-US: Auto Layout
+Version: 1.0.0
+Description-US: Lays out selected nodes automatically in layers, from inputs to outputs.\nIf nothing is selected, all nodes are laid out.
+Note: Connections to unselected nodes are ignored, unselected nodes are not moved.
+
+Written for Blackmagic Design Fusion Studio 19.0.3 build 3.
+Python version 3.10.8 (64-bit).
+
+Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
+
+Changelog:
+1.0.0 (18.10.2026) - Initial realease.
+"""
+# Libraries
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import auto_layout
+
+
+# Global variables
+bmd = bmd  # import BlackmagicFusion as bmd
+fusion = fu  # fusion = bmd.scriptapp("Fusion")
+comp = comp  # comp = fusion.GetCurrentComp()
+
+
+# Functions
+def main() -> None:
+    """The main function."""
+
+    comp.StartUndo("Auto layout")
+    auto_layout.auto_layout(comp)
+    comp.EndUndo(True)
+
+
+if __name__ == "__main__":
+    main()
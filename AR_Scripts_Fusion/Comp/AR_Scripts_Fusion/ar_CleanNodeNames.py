@@ -4,17 +4,19 @@ ar_CleanNodeNames
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Clean Node Names
-Version: 1.2.0
+Version: 1.3.1
 Description-US: Cleans node names (eg. ..._1_1_1_1_1).
 
-Note: Might take a long time to process if you have a huge composition.
-
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
 Python version 3.10.8 (64-bit).
 
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.3.1 (18.10.2026) - Fixed expressions of inputs with dotted ids (e.g. Layer1.Center) and of tools inside groups.
+1.3.0 (18.10.2026) - Names are rewritten with a single pattern in one scan per string, only inputs with expressions or scripts are visited.
+                   - Prints updated expressions and scripts per tool.
+                   - Bug fix: end render scripts weren't updated.
 1.2.0 (04.09.2025) - Added support for frame render scripts, start render scripts and end render scripts.
                    - Prints now the process in the console.
 1.1.0 (28.02.2025) - Improved the cleaning algorithm. Added expression handling.
@@ -22,7 +24,16 @@ Changelog:
 """
 # Libraries
 import re
+import sys
+import inspect
 from collections import defaultdict
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import rename
 
 
 # Global variables
@@ -30,6 +41,8 @@ bmd = bmd  # import BlackmagicFusion as bmd
 fusion = fu  # fusion = bmd.scriptapp("Fusion")
 comp = comp  # comp = fusion.GetCurrentComp()
 
+render_scripts = ["FrameRenderScript", "StartRenderScript", "EndRenderScript"]
+
 
 def clean_and_serialize_node_names() -> dict[str, str]:
     """Cleans and renames nodes in a unique serialized order.
@@ -68,58 +81,82 @@ def clean_and_serialize_node_names() -> dict[str, str]:
     return name_map
 
 
+def get_script_inputs(tool_settings: dict) -> dict[str, tuple[str, str]]:
+    """Returns the tool's inputs that have an expression or a render script: input id: (kind, text)."""
+
+    found = {}
+    inputs = tool_settings.get("Inputs") or {}
+    for input_id, input_settings in inputs.items():
+        if not isinstance(input_settings, dict):
+            continue
+        expression = input_settings.get("Expression")
+        if expression:
+            found[input_id] = ("Expression", expression)
+        elif input_id in render_scripts and input_settings.get("Value"):
+            found[input_id] = ("Script", input_settings['Value'])
+
+    return found
+
+
+def iter_tools_settings(tools_settings: dict):
+    """Yields (tool name, tool settings) of the tools and the tools inside groups and macros."""
+
+    for tool_name, tool_settings in tools_settings.items():
+        if not isinstance(tool_settings, dict):
+            continue
+        yield tool_name, tool_settings
+        children = tool_settings.get("Tools")
+        if isinstance(children, dict):
+            yield from iter_tools_settings(children)
+
+
+def get_inputs_by_id(tool) -> dict:
+    """Returns tool's inputs by their ids (e.g. "Layer1.Center", "Transform3DOp.Translate.X")."""
+
+    return {inp.GetAttrs("INPS_ID"): inp for inp in tool.GetInputList().values()}
+
+
 def update_expressions(name_map: dict[str, str]) -> None:
-    """Updates all tool input expressions and scripts to reflect renamed nodes."""
+    """Updates all tool input expressions and scripts to reflect renamed nodes.
+    Tool settings are read with one call, only the inputs that have an expression or a script are visited."""
 
-    tools = comp.GetToolList(False).values()
+    pattern = rename.build_pattern(name_map)
+    if pattern is None:
+        print("No expressions or scripts to update.")
+        return
+
+    tools = {tool.Name: tool for tool in comp.GetToolList(False).values()}
+    tools_settings = (comp.CopySettings(list(tools.values())) or {}).get("Tools") or {}
     counter = 0
 
     print("Updating expressions and scripts...")
 
-    for tool in tools:
-        inputs = tool.GetInputList()
-
-        # Update expressions.
-        for input_name, inp in inputs.items():
-            expression = inp.GetExpression()
-            if expression:
-                updated_expression = expression
-                for old_name, new_name in sorted(name_map.items(), key=lambda x: -len(x[0])):
-                    updated_expression = updated_expression.replace(old_name + ".", new_name + ".")                
-                if updated_expression != expression:
-                    inp.SetExpression(updated_expression)
-                    counter = counter + 1
-                    #print(f"Updated expression for {tool.Name}.{input_name}: {updated_expression}")
-                    
-        # Update frame render script.
-        frame_render_script = tool.GetInput("FrameRenderScript")
-        updated_frame_render_script = frame_render_script
-        if updated_frame_render_script != None:
-            for old_name, new_name in sorted(name_map.items(), key=lambda x: -len(x[0])):
-                updated_frame_render_script = updated_frame_render_script.replace(old_name + ".", new_name + ".")
-            if updated_frame_render_script != frame_render_script:
-                tool.SetInput("FrameRenderScript", updated_frame_render_script)
-                counter = counter + 1
-
-        # Update start render script.
-        start_render_script = tool.GetInput("StartRenderScript")
-        updated_start_render_script = start_render_script
-        if start_render_script != None:
-            for old_name, new_name in sorted(name_map.items(), key=lambda x: -len(x[0])):
-                updated_start_render_script = updated_start_render_script.replace(old_name + ".", new_name + ".")
-            if updated_start_render_script != start_render_script:
-                tool.SetInput("StartRenderScript", updated_start_render_script)
-                counter = counter + 1
-
-        # Update end render script.
-        end_render_script = tool.GetInput("EndRenderScript")
-        updated_end_render_script = end_render_script
-        if end_render_script != None:
-            for old_name, new_name in sorted(name_map.items(), key=lambda x: -len(x[0])):
-                end_render_script = end_render_script.replace(old_name + ".", new_name + ".")
-            if updated_end_render_script != start_render_script:
-                tool.SetInput("EndRenderScript", updated_end_render_script)
-                counter = counter + 1
+    for tool_name, tool_settings in iter_tools_settings(tools_settings):
+        tool = tools.get(tool_name) or comp.FindTool(tool_name)
+        if tool is None:
+            continue
+
+        tool_counter = 0
+        inputs = None
+        for input_id, (kind, text) in get_script_inputs(tool_settings).items():
+            updated_text, replacements = rename.rewrite(text, pattern, name_map)
+            if not replacements:
+                continue
+
+            if kind == "Expression":
+                if inputs is None:
+                    inputs = get_inputs_by_id(tool)
+                inp = inputs.get(input_id)
+                if inp is None:
+                    continue
+                inp.SetExpression(updated_text)
+            else:
+                tool.SetInput(input_id, updated_text)
+            tool_counter = tool_counter + 1
+
+        if tool_counter:
+            print(f"{tool_name}: {tool_counter} expression(s)/script(s)")
+            counter = counter + tool_counter
 
     print(f"Updated {counter} expression(s)/script(s)!")
 
@@ -4,7 +4,7 @@ ar_ImportFolder
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Import Folder
-Version: 1.4.0
+Version: 1.8.0
 Description-US: Imports all of the image sequences from the selected folder.
 
 Written for Blackmagic Design Fusion Studio 19.1.3 build 5.
@@ -16,6 +16,14 @@ To do:
 - Detect and handle video files.
 
 Changelog:
+1.8.0 (18.10.2026) - Added merge topology option: merge chain, balanced merge tree or MultiMerge.
+1.7.0 (18.10.2026) - Loaders and merges are created with a single paste.
+1.6.0 (18.10.2026) - Folder is scanned in the background with progress info, the scan can be cancelled.
+                   - Loaders are created after the scan when Import is pressed again.
+1.5.1 (18.10.2026) - Single images are collected with one read per folder (no more folder scan per image).
+1.5.0 (18.10.2026) - Image sequences are collected with a single folder walk and loaders are created while the walk goes on.
+                   - Loader uses the first frame's real file path (keeps the frame number padding).
+1.4.1 (18.10.2026) - Uses shared ar_lib.sequence index to get frame ranges.
 1.4.0 (31.05.2025) - Added support to import single images.
                    - Bug fix in image formats list.
 1.3.1 (07.05.2025) - Added hotkey Ctrl+Q to close the dialog.
@@ -26,9 +34,21 @@ Changelog:
 """
 # Libraries
 import os
-import re
+import sys
+import queue
+import threading
+from collections.abc import Iterator
+import inspect
 from pathlib import Path
 
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import sequence
+from ar_lib import settings
+from ar_lib import merge_network
+
 
 # Global variables
 bmd = bmd  # import BlackmagicFusion as bmd
@@ -41,6 +61,8 @@ SHIFT: str = "SHIFT"
 
 image_formats = [".jpg", ".jpeg", ".png", ".tif", ".tiff", ".exr", ".dpx", ".bpm", ".tga", ".psd"]
 
+scan = {}  # State of the background scan.
+
 
 # Functions
 def get_key_modifiers(ev: dict) -> list:
@@ -57,220 +79,174 @@ def get_key_modifiers(ev: dict) -> list:
     return key_modifiers
 
 
-def range_map(value: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
-    """Remaps values."""
-
-    if in_max - in_min == 0:
-        raise ValueError("input range cannot be zero")
-    
-    return (value - in_min) / (in_max - in_min) * (out_max - out_min) + out_min
-
-
-def collect_images(dir_path: str, subfolders: bool) -> list[str]:
-    """Collect images from given folder path."""
-
-    collected_images = []
-    path = Path(dir_path)
-
-    if path.exists() and path.is_dir():
-
-        if subfolders:
-            for file_path in sorted(path.rglob("*")):
-                if file_path.is_file():
-                    if file_path.suffix.lower() in image_formats:
-
-                        digits_pattern = r'\d+(?!.*\d)'
-                        frame_number = int(re.search(digits_pattern, str(file_path)).group())
-                        first_frame, last_frame = get_frame_range(file_path.as_posix())                        
-                        length = last_frame-first_frame
-                        trim_position = 0
-                        if length != 0:
-                            trim_position = range_map(frame_number, first_frame, last_frame, 0, length)
-
-                        collected_images.append([file_path, trim_position])
-        
-        else:
-            for file_path in sorted(path.iterdir()):
-                if file_path.is_file():
-                    if file_path.suffix.lower() in image_formats:
-
-                        digits_pattern = r'\d+(?!.*\d)'
-                        frame_number = int(re.search(digits_pattern, str(file_path)).group())
-                        first_frame, last_frame = get_frame_range(file_path.as_posix())                        
-                        length = last_frame-first_frame
-                        trim_position = 0
-                        if length != 0:
-                            trim_position = range_map(frame_number, first_frame, last_frame, 0, length)
-
-                        collected_images.append([file_path, trim_position])
-    
-    return collected_images
-
-
-def collect_image_sequences(dir_path: str, subfolders: bool) -> list[str]:
-    """Collect image sequences from given folder path."""
-
-    collected_sequences = []
-    path = Path(dir_path)
-
-    if path.exists() and path.is_dir():
-
-        if subfolders:
-            for file_path in sorted(path.rglob("*")):
-                if file_path.is_file():
-                    if file_path.suffix.lower() in image_formats:
-                        # Get file name without frame number.
-                        file_wo_fn = re.sub(r'(\d+)(\.\w+)$', r'\2', file_path.name)
-                        
-                        # Create full path for the file without frame number.
-                        full_path = file_path.with_name(file_wo_fn).as_posix()
-                        if all(sublist[0] != full_path for sublist in collected_sequences):
-                            first_frame, last_frame = get_frame_range(file_path.as_posix())
-                            collected_sequences.append([full_path, first_frame, last_frame, file_path])
-        
-        else:
-            for file_path in sorted(path.iterdir()):
-                if file_path.is_file():
-                    if file_path.suffix.lower() in image_formats:
-                        # Get file name without frame number.
-                        file_wo_fn = re.sub(r'(\d+)(\.\w+)$', r'\2', file_path.name)
-                        
-                        # Create full path for the file without frame number.
-                        full_path = file_path.with_name(file_wo_fn).as_posix()
-                       
-                        if all(sublist[0] != full_path for sublist in collected_sequences):
-                            first_frame, last_frame = get_frame_range(file_path.as_posix())
-                            collected_sequences.append([full_path, first_frame, last_frame, file_path])
-    
-    return collected_sequences
-
-
-def create_loaders(method: int, items: list, merge: bool, select: bool, starting_frame_method: str, custom_frame: int) -> None:
-    """Creates loaders."""
-    
-    flow = comp.CurrentFrame.FlowView
-    loader_nodes = []
-    merge_nodes = []
-    x = 0
-    y = 0
+def count_files(listing: dict, progress: dict | None) -> bool:
+    """Adds folder's file count to the progress. Returns False if the scan is cancelled."""
+
+    if progress is None:
+        return True
+
+    progress['folders'] += 1
+    progress['files'] += len(listing['files'])
+    progress['files'] += sum(len(found['frames']) for found in listing['sequences'].values())
+
+    return not progress['cancel'].is_set()
+
+
+def collect_images(dir_path: str, subfolders: bool, progress: dict | None = None) -> Iterator[list]:
+    """Collect images from given folder path.
+    Every folder is read only once, trim positions are calculated from the sequence's frame list.
+    Yields [file path, trim position]."""
+
+    if not os.path.isdir(dir_path):
+        return
+
+    for folder, listing in sequence.walk_listings(dir_path, subfolders):
+        if not count_files(listing, progress):
+            return
+
+        images = []
+
+        # Images with frame numbers, trim position is the offset from the sequence's first frame.
+        for found in listing['sequences'].values():
+            if found['extension'].lower() not in image_formats:
+                continue
+            for frame_number in found['frames']:
+                images.append([Path(sequence.sequence_path(found, frame_number)), frame_number - found['first']])
+
+        # Images without frame numbers.
+        for file_name in listing['files']:
+            if os.path.splitext(file_name)[1].lower() in image_formats:
+                images.append([Path(folder, file_name), 0])
+
+        images.sort(key=lambda image: image[0].name)
+        yield from images
+
+
+def collect_image_sequences(dir_path: str, subfolders: bool, progress: dict | None = None) -> Iterator[list]:
+    """Collect image sequences from given folder path.
+    Walks the folder once and yields sequences as they are found: [path without frame number, first frame, last frame, first file path]."""
+
+    if not os.path.isdir(dir_path):
+        return
+
+    for _, listing in sequence.walk_listings(dir_path, subfolders):
+        if not count_files(listing, progress):
+            return
+
+        for key in sorted(listing['sequences']):
+            found = listing['sequences'][key]
+            if found['extension'].lower() not in image_formats:
+                continue
+
+            full_path = Path(found['directory'], found['prefix'] + found['extension']).as_posix()
+            first_file_path = Path(sequence.sequence_path(found, found['first']))
+            yield [full_path, found['first'], found['last'], first_file_path]
+
+
+def scan_worker(dir_path: str, method: int, subfolders: bool, state: dict) -> None:
+    """Collects items in a background thread and sends them to the dialog through the queue."""
+
+    collect = collect_image_sequences if method == 0 else collect_images
+
+    try:
+        for item in collect(dir_path, subfolders, state['progress']):
+            if state['cancel'].is_set():
+                break
+            state['queue'].put(item)
+    finally:
+        state['done'].set()
+
+
+def start_scan(dir_path: str, method: int, subfolders: bool) -> None:
+    """Starts collecting items in a background thread."""
+
+    cancel = threading.Event()
+    state = {
+        "settings": (dir_path, method, subfolders),
+        "queue": queue.Queue(),
+        "cancel": cancel,
+        "done": threading.Event(),
+        "progress": {"folders": 0, "files": 0, "cancel": cancel},
+        "items": [],
+    }
+
+    # The worker keeps its own reference, so clearing the dialog's scan state won't break it.
+    scan.clear()
+    scan.update(state)
+
+    thread = threading.Thread(target=scan_worker, args=(dir_path, method, subfolders, state), daemon=True)
+    thread.start()
+
+
+def receive_items() -> None:
+    """Moves items sent by the background scan to the scan's item list."""
+
+    while True:
+        try:
+            scan['items'].append(scan['queue'].get_nowait())
+        except queue.Empty:
+            break
+
+
+def is_scanning() -> bool:
+    """Checks if the background scan is running."""
+
+    return bool(scan) and not scan['done'].is_set()
+
+
+def build_loaders_setting(method: int, items: list, merge: bool, starting_frame_method: str, custom_frame: int, global_start: int, topology: str = merge_network.CHAIN) -> str:
+    """Builds settings of the loaders (and merges) with positions and connections, ready to be pasted."""
+
+    tools = {}
+    loader_names = []
+    positions = {}
 
     # Loaders.
-    if method == 0:  # Image sequences.
-        for i, item in enumerate(items):
-            loader = comp.AddTool("Loader", x, y)
-            filename, extension = os.path.splitext(item[0])
+    for y, item in enumerate(items):
+        if method == 0:  # Image sequences.
             first_frame = item[1]
             last_frame = item[2]
-            dir_path = os.path.dirname(item[0])
-            file_path = os.path.join(dir_path, filename+str(first_frame)+extension)
-            loader.SetInput("Clip", file_path)
-
             length = last_frame - first_frame
 
             if starting_frame_method == "Custom starting frame":
-                loader.SetInput("GlobalOut", int(custom_frame+length))
-                loader.SetInput("GlobalIn", int(custom_frame))
-
-            elif starting_frame_method == "Starting frame from file":
-                loader.SetInput("GlobalOut", int(last_frame))
-                loader.SetInput("GlobalIn", int(first_frame))
+                global_in = int(custom_frame)
+            else:  # Starting frame from file.
+                global_in = int(first_frame)
 
-            loader.SetInput("ClipTimeEnd", int(length))
-            loader.SetInput("ClipTimeStart", 0)
-            loader.SetInput("HoldLastFrame", 0)
-            loader.SetInput("HoldFirstFrame", 0)
+            clip = settings.make_clip(item[3].as_posix(), trim_in=0, trim_out=int(length),
+                                      global_start=global_in, global_end=global_in + int(length),
+                                      start_frame=first_frame, length=length + 1)
 
-            if select:
-                flow.Select(loader, True)
+        else:  # Single images.
+            clip = settings.make_clip(Path(item[0]).as_posix(), trim_in=item[1], trim_out=item[1],
+                                      global_start=global_start, global_end=global_start, loop=True)
 
-            if merge:
-                loader_nodes.append(loader)
+        name = f"Loader{y + 1}"
+        tools[name] = settings.make_tool("Loader", position=(0, y), extra={"Clips": [clip]})
+        loader_names.append(name)
+        positions[name] = (0, y)
 
-            y = y + 1
+    # Merges, the first loader is at the bottom.
+    if merge:
+        tools.update(merge_network.build_merges(loader_names, positions, topology))
 
-    else:  # Single images.
-        for i, item in enumerate(items):
-            loader = comp.AddTool("Loader", x, y)
-            file_path = item[0]
-            loader.SetInput("Clip", str(file_path))
-            loader.SetInput("Loop", 1)
+    return settings.build_setting(tools)
 
-            loader.SetInput("ClipTimeStart", item[1])
-            loader.SetInput("ClipTimeEnd", item[1])
 
-            if select:
-                flow.Select(loader, True)
+def create_loaders(method: int, items: list, merge: bool, select: bool, starting_frame_method: str, custom_frame: int, topology: str = merge_network.CHAIN) -> None:
+    """Creates loaders with a single paste."""
 
-            if merge:
-                loader_nodes.append(loader)
+    items = list(items)
+    if not items:
+        return
 
-            y = y + 1
+    global_start = int(comp.GetAttrs("COMPN_RenderStart"))
+    setting = build_loaders_setting(method, items, merge, starting_frame_method, custom_frame, global_start, topology)
 
+    comp.Paste(bmd.readstring(setting))  # Pasted tools are selected.
 
-    # Merges.
-    if merge:
-        for i, loader in enumerate(loader_nodes):
-
-            if i != 0:
-                flow = comp.CurrentFrame.FlowView
-                pos_x, pos_y = flow.GetPosTable(loader).values()
-                merge = comp.AddTool("Merge", pos_x + 1, pos_y)
-                if select:
-                    flow.Select(merge, True)
-                merge_nodes.append(merge)
-
-        for i, merge in enumerate(merge_nodes):
-            if i == 0:
-                merge.Background = loader_nodes[0].Output
-                merge.Foreground = loader_nodes[1].Output
-            else:
-                merge.Background = merge_nodes[i-1].Output
-                merge.Foreground = loader_nodes[i+1].Output
-
-
-def replace_frame_number(file_path: str, frame_number: int) -> str:
-    """Replaces file paths frame number with given one."""
-
-    all_numbers = re.findall(r'\d+', file_path)
-    
-    if not all_numbers:
-        return file_path
-    
-    last_number = all_numbers[-1]
-    padded_new_number = str(frame_number).zfill(len(last_number))
-    updated_file_path = re.sub(r'(\d+)(?=\D*$)', padded_new_number, file_path)
-
-    return updated_file_path
-
-            
-def get_frame_range(file_path: str) -> tuple[int, int]:
-    """Returns first and last frame numbers from given image sequence path."""
-
-    clean_path = re.sub(r'(.*?)(\d+)\.[a-zA-Z]+$', r'\1', file_path)
-    file_name = os.path.basename(clean_path)
-    dir_path = os.path.dirname(file_path)
-    extension = os.path.splitext(file_path)[1]
-
-    found = False
-    first_frame = 0
-    last_frame = 0
-
-    file_name_pattern = rf"{re.escape(file_name)}\d+{re.escape(extension)}"
-    digits_pattern = r'\d+(?!.*\d)'
-
-    if os.path.exists(dir_path) and os.path.isdir(dir_path):
-        for file in sorted(os.listdir(dir_path)):
-            match = re.search(file_name_pattern, file)
-
-            if match:
-                frame_number = int(re.search(digits_pattern, file).group())
-                if found == False:
-                    first_frame = frame_number
-                    found = True
-                else:
-                    last_frame = frame_number
-
-    return first_frame, last_frame
+    if not select:
+        comp.CurrentFrame.FlowView.Select()  # Deselect all tools.
 
 
 def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
@@ -297,7 +273,7 @@ def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
     return {"width": gui_width, "height": gui_height, "x": gui_x, "y": gui_y}
 
 
-gui_geo = gui_geometry(500, 150, 0.5, 0.5)
+gui_geo = gui_geometry(500, 200, 0.5, 0.5)
 
 
 # GUI
@@ -347,6 +323,18 @@ dlg  = disp.AddWindow({"WindowTitle": "Import Folder",
                 ui.CheckBox({"Text": "Include subfolders", "ID": "Checkbox_Subfolders", "ToolTip": "Warning!\nScanning all subfolders might take a long time!"}),
             ]),
 
+            # Merge topology.
+            ui.HGroup(
+            [
+                ui.Label({"Text": "Merge:", "ID": "Label_Topology", "Weight": 0.1}),
+                ui.ComboBox({"ID": "Combobox_Topology", "Weight": 0.9, "ToolTip": "Chain: Every loader is merged over the previous merge.\nTree: Balanced tree of merges, shallow graph.\nMultiMerge: One MultiMerge with a layer per loader."}),
+            ]),
+
+            # Scan progress.
+            ui.HGroup(
+            [
+                ui.Label({"Text": "", "ID": "Label_Progress"}),
+            ]),
 
             # Import and Cancel buttons.
             ui.HGroup(
@@ -368,12 +356,82 @@ itm['Combobox_Method'].AddItem("Import Single Images")
 itm['Combobox_Starting_Frame'].AddItem("Custom starting frame")
 itm['Combobox_Starting_Frame'].AddItem("Starting frame from file")
 
+itm['Combobox_Topology'].AddItem("Merge Chain")
+itm['Combobox_Topology'].AddItem("Balanced Merge Tree")
+itm['Combobox_Topology'].AddItem("MultiMerge")
+
 # Default settings.
 itm['Checkbox_Select'].Checked = True
+itm['Combobox_Topology'].Enabled = False
+
+# Timer that updates the scan progress.
+scan_timer = ui.Timer({"ID": "ScanTimer", "Interval": 100})
+
+
+# Scanning.
+def get_scan_settings() -> tuple[str, int, bool]:
+    """Returns the settings that affect the scan results."""
+
+    return itm['Lineedit_FolderPath'].Text, itm['Combobox_Method'].CurrentIndex, itm['Checkbox_Subfolders'].Checked
+
+
+def update_progress() -> None:
+    """Updates the progress label and the buttons."""
+
+    if not scan:
+        itm['Label_Progress'].Text = ""
+        itm['Button_Import'].Text = "Import"
+        return
+
+    found = "sequences" if scan['settings'][1] == 0 else "images"
+    progress = scan['progress']
+    info = f"{progress['files']} files in {progress['folders']} folders, {len(scan['items'])} {found} found"
+
+    if is_scanning():
+        itm['Label_Progress'].Text = f"Scanning... {info}"
+        itm['Button_Import'].Text = "Scanning..."
+    elif scan['cancel'].is_set():
+        itm['Label_Progress'].Text = f"Scan cancelled. {info}"
+        itm['Button_Import'].Text = "Import"
+    else:
+        itm['Label_Progress'].Text = f"Scan ready. {info}"
+        itm['Button_Import'].Text = "Create Loaders"
+
+
+def reset_scan() -> None:
+    """Cancels the running scan and clears the results."""
+
+    if scan:
+        scan['cancel'].set()
+        scan.clear()
+    scan_timer.Stop()
+    update_progress()
+
+
+def _func(ev):
+    receive_items()
+    if not is_scanning():
+        receive_items()  # Items sent just before the scan finished.
+        scan_timer.Stop()
+    update_progress()
+disp.On.ScanTimer.Timeout = _func
+
+
+def _func(ev):
+    reset_scan()
+dlg.On.Lineedit_FolderPath.TextChanged = _func
+dlg.On.Checkbox_Subfolders.Clicked = _func
+
+
+# Merge topology is used only when merging.
+def _func(ev):
+    itm['Combobox_Topology'].Enabled = itm['Checkbox_Merge'].Checked
+dlg.On.Checkbox_Merge.Clicked = _func
 
 
 # Comboboxes.
 def combo_method_changed(ev):
+    reset_scan()
     selected_index = itm['Combobox_Method'].CurrentIndex
     itm['Spinbox_CustomFrame'].Enabled = (selected_index == 0)
     itm['Combobox_Starting_Frame'].Enabled = (selected_index == 0)
@@ -396,8 +454,18 @@ dlg.On.MyWin.KeyPress = _func
 
 # The window was closed.
 def _func(ev):
+    reset_scan()
     disp.ExitLoop()
 dlg.On.MyWin.Close = _func
+
+
+# Cancel the scan, or close the window if nothing is scanned.
+def _func(ev):
+    if is_scanning():
+        scan['cancel'].set()
+        return
+    reset_scan()
+    disp.ExitLoop()
 dlg.On.Button_Cancel.Clicked = _func
 
 
@@ -409,15 +477,26 @@ def _func(ev):
 dlg.On.Button_Browse.Clicked = _func
 
 
-# Create loaders.
+# Scan the folder, or create loaders when the scan is ready.
 def _func(ev):
+    if is_scanning():
+        return
+
+    # Scan first, loaders are created when the user confirms the results.
+    if not scan or scan['cancel'].is_set() or scan['settings'] != get_scan_settings():
+        dir_path, method, subfolders = get_scan_settings()
+        start_scan(dir_path, method, subfolders)
+        update_progress()
+        scan_timer.Start()
+        return
+
     comp.StartUndo("Create Loaders")
     comp.Lock()  # Put the composition to lock mode, so it won't open dialogs.
 
-    method = itm['Combobox_Method'].CurrentIndex
-    subfolders = itm['Checkbox_Subfolders'].Checked
+    method = scan['settings'][1]
     merge = itm['Checkbox_Merge'].Checked
     select = itm['Checkbox_Select'].Checked
+    topology = merge_network.topologies[itm['Combobox_Topology'].CurrentIndex]
 
     starting_frame_method = itm['Combobox_Starting_Frame'].CurrentText
     custom_frame = itm['Spinbox_CustomFrame'].Value
@@ -426,15 +505,12 @@ def _func(ev):
     if select:
         flow.Select()  # Deselect all tools.
 
-    if method == 0:
-        items = collect_image_sequences(itm['Lineedit_FolderPath'].Text, subfolders)
-    else:
-        items = collect_images(itm['Lineedit_FolderPath'].Text, subfolders)
-
-    create_loaders(method, items, merge, select, starting_frame_method, custom_frame)
+    create_loaders(method, scan['items'], merge, select, starting_frame_method, custom_frame, topology)
 
     comp.Unlock()
     comp.EndUndo(True)
+
+    reset_scan()
 dlg.On.Button_Import.Clicked = _func
 
 
@@ -4,7 +4,7 @@ ar_LoaderFromSaver
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Loader From Saver
-Version: 1.2.1
+Version: 1.3.0
 Description-US: Creates loader(s) from selected saver(s).
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -14,6 +14,7 @@ Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
                    Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Tool
                    
 Changelog:
+1.3.0 (18.10.2026) - Uses shared ar_lib.sequence index to find the sequence and its frame range.
 1.2.1 (13.12.2025) - Bug fix.
 1.2.0 (11.10.2025) - Added support for path mapping (manual).
 1.1.0 (05.04.2025) - Changed the way how the frame range is calculated.
@@ -25,7 +26,15 @@ Changelog:
 # Libraries
 import os
 import re
-from os import listdir
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import sequence
 
 
 # Global variables
@@ -73,18 +82,9 @@ def find_suitable_file(file_name: str, folder_path: str) -> str | None:
     file_name = os.path.splitext(file_name)[0]
     clean_file_name = re.sub(r'\d+$', '', file_name)
 
-    pattern = (
-        r'^'
-        + re.escape(clean_file_name)
-        + r'\d+'
-        + re.escape(extension)
-        + r'$'
-    )
-
-    for file in listdir(folder_path):
-        search = re.match(pattern, file)
-        if search:
-            return os.path.join(folder_path, file)
+    for (prefix, _, ext), found in sequence.scan_directory(folder_path).items():
+        if prefix == clean_file_name and ext == extension:
+            return sequence.sequence_path(found, found['first'])
         
     return None
         
@@ -122,7 +122,7 @@ def loader_from_saver(saver: any) -> any:
         image_sequence_path = find_suitable_file(file_name, folder_name)
 
         loader.SetInput("Clip", image_sequence_path)
-        file_start_frame, file_end_frame = get_frame_range(image_sequence_path)
+        file_start_frame, file_end_frame = sequence.get_frame_range(image_sequence_path)
         file_length = file_end_frame - file_start_frame
 
         # Set loader's ranges from found range data.
@@ -137,35 +137,6 @@ def loader_from_saver(saver: any) -> any:
     return loader
 
 
-def get_frame_range(file_path: str) -> tuple[int, int]:
-    """Returns first and last frame numbers from given image sequence path."""
-
-    clean_path = re.sub(r'(.*?)(\d+)\.[a-zA-Z]+$', r'\1', file_path)
-    file_name = os.path.basename(clean_path)
-    dir_path = os.path.dirname(file_path)
-    extension = os.path.splitext(file_path)[1]
-
-    found = False
-    first_frame = 0
-    last_frame = 0
-
-    file_name_pattern = rf"{re.escape(file_name)}\d+{re.escape(extension)}"
-    digits_pattern = r'\d+(?!.*\d)'
-
-    for file in sorted(os.listdir(dir_path)):
-        match = re.search(file_name_pattern, file)
-
-        if match:
-            frame_number = int(re.search(digits_pattern, file).group())
-            if found == False:
-                first_frame = frame_number
-                found = True
-            else:
-                last_frame = frame_number
-
-    return first_frame, last_frame
-
-
 def main() -> None:
     """The main function."""
 
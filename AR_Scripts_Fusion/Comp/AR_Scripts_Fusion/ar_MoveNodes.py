@@ -4,7 +4,7 @@ ar_MoveNodes
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Move Nodes
-Version: 1.0.1
+Version: 1.1.0
 Description-US: Moves selected node(s).
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -13,11 +13,20 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.1.0 (18.10.2026) - Positions are read once and nodes are moved in one locked batch (ar_lib.layout).
 1.0.1 (07.05.2025) - Added hotkey Ctrl+Q to close the dialog.
 1.0.0 (05.02.2025) - Initial realease.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import layout
 
 
 # Global variables
@@ -48,23 +57,9 @@ def get_key_modifiers(ev: dict) -> list:
 def move_nodes(direction, amount) -> None:
     """Moves selected nodes to wanted direction with given amount."""
 
-    flow = comp.CurrentFrame.FlowView
-    tools = comp.GetToolList(True).values()
-
-    for tool in tools:
-        x, y = flow.GetPosTable(tool).values() # Get node's position
-
-        if direction == "RIGHT":
-            flow.SetPos(tool, x+amount, y)
-
-        if direction == "LEFT":
-            flow.SetPos(tool, x-amount, y)
-
-        if direction == "UP":
-            flow.SetPos(tool, x, y-amount)
-
-        if direction == "DOWN":
-            flow.SetPos(tool, x, y+amount)
+    offsets = {"RIGHT": (amount, 0), "LEFT": (-amount, 0), "UP": (0, -amount), "DOWN": (0, amount)}
+    nodes = layout.get_layout(comp)
+    layout.apply(comp, nodes, layout.move(nodes['positions'], *offsets[direction]))
 
 
 def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
@@ -4,7 +4,7 @@ ar_NoteFromLoader
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Note From Loader
-Version: 1.0.1
+Version: 1.0.2
 Description-US: Creates a sticky note filled with info from the selected loader(s).
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -13,14 +13,22 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.0.2 (18.10.2026) - Uses shared ar_lib.sequence index to get frame range.
 1.0.1 (30.03.2025) - Name fix.
 1.0.0 (25.09.2024) - Initial release.
 """
 # Libraries
-import os
 import re
+import sys
+import inspect
 from pathlib import Path
 
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import sequence
+
 
 # Global variables
 bmd = bmd  # import BlackmagicFusion as bmd
@@ -29,35 +37,6 @@ comp = comp  # comp = fusion.GetCurrentComp()
 
 
 # Functions
-def get_frame_range(file_path: str) -> tuple[int, int]:
-    """Returns first and last frame numbers from given image sequence path."""
-
-    clean_path = re.sub(r'(.*?)(\d+)\.[a-zA-Z]+$', r'\1', file_path)
-    file_name = os.path.basename(clean_path)
-    dir_path = os.path.dirname(file_path)
-    extension = os.path.splitext(file_path)[1]
-
-    found = False
-    first_frame = 0
-    last_frame = 0
-
-    file_name_pattern = rf"{re.escape(file_name)}\d+{re.escape(extension)}"
-    digits_pattern = r'\d+(?!.*\d)'
-
-    for file in sorted(os.listdir(dir_path)):
-        match = re.search(file_name_pattern, file)
-
-        if match:
-            frame_number = int(re.search(digits_pattern, file).group())
-            if found == False:
-                first_frame = frame_number
-                found = True
-            else:
-                last_frame = frame_number
-
-    return first_frame, last_frame
-
-
 def note_from_loader(loader) -> None:
     """Creates sticky note filled with data from loader."""
 
@@ -65,7 +44,7 @@ def note_from_loader(loader) -> None:
     x, y = flow.GetPosTable(loader).values()
     file_path = loader.GetInput("Clip")
 
-    first_frame, last_frame = get_frame_range(file_path)
+    first_frame, last_frame = sequence.get_frame_range(file_path)
     file_name = re.sub(r'\d+$', '', Path(file_path).stem)
 
     global_in = int(loader.GetInput("GlobalIn"))
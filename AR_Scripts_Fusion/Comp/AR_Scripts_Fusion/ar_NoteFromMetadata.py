@@ -4,7 +4,7 @@ ar_NoteFromMetadata
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Note From Metadata
-Version: 1.1.0
+Version: 1.3.0
 Description-US: Creates a sticky note filled with metadata from selected tool(s).
 
 Written for Blackmagic Design Fusion Studio 19.0.3 build 3.
@@ -13,12 +13,23 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.3.0 (18.10.2026) - Timecode is shown with its frame rate and drop frame mode (ar_lib.timecode).
+1.2.0 (18.10.2026) - Metadata is read from the file header when possible (EXR, DPX, QuickTime), instead of rendering the tool.
 1.1.0 (19.09.2025) - Support for macros and group nodes, where Output port is sometimes named as MainOutput1 or Output1.
 1.0.0 (09.11.2024) - Initial release.
 """
 # Libraries
+import sys
+import inspect
 from pathlib import Path
 
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import media_header
+from ar_lib import timecode
+
 
 # Global variables
 bmd = bmd  # import BlackmagicFusion as bmd
@@ -27,6 +38,23 @@ comp = comp  # comp = fusion.GetCurrentComp()
 
 
 # Functions
+def describe_timecode(metadata: dict) -> str | None:
+    """Returns the timecode with its frame rate and drop frame mode, e.g. "01:00:00;00 (29.97 DF)"."""
+
+    time_code = metadata.get("TimeCode")
+    frame_rate = next((value for key, value in metadata.items() if key.lower() in ("framerate", "framespersecond", "fps", "frame_rate")), None)
+    if not isinstance(time_code, str) or frame_rate is None:
+        return None
+
+    try:
+        drop_frame = timecode.parse(time_code)[4]
+        frame_rate = timecode.normalize_rate(frame_rate)
+    except (ValueError, TypeError):
+        return None
+
+    return f"{time_code} ({round(frame_rate, 3):g} {'DF' if drop_frame else 'NDF'})"
+
+
 def note_from_metadata(tool) -> None:
     """Creates sticky note filled with data from tool."""
 
@@ -36,9 +64,12 @@ def note_from_metadata(tool) -> None:
     note_name = "Metadata"
     note_content = ""
 
-    metadata = comp.ActiveTool.GetOutputList()[1][comp.CurrentTime].Metadata
-    
+    metadata = media_header.get_metadata(comp, tool)
+    time_code = describe_timecode(metadata)
+
     for key, value in metadata.items():
+        if key == "TimeCode" and time_code:
+            value = time_code
         note_content += f"{key} = {value}\n"
     
     note = comp.AddTool("Note", x-2, y)
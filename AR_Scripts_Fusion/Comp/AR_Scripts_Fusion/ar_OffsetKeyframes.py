@@ -4,8 +4,8 @@ ar_OffsetKeyframes
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Offset Keyframes
-Version: 1.0.2
-Description-US: Offsets all keyframes of selected tool(s) by given value.\nSupports only BezierPaths!
+Version: 1.1.0
+Description-US: Offsets, scales, reverses or snaps all keyframes of selected tool(s).
 Note: Does not support all kind of keyframes (e.g. Tracker).
 
 Written for Blackmagic Design Fusion Studio 19.0.3 build 3.
@@ -14,12 +14,23 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.1.0 (18.10.2026) - Keyframes of all selected tools are retimed at once, every spline is written with one call.
+                   - Splines connected to many inputs are offset only once, paths (e.g. PolyPath) are supported.
+                   - Added scale (around current frame), reverse and snap to frames.
 1.0.2 (25.09.2025) - Tweaking.
 1.0.1 (07.05.2025) - Added hotkey Ctrl+Q to close the dialog.
 1.0.0 (28.11.2024) - Initial release.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import keyframes
 
 
 # Global variables
@@ -47,28 +58,16 @@ def get_key_modifiers(ev: dict) -> list:
     return key_modifiers
 
 
-def offset_keyframes(tool, offset) -> None:
-    """Offsets all keyframes of the tool by given value."""
-
-    for inp in tool.GetInputList().values():
-        if inp.GetConnectedOutput():
-            data_type = inp.GetAttrs()["INPS_DataType"]
-            if data_type:
-                if data_type != "Image": 
-                    splineout = inp.GetConnectedOutput()
-                    spline = splineout.GetTool()
-                    splinedata = spline.GetKeyFrames()
+def retime_keyframes(operation, *args) -> None:
+    """Retimes all keyframes of the selected tools with the given operation (ar_lib.keyframes)."""
 
-                    if spline.ID == "BezierSpline":
-                        numeric_keys = [k for k in splinedata.keys() if isinstance(k, (int, float))]
-                        first_key = min(numeric_keys)
-                        last_key = max(numeric_keys)
+    keys = keyframes.get_selected_keys(comp)
+    if keys['time'].size == 0:
+        print("No keyframes found from selected tool(s).")
+        return
 
-                    elif spline.ID == "PolyPath":
-                        print("PolyPath found. This script works only with BezierSplines!")
-                        return False
-    
-                    spline.AdjustKeyFrames(first_key, last_key, offset, 0, "offset")
+    keys = operation(keys, *args)
+    keyframes.write_keys(comp, keys)
 
 
 def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
@@ -95,7 +94,7 @@ def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
     return {"width": gui_width, "height": gui_height, "x": gui_x, "y": gui_y}
 
 
-gui_geo = gui_geometry(100, 75, 0.5, 0.5)
+gui_geo = gui_geometry(100, 140, 0.5, 0.5)
 
 
 # GUI
@@ -126,6 +125,15 @@ dlg  = disp.AddWindow({"WindowTitle": "Offset Keyframes",
                 ui.Label({"ID": "Label_Value", "Text": "Value:"}),
                 ui.SpinBox({"ID": "Spinbox_Gap", "Minimum": 1, "Maximum": 1000000, "Value": 1}),
             ]),
+            ui.HGroup([
+                ui.Label({"ID": "Label_Scale", "Text": "Scale:"}),
+                ui.DoubleSpinBox({"ID": "Spinbox_Scale", "Minimum": 0.01, "Maximum": 1000, "Value": 1, "SingleStep": 0.1, "Decimals": 2}),
+                ui.Button({"Text": "Scale", "ID": "Button_Scale", "ToolTip": "Scale around the current frame"}),
+            ]),
+            ui.HGroup([
+                ui.Button({"Text": "Reverse", "ID": "Button_Reverse", "ToolTip": "Reverse keyframes"}),
+                ui.Button({"Text": "Snap", "ID": "Button_Snap", "ToolTip": "Snap keyframes to whole frames"}),
+            ]),
         ]),
     ])
 
@@ -152,26 +160,36 @@ dlg.On.MyWin.KeyPress = _func
 # Buttons are pressed.
 def _func(ev):
     comp.StartUndo("Offset keyframes")
-    tools = comp.GetToolList(True).values()
     value = itm['Spinbox_Gap'].Value
+    if ev['who'] == "Button_Left":
+        value = -value
+
+    retime_keyframes(keyframes.offset_keys, value)
 
-    for tool in tools:
-        offset_keyframes(tool, -value)
-        
     comp.EndUndo(True)
 dlg.On.Button_Left.Clicked = _func
+dlg.On.Button_Right.Clicked = _func
 
 
 def _func(ev):
-    comp.StartUndo("Offset keyframes")
-    tools = comp.GetToolList(True).values()
-    value = itm['Spinbox_Gap'].Value
+    comp.StartUndo("Scale keyframes")
+    retime_keyframes(keyframes.scale_keys, itm['Spinbox_Scale'].Value, comp.CurrentTime)
+    comp.EndUndo(True)
+dlg.On.Button_Scale.Clicked = _func
+
 
-    for tool in tools:
-        offset_keyframes(tool, value)
-        
+def _func(ev):
+    comp.StartUndo("Reverse keyframes")
+    retime_keyframes(keyframes.reverse_keys)
     comp.EndUndo(True)
-dlg.On.Button_Right.Clicked = _func
+dlg.On.Button_Reverse.Clicked = _func
+
+
+def _func(ev):
+    comp.StartUndo("Snap keyframes")
+    retime_keyframes(keyframes.snap_keys)
+    comp.EndUndo(True)
+dlg.On.Button_Snap.Clicked = _func
 
 
 # Open the dialog.
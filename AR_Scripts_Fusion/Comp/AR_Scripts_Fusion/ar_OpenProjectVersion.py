@@ -4,7 +4,7 @@ ar_OpenProjectVersion
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Open Project Version
-Version: 1.0.1
+Version: 1.1.1
 Description-US: Lists all versions of the project. Uses '_v' delimiter.
 
 Written for Blackmagic Design Fusion Studio 20.3.1 build 5.
@@ -13,13 +13,24 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.1.1 (18.10.2026) - The dialog refreshes the index when opened (only changed folders are read), new comps are listed.
+1.1.0 (18.10.2026) - Projects are stored to a persistent index, refresh reads only changed folders.
+                   - The dialog opens from the saved index, versions are kept sorted in the index.
 1.0.1 (30.01.2026) - Added error checking.
 1.0.0 (28.01.2026) - Initial release.
 """
 # Libraries
 import re
+import sys
+import inspect
 from pathlib import Path
 
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import project_index
+
 
 # Global variables
 bmd = bmd  # import BlackmagicFusion as bmd
@@ -40,6 +51,8 @@ def refresh(dir_path: str) -> bool:
     global projects
 
     projects = collect_projects(dir_path)
+    if not projects:
+        return False
     first_project_name = next(iter(projects))
 
     itm = dlg.GetItems()
@@ -50,8 +63,7 @@ def refresh(dir_path: str) -> bool:
 
     itm['Combobox_Project'].CurrentText = first_project_name
 
-    versions = list(projects[first_project_name].keys())
-    versions_sorted = sorted(versions, key=lambda v: int(v[1:]))
+    versions_sorted = list(projects[first_project_name].keys())  # Versions are already sorted.
     for version in versions_sorted:
         itm['Combobox_Version'].AddItem(version)
     itm['Combobox_Version'].CurrentText = versions_sorted[-1]
@@ -63,6 +75,10 @@ def open_the_project(projects: dict, project_name: str, version: str) -> bool:
     """Opens the project."""
 
     project_path = projects[project_name][version]
+    if not Path(project_path).exists():
+        print(f"Project file not found: {project_path}. Please refresh.")
+        return False
+
     fusion.LoadComp(project_path)
 
     return True
@@ -87,8 +103,7 @@ def populate_combobox_version(projects: dict, project_name: str) -> bool:
     itm["Combobox_Version"].Clear()  # Clear old items.
 
     try:
-        versions = list(projects[project_name].keys())
-        versions_sorted = sorted(versions, key=lambda v: int(v[1:]))
+        versions_sorted = list(projects[project_name].keys())  # Versions are already sorted.
         for version in versions_sorted:
             itm['Combobox_Version'].AddItem(version)
 
@@ -113,39 +128,12 @@ def get_key_modifiers(ev: dict) -> list:
     return key_modifiers
 
 
-def collect_projects(dir_path: str) -> list | bool:
-    """Collects all projects from the given folder path."""
-
-    project_dir = Path(dir_path)
-    pattern = re.compile(r"(.+)_v(\d+)\.comp$", re.IGNORECASE)
-    projects = {}
-
-    if dir_path != "":
-
-        for comp_file in project_dir.rglob("*.comp"):
-            match = pattern.match(comp_file.name)
-            if not match:
-                continue
-
-            project_name = match.group(1)
-            version_number = match.group(2)
-
-            version = f"v{version_number}"
-
-            projects.setdefault(project_name, {})[version] = str(comp_file.resolve())
-
+def collect_projects(dir_path: str) -> dict | bool:
+    """Collects all projects from the given folder path.
+    Uses the saved project index, only changed folders are read again."""
 
-        projects_sorted = {
-            project: dict(
-                sorted(
-                    versions.items(),
-                    key=lambda item: int(item[0][1:])
-                )
-            )
-            for project, versions in projects.items()
-        }
-        
-        return projects
+    if str(dir_path) != "":
+        return project_index.get_projects(str(dir_path))
 
     else:
         return False
@@ -233,7 +221,7 @@ if project_path != "":
     match = pattern.match(project_path.stem)
     current_project_name = match.group(1)
     current_project_version = "v"+match.group(2)
-    projects = collect_projects(project_folder)
+    projects = collect_projects(project_folder)  # Incremental refresh, only changed folders are read.
 
 if projects:
     # Add combobox items.
@@ -4,7 +4,7 @@ ar_PrintMetadata
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Print Metadata
-Version: 1.1.0
+Version: 1.2.0
 Description-US: Prints metadata from active tool.
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -13,6 +13,7 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.2.0 (18.10.2026) - Metadata is read from the file header when possible (EXR, DPX, QuickTime), instead of rendering the tool.
 1.1.0 (19.09.2025) - Support for macros and group nodes, where Output port is sometimes named as MainOutput1 or Output1.
 1.0.3 (30.03.2025) - Name fix.
 1.0.2 (06.11.2024) - Changed print to use f-string.
@@ -20,7 +21,15 @@ Changelog:
 1.0.0 (20.10.2023) - Initial release.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import media_header
 
 
 # Global variables
@@ -33,7 +42,7 @@ comp = comp  # comp = fusion.GetCurrentComp()
 def print_metadata() -> None:
     """Prints meta data of the active tool to the console."""
 
-    metadata = comp.ActiveTool.GetOutputList()[1][comp.CurrentTime].Metadata
+    metadata = media_header.get_metadata(comp, comp.ActiveTool)
 
     for key, value in metadata.items():
         print(f"{key} = {value}")
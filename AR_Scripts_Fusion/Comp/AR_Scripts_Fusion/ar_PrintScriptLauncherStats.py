@@ -0,0 +1,79 @@
+"""
+ar_PrintScriptLauncherStats
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Name-US: Print Script Launcher Stats
+Version: 1.1.0
+Description-US: Prints launch statistics of the scripts run from ar_ScriptLauncher, slowest scripts first.
+
+Written for Blackmagic Design Fusion Studio 21.0 beta build 31.
+Python version 3.13.7 (64-bit).
+
+Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
+
+Durations are measured from starting the script to the end of its main() function.
+Scripts with a dialog are listed last without durations, their run time depends on how long
+the dialog was open.
+
+Changelog:
+1.1.0 (18.10.2026) - Scripts with a dialog are left out of the slowest scripts.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import sys
+import inspect
+from pathlib import Path
+from tabulate import tabulate
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import launch_log
+
+
+# Functions
+def format_duration(seconds: float | None) -> str:
+    """Formats duration to readable string."""
+
+    if seconds is None:
+        return "dialog"
+    if seconds < 1.0:
+        return f"{seconds * 1000:.0f} ms"
+    return f"{seconds:.2f} s"
+
+
+def print_stats() -> None:
+    """Prints launch statistics."""
+
+    rows = launch_log.get_report()
+
+    print("")
+    print("Script Launcher Stats:")
+
+    if not rows:
+        print(f"No launches recorded yet ({launch_log.get_log_file()}).")
+        print("")
+        return
+
+    table = []
+    for name, count, p50, p95, last_used in rows:
+        table.append([name, count, format_duration(p50), format_duration(p95), last_used])
+
+    headers = ["Script", "Launches", "p50", "p95", "Last Used"]
+
+    print(tabulate(table, headers=headers, tablefmt="github"))
+
+    print("")
+    print("")
+
+
+def main() -> None:
+    """The main function."""
+
+    print_stats()
+
+
+if __name__ == "__main__":
+    main()
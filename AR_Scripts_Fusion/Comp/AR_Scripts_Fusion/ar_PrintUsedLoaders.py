@@ -4,7 +4,7 @@ ar_PrintUsedLoaders
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Print Used Loaders
-Version: 1.3.1
+Version: 1.4.0
 Description-US: Prints file paths that loaders of the current composition uses.
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -13,6 +13,7 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.4.0 (18.10.2026) - Reads the composition with one snapshot instead of querying every tool.
 1.3.1 (19.09.2025) - Small tweak.
 1.3.0 (16.09.2025) - Prints now using tabulate.
 1.2.1 (04.06.2025) - Small tweak.
@@ -22,8 +23,17 @@ Changelog:
 1.0.0 (19.10.2021) - Initial release.
 """
 # Libraries
+import sys
+import inspect
+from pathlib import Path
 from tabulate import tabulate
 
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import comp_graph
+
 
 # Global variables
 bmd = bmd  # import BlackmagicFusion as bmd
@@ -32,34 +42,34 @@ comp = comp  # comp = fusion.GetCurrentComp()
 
 
 # Functions
-def check_status(tool) -> str:
+def check_status(graph: dict, index: int) -> str:
     """Checks status of the loader."""
 
-    if len(tool.Output.GetConnectedInputs().values()) == 0:
+    if not graph['outputs'][index]:
         return "Not connected"  # Tool is not connected to anything.
-    
-    if (tool.GetAttrs()["TOOLB_PassThrough"] == True):
+
+    if graph['pass_through'][index]:
         return "Disabled"  # Tool is connected but disabled.
     else:
         return "Enabled"  # Tool is enabled and in use.
-    
-    
+
+
 def sort_list(subList) -> list:
     """Sorts list alphabetically."""
 
     return(sorted(subList, key=lambda x: x[1]))
 
 
-def print_used_loaders(loaders) -> None:
+def print_used_loaders(graph: dict, loaders: list[int]) -> None:
     """Prints used loaders."""
 
     loaders_data = {}
 
     for i, loader in enumerate(loaders):
         loaders_data[i] = {
-            "Name": loader.Name,
-            "Path": loader.GetInput("Clip"),
-            "Status": check_status(loader)
+            "Name": graph['names'][loader],
+            "Path": comp_graph.get_clip_path(graph, loader),
+            "Status": check_status(graph, loader)
         }
 
     print("")
@@ -83,11 +93,13 @@ def print_used_loaders(loaders) -> None:
 def main() -> None:
     """The main function."""
 
-    selected_loaders = comp.GetToolList(True, "Loader").values()
+    graph = comp_graph.snapshot(comp)  # Reads the whole composition at once.
+
+    selected_loaders = comp_graph.get_tools(graph, "Loader", selected=True)
     if len(selected_loaders) == 0:
-        print_used_loaders(comp.GetToolList(False, "Loader").values())
+        print_used_loaders(graph, comp_graph.get_tools(graph, "Loader"))
     else:
-        print_used_loaders(selected_loaders)
+        print_used_loaders(graph, selected_loaders)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
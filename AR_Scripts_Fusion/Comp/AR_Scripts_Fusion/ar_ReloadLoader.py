@@ -4,7 +4,7 @@ ar_ReloadLoader
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Reload Loader
-Version: 1.3.0
+Version: 1.3.1
 Description-US: Reloads selected loaders and extends ranges if needed.
 
 Note:   - The script resets trim values!
@@ -16,6 +16,7 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.3.1 (18.10.2026) - Uses shared ar_lib.sequence index to get frame ranges.
 1.3.0 (17.09.2025) - Added support for path mapping (manual).
 1.2.0 (24.05.2025) - Prints useful data to the console.
                    - Hold frame handling.
@@ -24,8 +25,16 @@ Changelog:
 1.0.0 (20.09.2024) - Initial release.
 """
 # Libraries
-import os
 import re
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import sequence
 
 
 # Global variables
@@ -66,35 +75,6 @@ def restore_path_mapping(tool) -> bool:
     return True
 
 
-def get_frame_range(file_path: str) -> tuple[int, int]:
-    """Returns first and last frame numbers from given image sequence path."""
-
-    clean_path = re.sub(r'(.*?)(\d+)\.[a-zA-Z]+$', r'\1', file_path)
-    file_name = os.path.basename(clean_path)
-    dir_path = os.path.dirname(file_path)
-    extension = os.path.splitext(file_path)[1]
-
-    found = False
-    first_frame = 0
-    last_frame = 0
-
-    file_name_pattern = rf"{re.escape(file_name)}\d+{re.escape(extension)}"
-    digits_pattern = r'\d+(?!.*\d)'
-
-    for file in sorted(os.listdir(dir_path)):
-        match = re.search(file_name_pattern, file)
-
-        if match:
-            frame_number = int(re.search(digits_pattern, file).group())
-            if found == False:
-                first_frame = frame_number
-                found = True
-            else:
-                last_frame = frame_number
-
-    return first_frame, last_frame
-
-
 def check_hold_frame(tool) -> bool:
     """Checks if loader is hold frame."""
 
@@ -157,7 +137,7 @@ def reload_loader(loader) -> bool:
     clip_file_path = apply_path_mapping(clip_file_path)
 
     # Get possibly changed start and end frames from file.
-    file_start_frame, file_end_frame = get_frame_range(clip_file_path)
+    file_start_frame, file_end_frame = sequence.get_frame_range(clip_file_path)
     file_length = file_end_frame - file_start_frame + 1
 
     # Check if holdrame
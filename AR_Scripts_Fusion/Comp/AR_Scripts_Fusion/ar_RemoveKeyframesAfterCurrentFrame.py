@@ -4,8 +4,8 @@ ar_RemoveKeyframesAfterCurrentFrame
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Remove Keyframes After Current Frame
-Version: 1.0.0
-Description-US: Removes all keyframes from selected tool(s) after the current frame.\nGlobal End Time is the end frame!
+Version: 1.1.1
+Description-US: Removes all keyframes from selected tool(s) after the current frame.
 
 Written for Blackmagic Design Fusion Studio 19.0.3 build 3.
 Python version 3.10.8 (64-bit).
@@ -13,10 +13,21 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.1.1 (18.10.2026) - If every keyframe of a spline is removed, the spline is removed and the input isn't animated anymore.
+1.1.0 (18.10.2026) - Only existing keyframes are removed (sub-frame keyframes too), each spline is written with one call.
+                   - Removes keyframes also outside of the global range.
 1.0.0 (25.09.2025) - Initial realease.
 """
 # Libraries
-import pprint
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import keyframes
 
 
 # Global variables
@@ -26,20 +37,12 @@ comp = comp  # comp = fusion.GetCurrentComp()
 
 
 # Functions
-def remove_keyframes_after_this_frame(tool) -> None:
+def remove_keyframes_after_this_frame() -> None:
     """Removes all keyframes from selected tool(s) after the current frame."""
 
-    current_frame = comp.CurrentTime
-    for inp in tool.GetInputList().values():
-        if inp.GetConnectedOutput():
-            data_type = inp.GetAttrs()["INPS_DataType"]
-            if data_type:
-                if data_type != "Image":
-                    start = int(current_frame)
-                    end = int(comp.GetAttrs("COMPN_GlobalEnd"))
-                    for i in range(start+1, end+1):
-                        inp[float(i)] = None  # Delete keyframe from current frame.
-                    comp.SetAttrs({"COMPN_CurrentTime": current_frame})  # Restore current frame.
+    keys = keyframes.get_selected_keys(comp)
+    keys = keyframes.remove_keys(keys, keys['time'] > comp.CurrentTime)
+    keyframes.write_keys(comp, keys)
 
 
 def main() -> None:
@@ -48,9 +51,7 @@ def main() -> None:
     comp.Lock()
     comp.StartUndo("Remove keyframes")
 
-    tools = comp.GetToolList(True).values()
-    for tool in tools:
-        remove_keyframes_after_this_frame(tool)
+    remove_keyframes_after_this_frame()
 
     comp.EndUndo(True)
     comp.Unlock()
@@ -4,7 +4,7 @@ ar_ReverseSetup
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Reverse Setup
-Version: 1.2.0
+Version: 1.3.1
 Description-US: Reverses the node setup of the selected tools (basic workflow).
 
 Written for Blackmagic Design Fusion Studio 19.1.3 build 5.
@@ -20,12 +20,22 @@ Supported nodes:
     - Gamut
 
 Changelog:
+1.3.1 (18.10.2026) - Only the selected tools are copied, tool types come from the snapshot.
+1.3.0 (18.10.2026) - Selected tools are read from one composition snapshot and reversed in their flow order.
 1.2.0 (06.04.2025) - Added support for Aces 2.0.0. (WIP!)
 1.1.0 (30.03.2025) - Added more BrightnessContrast parameters.
 1.0.0 (02.03.2025) - Initial release.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import comp_graph
 
 
 # Global variables
@@ -204,12 +214,11 @@ def check_idt_and_odt(idt: str, odt: str, dictionary: dict ) -> bool:
     return True
 
 
-def clone_tool(tool) -> any:
+def clone_tool(tool, tool_id: str, position: tuple[float, float]) -> any:
     """Clones given tool and returns the clone."""
 
-    flow = comp.CurrentFrame.FlowView
-    tool_x, tool_y = flow.GetPosTable(tool).values()
-    clone = comp.AddTool(tool.ID, tool_x + 1, tool_y)
+    tool_x, tool_y = position
+    clone = comp.AddTool(tool_id, tool_x + 1, tool_y)
 
     clone.SetAttrs({"TOOLS_Name": tool.Name})
     clone.TileColor = tool.TileColor
@@ -236,19 +245,26 @@ def set_reverse_bc_expression(source, target) -> float:
 def reverse_color_space_setup() -> None:
     """Clears preview windows, also both A and B buffers."""
 
-    selected_tools = comp.GetToolList(True).values()
-    tools = [(clone_tool(tool), tool) for tool in selected_tools]
+    # Selected tools from upstream to downstream, read from one snapshot of the selection.
+    tools_settings = comp_graph.get_tools_settings(comp, True)
+    graph = comp_graph.build_graph(tools_settings, tools_settings.keys())
+    selected = comp_graph.sort_by_flow(graph, graph['selected'])
+    if not selected:
+        return
+
+    selected_tools = [comp.FindTool(graph['names'][i]) for i in selected]
+    tools = [(clone_tool(tool, graph['ids'][i], comp_graph.get_position(graph, i)), tool, graph['ids'][i]) for i, tool in zip(selected, selected_tools)]
     tools.reverse()
 
-    for target, source in tools:
+    for target, source, source_id in tools:
         now = comp.CurrentTime
 
         # BrightnessContrast.
-        if source.ID == "BrightnessContrast":
+        if source_id == "BrightnessContrast":
             set_reverse_bc_expression(source, target)
 
         # CineonLog.
-        if source.ID == "CineonLog":
+        if source_id == "CineonLog":
             mode = source.GetInput("Mode", now)
             if mode == 0.0:
                 mode = 1.0
@@ -257,7 +273,7 @@ def reverse_color_space_setup() -> None:
             target.SetInput("Mode", mode)
 
         # Gamut.
-        elif source.ID == "GamutConvert":
+        elif source_id == "GamutConvert":
             temp_source = source.GetInput("SourceSpace", now)
             temp_output = source.GetInput("OutputSpace", now)
 
@@ -265,7 +281,7 @@ def reverse_color_space_setup() -> None:
             target.SetInput("OutputSpace", temp_source)
 
         # AcesTransform.
-        elif source.ID == "AcesTransform":
+        elif source_id == "AcesTransform":
             aces_version = source.GetInput("AcesVersion", now)
 
             # Aces 2.0.0
@@ -339,7 +355,7 @@ def reverse_color_space_setup() -> None:
                 target.SetInput("OutputTransform100", new_odt)
 
         # ColorSpaceTransform.
-        elif source.ID == "ColorSpaceTransform":
+        elif source_id == "ColorSpaceTransform":
             temp_input_colorspace = source.GetInput("InputColorSpace", now)
             temp_input_gamma = source.GetInput("InputGamma", now)
             temp_output_colorspace = source.GetInput("OutputColorSpace", now)
@@ -353,8 +369,8 @@ def reverse_color_space_setup() -> None:
     # Connect and select new nodes.
     flow = comp.CurrentFrame.FlowView
     flow.Select()
-    last_original_tool = list(selected_tools)[-1]
-    last_x, last_y = flow.GetPosTable(last_original_tool).values()
+    last_original_tool = selected_tools[-1]
+    last_x, last_y = comp_graph.get_position(graph, selected[-1])
 
     initial_spacing = 4
     spacing = 1
@@ -4,7 +4,7 @@ ar_SetRangeFromMetadata
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Set Range From Metadata
-Version: 1.2.0
+Version: 1.4.0
 Description-US: Sets render range from selected tool's metadata.
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -13,6 +13,8 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.4.0 (18.10.2026) - Start and end frames written as timecode are converted to frames (ar_lib.timecode).
+1.3.0 (18.10.2026) - Metadata is read from the file header when possible (EXR, DPX, QuickTime), instead of rendering the tool.
 1.2.0 (19.09.2025) - Support for macros and group nodes, where Output port is sometimes named as MainOutput1 or Output1.
 1.1.0 (16.09.2025) - Added SHIFT modifier to set also the global range.
 1.0.2 (05.09.2025) - Tweaking.
@@ -20,7 +22,16 @@ Changelog:
 1.0.0 (27.05.2025) - Initial realease.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import media_header
+from ar_lib import timecode
 
 
 # Global variables
@@ -49,6 +60,11 @@ end_keys = ["endframe",
             "last_frame",
             "cfx_endframe"]
 
+rate_keys = ["framerate",
+             "framespersecond",
+             "fps",
+             "frame_rate"]
+
 
 # Functions
 def set_range(start, end) -> None:
@@ -83,11 +99,21 @@ def set_current_time(frame: int) -> None:
     comp.SetAttrs({"COMPN_CurrentTime": frame})
 
 
+def to_frame(value, frame_rate: float | None):
+    """Converts metadata value to a frame number, timecode values are converted with the frame rate."""
+
+    if isinstance(value, str) and timecode.timecode_pattern.match(value):
+        return timecode.to_frames(value, frame_rate) if frame_rate else None
+
+    return value
+
+
 def get_range_from_metadata(tool) -> tuple[int, int]:
-    metadata = comp.ActiveTool.GetOutputList()[1][comp.CurrentTime].Metadata
+    metadata = media_header.get_metadata(comp, tool)
 
     start_frame = None
     end_frame = None
+    frame_rate = None
 
     for key, value in metadata.items():
         try:
@@ -96,10 +122,13 @@ def get_range_from_metadata(tool) -> tuple[int, int]:
 
             if key.lower() in end_keys:
                 end_frame = value
+
+            if key.lower() in rate_keys:
+                frame_rate = timecode.normalize_rate(value)
         except:
             pass
 
-    return start_frame, end_frame
+    return to_frame(start_frame, frame_rate), to_frame(end_frame, frame_rate)
 
 
 def main() -> None:
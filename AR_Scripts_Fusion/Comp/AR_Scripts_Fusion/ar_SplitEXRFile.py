@@ -4,7 +4,7 @@ ar_SplitEXRFile
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Split EXR File
-Version: 1.1.0
+Version: 1.2.1
 Description-US: Splits EXR loader to multiple loaders.
 
 Written for Blackmagic Design Fusion Studio .0.3 build 3.
@@ -13,12 +13,27 @@ Python version 3.13.2 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.2.1 (18.10.2026) - Fixed splitting a loader that has animated inputs.
+1.2.0 (18.10.2026) - Layers and parts are read from the EXR header, the loader doesn't have to be evaluated.
+                   - All loaders are created with a single paste.
 1.1.0 (14.09.2025) - Added support for multi-part files.
 1.0.1 (20.05.2025) - Bug fixes.
 1.0.0 (19.04.2025) - Initial release.
 """
 # Libraries
-from collections import defaultdict
+import re
+import sys
+import copy
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import comp_graph
+from ar_lib import media_header
+from ar_lib import settings
 
 
 # Global variables
@@ -33,89 +48,105 @@ channel_aliases = {
     'a': ['a', 'alpha']
 }
 
+channel_inputs = {
+    'r': "Clip1.OpenEXRFormat.RedName",
+    'g': "Clip1.OpenEXRFormat.GreenName",
+    'b': "Clip1.OpenEXRFormat.BlueName",
+    'a': "Clip1.OpenEXRFormat.AlphaName",
+}
+
+no_channel = "SomethingThatWontMatchHopefully"
+
 
 # Functions
-def split_exr_multipart_file(tool) -> None:
-    """Splits EXR multi-part loader to multiple loaders."""
+def get_layers(channel_names: list[str]) -> dict[str, list[str]]:
+    """Groups channel names (e.g. "diffuse.R") by layer. Channels without a layer are skipped."""
 
-    channels = tool.Clip1.OpenEXRFormat.Part.GetAttrs()['INPIDT_ComboControl_ID'].values()
+    layers = {}
+    for item in channel_names:
+        if '.' in item:
+            name, channel = item.rsplit('.', 1)
+            if channel not in layers.setdefault(name, []):
+                layers[name].append(channel)
 
-    flow = comp.CurrentFrame.FlowView
-    flow.Select()
-    x, y = flow.GetPosTable(tool).values()
+    return layers
 
-    for i, channel in enumerate(channels):
-        current_tool = comp.Loader({"Clip": tool.Clip[comp.CurrentTime]})
-        current_tool.SetInput("Clip1.OpenEXRFormat.Part", channel)
 
-        current_tool.SetAttrs({'TOOLB_NameSet': True, 'TOOLS_Name': channel})
-        flow.SetPos(current_tool, x, y+i+1)
+def get_channel_inputs(layer_name: str, channels: list[str]) -> dict[str, str]:
+    """Returns loader's RGBA channel inputs (input id: channel name) for the layer."""
 
-    flow.SetPos(tool, x, y)
+    normalized_channels = {ch.lower(): ch for ch in channels}
+    inputs = {}
+    for key, input_id in channel_inputs.items():
+        found = next((normalized_channels[alias] for alias in channel_aliases[key] if alias in normalized_channels), None)
+        inputs[input_id] = f"{layer_name}.{found}" if found else no_channel
 
+    return inputs
 
-def split_exr_multilayer_file(tool) -> None:
-    """Splits EXR multi-layer loader to multiple loaders."""
 
-    channels = tool.Clip1.OpenEXRFormat.RedName.GetAttrs()['INPIDT_ComboControl_ID'].values()
-    channels_dict = defaultdict(list)
+def tool_name(name: str, taken: set) -> str:
+    """Returns a valid, unique tool name."""
 
-    for item in channels:
-        if '.' in item:
-            name, channel = item.split('.')
-            if channel not in channels_dict[name]:
-                channels_dict[name].append(channel)
-
-    channels_dict = dict(channels_dict)
-
-    flow = comp.CurrentFrame.FlowView
-    flow.Select()
-    x, y = flow.GetPosTable(tool).values()
-
-    for i, (layer_name, channels) in enumerate(channels_dict.items()):
-        current_tool = comp.Loader({"Clip": tool.Clip[comp.CurrentTime]})
-        current_tool.SetAttrs({'TOOLB_NameSet': True, 'TOOLS_Name': layer_name})
-        flow.SetPos(current_tool, x, y+i+1)
-
-        normalized_channels = {ch.lower(): ch for ch in channels}
-
-        def find_channel_key(possible_keys):
-            for key in possible_keys:
-                if key in normalized_channels:
-                    return normalized_channels[key]
-            return None
-        
-        red_key   = find_channel_key(channel_aliases['r'])
-        green_key = find_channel_key(channel_aliases['g'])
-        blue_key  = find_channel_key(channel_aliases['b'])
-        alpha_key = find_channel_key(channel_aliases['a'])
-
-        red_channel   = f"{layer_name}.{red_key}" if red_key else None
-        green_channel = f"{layer_name}.{green_key}" if green_key else None
-        blue_channel  = f"{layer_name}.{blue_key}" if blue_key else None
-        alpha_channel = f"{layer_name}.{alpha_key}" if alpha_key else None
-
-        if red_channel:
-            current_tool.SetInput("Clip1.OpenEXRFormat.RedName", red_channel)
-        else:
-            current_tool.SetInput("Clip1.OpenEXRFormat.RedName", "SomethingThatWontMatchHopefully")
-
-        if green_channel:
-            current_tool.SetInput("Clip1.OpenEXRFormat.GreenName", green_channel)
-        else:
-            current_tool.SetInput("Clip1.OpenEXRFormat.GreenName", "SomethingThatWontMatchHopefully")
-
-        if blue_channel:
-            current_tool.SetInput("Clip1.OpenEXRFormat.BlueName", blue_channel)
-        else:
-            current_tool.SetInput("Clip1.OpenEXRFormat.BlueName", "SomethingThatWontMatchHopefully")
-
-        if alpha_channel:
-            current_tool.SetInput("Clip1.OpenEXRFormat.AlphaName", alpha_channel)
-        else:
-            current_tool.SetInput("Clip1.OpenEXRFormat.AlphaName", "SomethingThatWontMatchHopefully")
-
-    flow.SetPos(tool, x, y)
+    name = re.sub(r"\W", "_", name) or "Layer"
+    if name[0].isdigit():
+        name = f"_{name}"
+
+    unique = name
+    number = 1
+    while unique in taken:
+        number += 1
+        unique = f"{name}_{number}"
+    taken.add(unique)
+
+    return unique
+
+
+def get_exr_header(tool) -> dict | None:
+    """Reads the EXR header of the loader's current file."""
+
+    found = media_header.get_loader_file(comp, tool, comp.CurrentTime)
+    if found is None:
+        return None
+
+    header = media_header.read_header(found[0])
+    if header is None or header['format'] != "exr":
+        return None
+
+    return header
+
+
+def split_exr_file(tool, header: dict) -> None:
+    """Splits EXR loader to multiple loaders (one per part, or one per layer), created with one paste."""
+
+    copied = comp.CopySettings(tool)['Tools']
+    source = settings.from_settings(copied[tool.Name])  # Copied settings also include the loader's modifiers.
+    tool_type, table = source
+    position = (table.get('ViewInfo') or ("OperatorInfo", {}))[1].get('Pos')
+    x, y = comp_graph.get_array(position, 1, 0), comp_graph.get_array(position, 2, 0)
+
+    parts = header['parts']
+    if len(parts) > 1:
+        # Multi-part file, one loader per part.
+        splits = [(part.get("name", f"Part{i + 1}"), {"Clip1.OpenEXRFormat.Part": part.get("name", "")}) for i, part in enumerate(parts)]
+    else:
+        # Multi-layer file, one loader per layer.
+        channel_names = [channel['name'] for channel in parts[0].get("channels") or []]
+        splits = [(name, get_channel_inputs(name, channels)) for name, channels in get_layers(channel_names).items()]
+
+    taken = set(copied)
+    tools = {}
+    for i, (name, split_inputs) in enumerate(splits):
+        split_table = copy.deepcopy(table)
+        inputs = split_table.setdefault('Inputs', {})
+        for input_id, value in split_inputs.items():
+            inputs[input_id] = settings.make_input(("FuID", {1: value}))
+        split_table['ViewInfo'] = ("OperatorInfo", {"Pos": [x, y + (i + 1) * settings.grid_height]})
+        tools[tool_name(name, taken)] = (tool_type, split_table)
+
+    if tools:
+        flow = comp.CurrentFrame.FlowView
+        flow.Select()
+        comp.Paste(bmd.readstring(settings.build_setting(tools)))
 
 
 def main() -> None:
@@ -124,12 +155,13 @@ def main() -> None:
     comp.StartUndo("Split EXR Channels")
     comp.Lock()
 
-    active_tool = comp.ActiveTool()
+    active_tool = comp.ActiveTool
+    header = get_exr_header(active_tool) if active_tool else None
 
-    if active_tool.Clip1.OpenEXRFormat.Part != None:
-        split_exr_multipart_file(active_tool)
+    if header:
+        split_exr_file(active_tool, header)
     else:
-        split_exr_multilayer_file(active_tool)
+        print("Couldn't read the EXR file.")
 
     comp.Unlock()
     comp.EndUndo(True)
@@ -4,12 +4,14 @@ ar_Trackers(Points)ToGridWarp
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Tracker's Points To GridWarp
-Version: 1.0.0
+Version: 1.1.1
 Description-US: Connects Tracker's points to GridWarp's published points.
 
 How to use: Select the Tracker and the GridWarp tools and run the script.
             Make sure the point count is same in Tracker and GridWarp (published points).
             Tracker point IDs starts from 1 and GridWarp point IDs starts from 0.
+            Hold SHIFT (ar_ScriptLauncher) to bake the points to keyframes over the render range
+            instead of connecting them with expressions.
 
 Note:       Use clean Tracker and clean GridWarp!
             Tracker point count and count of published GridWarp points must be the same!
@@ -21,10 +23,22 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.1.1 (18.10.2026) - Baked splines are pasted with the GridWarp at once, fixed sampling the tracker's outputs.
+1.1.0 (18.10.2026) - Added bake mode (SHIFT), points are sampled once and written as keyframes (ar_lib.bake).
 1.0.0 (02.04.2025) - Initial realease.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+import numpy as np
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import bake
 
 
 # Global variables
@@ -32,17 +46,44 @@ bmd = bmd  # import BlackmagicFusion as bmd
 fusion = fu  # fusion = bmd.scriptapp("Fusion")
 comp = comp  # comp = fusion.GetCurrentComp()
 
+try:
+    key_modifiers = key_modifiers
+except Exception:
+    key_modifiers = None
+
+SHIFT: str = "SHIFT"
+
 
 # Functions
 def assign_tracker_to_gridwarp_points(gridwarp, tracker) -> list:
     """Assigns Tracker's points to GridWarp's published points using current time as a reference frame."""
 
-    gridwarp_inputs = gridwarp.GetInputList().values()
+    for point_num, inp in bake.get_gridwarp_points(gridwarp):
+        inp.SetExpression(f"Point({tracker.Name}.TrackedCenter{point_num+1}.X+{tracker.Name}.XOffset{point_num+1}, {tracker.Name}.TrackedCenter{point_num+1}.Y+{tracker.Name}.YOffset{point_num+1})")
+
+
+def bake_tracker_to_gridwarp_points(gridwarp, tracker) -> None:
+    """Bakes Tracker's points to GridWarp's published points as keyframes over the render range."""
+
+    points = bake.get_gridwarp_points(gridwarp)
+    if not points:
+        return None
+
+    frames = bake.get_frames(comp)
+    numbers = [point_num + 1 for point_num, _ in points]
+
+    # Values of all points and frames, (frames, points, 2).
+    centers = bake.sample([getattr(tracker, f"TrackedCenter{n}") for n in numbers], frames)
+    x_offsets = bake.sample([getattr(tracker, f"XOffset{n}") for n in numbers], frames)
+    y_offsets = bake.sample([getattr(tracker, f"YOffset{n}") for n in numbers], frames)
+    values = centers + np.concatenate([x_offsets, y_offsets], axis=2)
 
-    for inp in gridwarp_inputs:
-        if inp.Name.startswith("Point "):
-            point_num = int(inp.Name.replace("Point ", ""))
-            inp.SetExpression(f"Point({tracker.Name}.TrackedCenter{point_num+1}.X+{tracker.Name}.XOffset{point_num+1}, {tracker.Name}.TrackedCenter{point_num+1}.Y+{tracker.Name}.YOffset{point_num+1})")
+    # Splines of all points and the GridWarp connected to them, pasted at once.
+    splines = {}
+    inputs = {}
+    for i, (point_num, inp) in enumerate(points):
+        inputs[bake.get_input_id(inp)] = bake.add_point(splines, f"{gridwarp.Name}Point{point_num}", frames, values[:, i])
+    bake.replace_tool(comp, bmd, gridwarp, inputs, splines)
 
 
 def main() -> None:
@@ -62,7 +103,13 @@ def main() -> None:
             gridwarp = tool
 
     if tracker is not None and gridwarp is not None:
-        assign_tracker_to_gridwarp_points(gridwarp, tracker)
+        # If SHIFT keyboard modifier pressed, bake to keyframes.
+        if key_modifiers is not None and SHIFT in key_modifiers:
+            comp.Lock()
+            bake_tracker_to_gridwarp_points(gridwarp, tracker)
+            comp.Unlock()
+        else:
+            assign_tracker_to_gridwarp_points(gridwarp, tracker)
 
     comp.EndUndo(True)
 
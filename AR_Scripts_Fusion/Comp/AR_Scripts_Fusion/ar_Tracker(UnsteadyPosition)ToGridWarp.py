@@ -4,10 +4,12 @@ ar_Trackers(UnsteadyPosition)ToGridWarp
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Tracker's Unsteady Position To GridWarp
-Version: 1.0.0
+Version: 1.1.1
 Description-US: Connects Tracker's unsteady position to GridWarp's published points.
 
 How to use: Select the Tracker and the GridWarp tools and run the script.
+            Hold SHIFT (ar_ScriptLauncher) to bake the points to keyframes over the render range
+            instead of connecting them with expressions.
 Note: Use clean Tracker and clean GridWarp!
 
 Written for Blackmagic Design Fusion Studio 19.1.4 build 6.
@@ -16,10 +18,22 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.1.1 (18.10.2026) - Baked splines are pasted with the GridWarp at once, fixed sampling the tracker's outputs.
+1.1.0 (18.10.2026) - Added bake mode (SHIFT), unsteady position is sampled once and points are written as keyframes (ar_lib.bake).
 1.0.0 (02.04.2025) - Initial realease.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+import numpy as np
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import bake
 
 
 # Global variables
@@ -27,6 +41,13 @@ bmd = bmd  # import BlackmagicFusion as bmd
 fusion = fu  # fusion = bmd.scriptapp("Fusion")
 comp = comp  # comp = fusion.GetCurrentComp()
 
+try:
+    key_modifiers = key_modifiers
+except Exception:
+    key_modifiers = None
+
+SHIFT: str = "SHIFT"
+
 
 # Functions
 def assign_tracker_to_gridwarp_points(gridwarp, tracker) -> list:
@@ -40,14 +61,35 @@ def assign_tracker_to_gridwarp_points(gridwarp, tracker) -> list:
     transform_node.SetAttrs({'TOOLS_Name': transform_node_name})
     transform_node.Center.ConnectTo(tracker.UnsteadyPosition)
 
-    gridwarp_inputs = gridwarp.GetInputList().values()
-    
-    for inp in gridwarp_inputs:
-        if inp.Name.startswith("Point "):
-            point_values = gridwarp.GetInput(inp.Name)
-            point_x = point_values[1]
-            point_y = point_values[2]
-            inp.SetExpression(f"Point({point_x}-{unsteady_pos_x}+{transform_node.Name}.Center.X, {point_y}-{unsteady_pos_y}+{transform_node.Name}.Center.Y)")
+    for _, inp in bake.get_gridwarp_points(gridwarp):
+        point_values = gridwarp.GetInput(inp.Name)
+        point_x = point_values[1]
+        point_y = point_values[2]
+        inp.SetExpression(f"Point({point_x}-{unsteady_pos_x}+{transform_node.Name}.Center.X, {point_y}-{unsteady_pos_y}+{transform_node.Name}.Center.Y)")
+
+
+def bake_tracker_to_gridwarp_points(gridwarp, tracker) -> None:
+    """Bakes Tracker's unsteady position to GridWarp's published points as keyframes over the render range,
+    using current time as a reference frame. No Transform tool is needed."""
+
+    points = bake.get_gridwarp_points(gridwarp)
+    if not points:
+        return None
+
+    frames = bake.get_frames(comp)
+    reference = np.array(bake.to_values(tracker.UnsteadyPosition[comp.CurrentTime]))
+    unsteady = bake.sample([tracker.UnsteadyPosition], frames)[:, 0]  # (frames, 2)
+    rest = np.array([bake.to_values(gridwarp.GetInput(inp.Name)) for _, inp in points])  # (points, 2)
+
+    # Rest positions moved with the unsteady position, (frames, points, 2).
+    values = rest[np.newaxis] + (unsteady - reference)[:, np.newaxis]
+
+    # Splines of all points and the GridWarp connected to them, pasted at once.
+    splines = {}
+    inputs = {}
+    for i, (point_num, inp) in enumerate(points):
+        inputs[bake.get_input_id(inp)] = bake.add_point(splines, f"{gridwarp.Name}Point{point_num}", frames, values[:, i])
+    bake.replace_tool(comp, bmd, gridwarp, inputs, splines)
 
 
 def main() -> None:
@@ -67,7 +109,13 @@ def main() -> None:
             gridwarp = tool
 
     if tracker is not None and gridwarp is not None:
-        assign_tracker_to_gridwarp_points(gridwarp, tracker)
+        # If SHIFT keyboard modifier pressed, bake to keyframes.
+        if key_modifiers is not None and SHIFT in key_modifiers:
+            comp.Lock()
+            bake_tracker_to_gridwarp_points(gridwarp, tracker)
+            comp.Unlock()
+        else:
+            assign_tracker_to_gridwarp_points(gridwarp, tracker)
 
     comp.EndUndo(True)
 
@@ -4,8 +4,8 @@ ar_TransformFromTracker
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Transform From Tracker
-Version: 1.1.0
-Description-US: Creates a Transform tool from selected Tracker.
+Version: 1.2.1
+Description-US: Creates a Transform tool from selected Tracker.\nHold SHIFT (ar_ScriptLauncher) to bake the Transform to keyframes over the render range.
 
 Written for Blackmagic Design Fusion Studio 21.0 beta build 31.
 Python version 3.13.7 (64-bit).
@@ -13,11 +13,23 @@ Python version 3.13.7 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.2.1 (18.10.2026) - Baked Transform is pasted with its splines at once, fixed sampling the tracker's outputs.
+1.2.0 (18.10.2026) - Added bake mode (SHIFT), steady values are sampled once and written as keyframes (ar_lib.bake).
+                   - Fixed Pivot expression using Axis X for Y.
 1.1.0 (20.05.2026) - Added custom tool for control the strength.
 1.0.0 (04.05.2026) - Initial realease.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import bake
+from ar_lib import settings
 
 
 # Global variables
@@ -25,6 +37,11 @@ bmd = bmd  # import BlackmagicFusion as bmd
 fusion = fu  # fusion = bmd.scriptapp("Fusion")
 comp = comp  # comp = fusion.GetCurrentComp()
 
+try:
+    key_modifiers = key_modifiers
+except Exception:
+    key_modifiers = None
+
 ALT: str = "ALT"
 CTRL: str = "CTRL"
 SHIFT: str = "SHIFT"
@@ -100,7 +117,7 @@ def tracker_to_transform(tracker_tool) -> None:
 
     # Transform expressions.   
     transform_tool.Center.SetExpression(f"Point({custom_name}.PointIn1.X, {custom_name}.PointIn1.Y)")
-    transform_tool.Pivot.SetExpression(f"Point({custom_name}.PointIn2.X, {custom_name}.PointIn2.X)")
+    transform_tool.Pivot.SetExpression(f"Point({custom_name}.PointIn2.X, {custom_name}.PointIn2.Y)")
     transform_tool.Size.SetExpression(f"{custom_name}.NumberIn1")
     transform_tool.Angle.SetExpression(f"{custom_name}.NumberIn2")
 
@@ -108,6 +125,36 @@ def tracker_to_transform(tracker_tool) -> None:
     transform_tool.SetInput("InvertTransform", 1)
 
 
+def bake_tracker_to_transform(tracker_tool) -> None:
+    """Creates a Transform tool from selected Tracker, with steady values baked to keyframes over the render range."""
+
+    if tracker_tool.ID != "Tracker":
+        print("Please select only a tracker tool!")
+        return False
+
+    flow = comp.CurrentFrame.FlowView
+    x, y = flow.GetPosTable(tracker_tool).values()
+
+    frames = bake.get_frames(comp)
+    points = bake.sample([tracker_tool.SteadyPosition, tracker_tool.SteadyAxis], frames)  # (frames, 2, 2)
+    numbers = bake.sample([tracker_tool.SteadySize, tracker_tool.SteadyAngle], frames)  # (frames, 2, 1)
+
+    # Transform and its splines, pasted at once.
+    name = bake.get_unique_name(f"{tracker_tool.Name}Transform", {tool.Name for tool in comp.GetToolList(False).values()})
+    tools = {}
+    inputs = {
+        "Center": bake.add_point(tools, f"{name}Center", frames, points[:, 0]),
+        "Pivot": bake.add_point(tools, f"{name}Pivot", frames, points[:, 1]),
+        "Size": bake.add_number(tools, f"{name}Size", frames, numbers[:, 0, 0]),
+        "Angle": bake.add_number(tools, f"{name}Angle", frames, numbers[:, 1, 0]),
+        "InvertTransform": settings.make_input(1),
+    }
+    tools[name] = settings.make_tool("Transform", inputs, position=(x+2, y))
+
+    flow.Select()
+    comp.Paste(bmd.readstring(settings.build_setting(tools, name)))
+
+
 def main() -> None:
     """The main function."""
     
@@ -115,7 +162,12 @@ def main() -> None:
     comp.StartUndo("Transform from Tracker")
 
     tool = comp.ActiveTool()
-    tracker_to_transform(tool)
+
+    # If SHIFT keyboard modifier pressed, bake to keyframes.
+    if key_modifiers is not None and SHIFT in key_modifiers:
+        bake_tracker_to_transform(tool)
+    else:
+        tracker_to_transform(tool)
 
     comp.EndUndo(True)
     comp.Unlock()
@@ -4,8 +4,8 @@ ar_TrimLoaderWithTimecode(SMPTE)
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Trim Loader With Timecode (SMPTE)
-Version: 1.0.3
-Description-US: Trims the loader with SMPTE timecode.
+Version: 1.2.0
+Description-US: Trims the loader with SMPTE timecode.\nSupports drop frame timecode (hh:mm:ss;ff) and fractional frame rates (e.g. 23.976, 29.97).
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
 Python version 3.10.8 (64-bit).
@@ -13,13 +13,24 @@ Python version 3.10.8 (64-bit).
 Installation path: Appdata/Roaming/Blackmagic Design/Fusion/Scripts/Comp
 
 Changelog:
+1.2.0 (18.10.2026) - Timecode conversions come from ar_lib.timecode, support for drop frame timecode and fractional frame rates.
+1.1.0 (18.10.2026) - Metadata is read from the file header when possible (EXR, DPX, QuickTime), instead of rendering the tool.
 1.0.3 (08.05.2025) - Added hotkey Ctrl+Q to close the dialog.
 1.0.2 (06.11.2024) - Changed print to use f-string.
 1.0.1 (25.09.2024) - Modified code to follow more PEP 8 recommendations.
 1.0.0 (20.10.2023) - Initial release.
 """
 # Libraries
-...
+import sys
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import media_header
+from ar_lib import timecode
 
 
 # Global variables
@@ -51,14 +62,14 @@ def check_metadata(tool) -> None:
     """Check if tool has timecode metadata."""
 
     metadata = None
-    timecode = None
+    time_code = None
 
     try:
-        timecode = tool.Output[tool.GetAttrs("TOOLNT_Region_Start")[1]].Metadata["TimeCode"]
+        time_code = media_header.get_metadata(comp, tool, tool.GetAttrs("TOOLNT_Region_Start")[1]).get("TimeCode")
     except:
         pass
 
-    if timecode is not None:
+    if time_code is not None:
         metadata = True
     
     return metadata
@@ -67,17 +78,19 @@ def check_metadata(tool) -> None:
 def trim_with_timecode(tool, start, end, fps, lock_global_in) -> None:
     """Trims loader with given timecode values."""
 
-    start_time_code = tool.Output[tool.GetAttrs("TOOLNT_Region_Start")[1]].Metadata["TimeCode"]
-    end_time_code = tool.Output[tool.GetAttrs("TOOLNT_Region_End")[1]].Metadata["TimeCode"]
+    start_time_code = media_header.get_metadata(comp, tool, tool.GetAttrs("TOOLNT_Region_Start")[1])["TimeCode"]
+    end_time_code = media_header.get_metadata(comp, tool, tool.GetAttrs("TOOLNT_Region_End")[1])["TimeCode"]
 
     old_global_in = tool.GlobalIn[1]
     old_global_out = tool.GlobalOut[1]
 
-    old_start_frames = timecode_to_frames(start_time_code, fps)
-    old_end_frames = timecode_to_frames(end_time_code, fps)
+    drop_frame = timecode.parse(start_time_code)[4]  # Given timecodes are read the same way as the loader's timecode.
+
+    old_start_frames = timecode.to_frames(start_time_code, fps, drop_frame)
+    old_end_frames = timecode.to_frames(end_time_code, fps, drop_frame)
 
-    new_start_frames = timecode_to_frames(start, fps)
-    new_end_frames = timecode_to_frames(end, fps)
+    new_start_frames = timecode.to_frames(start, fps, drop_frame)
+    new_end_frames = timecode.to_frames(end, fps, drop_frame)
 
     start_trim = new_start_frames - old_start_frames
     end_trim =  new_end_frames - old_end_frames
@@ -91,71 +104,32 @@ def trim_with_timecode(tool, start, end, fps, lock_global_in) -> None:
         tool.GlobalIn[1] = old_global_in + start_trim
 
 
-def get_frame_rate(tool) -> int:
+def get_frame_rate(metadata: dict) -> float:
     """Gets frame rate from tool's metadata."""
 
-    frame_rate: int = 0
+    frame_rate: float = 0
     search: list = ["framerate", "framespersecond", "fps", "frame_rate"]
 
-    start_time = tool.GetAttrs("TOOLNT_Region_Start")[1]
-    metadata = tool.Output[start_time].Metadata
     for key, value in metadata.items():
         if key.lower() in search:
-            frame_rate = int(value)
+            frame_rate = timecode.normalize_rate(value)
 
     return frame_rate
 
 
-def timecode_to_frames(timecode: str, frame_rate: int) -> int:
-    """Converts timecode (SMPTE) to frames."""
-
-    # Split timecode "hh:mm:ss:ff".
-    hours, minutes, seconds, frames = map(int, timecode.split(":"))
-    
-    # Calculate total amount of frames.
-    total_frames = (
-        hours * 3600 * frame_rate +  # hours in seconds * frame rate.
-        minutes * 60 * frame_rate +  # minutes in seconds * frame rate.
-        seconds * frame_rate +       # seconds * frame rate.
-        frames                       # frames.
-    )
-    
-    return total_frames
-
-
-def frames_to_timecode(frame_number: int, frame_rate: int) -> str:
-    """Converts frames to timecode (SMPTE)."""
-
-    # Calculate hours, minutes, seconds and frames.
-    hours = frame_number // (3600 * frame_rate)
-    frame_number %= 3600 * frame_rate
-    
-    minutes = frame_number // (60 * frame_rate)
-    frame_number %= 60 * frame_rate
-    
-    seconds = frame_number // frame_rate
-    frames = frame_number % frame_rate
-
-    # Format output to SMPTE timecode.
-    timecode = f"{hours:02}:{minutes:02}:{seconds:02}:{frames:02}"
-
-    return timecode
-
-
 def refill_fields(itm, tool) -> None:
     """Refills UI fields with given tool's data."""
 
     start_time = tool.GetAttrs("TOOLNT_Region_Start")[1]
     end_time = tool.GetAttrs("TOOLNT_Region_End")[1]
 
-    start_time_code = tool.Output[start_time].Metadata["TimeCode"]
-    end_time_code = tool.Output[end_time].Metadata["TimeCode"]
+    start_metadata = media_header.get_metadata(comp, tool, start_time)
+    end_metadata = media_header.get_metadata(comp, tool, end_time)
 
     itm["LE_Loader"].Text = tool.Name
-    itm["LE_Start_TC"].Text = start_time_code
-    itm["LE_End_TC"].Text = end_time_code
-    itm["SB_FrameRate"].Value = get_frame_rate(tool)
-
+    itm["LE_Start_TC"].Text = start_metadata["TimeCode"]
+    itm["LE_End_TC"].Text = end_metadata["TimeCode"]
+    itm["SB_FrameRate"].Value = get_frame_rate(start_metadata)
 
 
 def reload(itm) -> None:
@@ -239,7 +213,7 @@ dlg  = disp.AddWindow({"WindowTitle": "Trim loader with TimeCode (SMPTE)",
                 ui.Label({"Text": "End:", "ID": "L_End_TC", "Weight": 0.1}),
                 ui.LineEdit({"ID": "LE_End_TC", "Text": "", "PlaceholderText": "TimeCode (00:00:00:00)", "Weight": 0.6}),
                 ui.Label({"Text": "FPS:", "ID": "L_FrameRate", "Weight": 0.1}),
-                ui.SpinBox({"ID": "SB_FrameRate", "Minimum": 0, "Maximum": 1000000, "Value": 0, "Weight": 0.1}),
+                ui.DoubleSpinBox({"ID": "SB_FrameRate", "Minimum": 0, "Maximum": 1000000, "Value": 0, "Decimals": 3, "Weight": 0.1}),
             ]),
             ui.HGroup([
                 ui.CheckBox({"ID": "CB_LockGlobalIn", "Text": "Lock Global In"}),
@@ -262,16 +236,7 @@ itm = dlg.GetItems()
 # Default values.
 tool = comp.ActiveTool
 if tool:
-    start_time = tool.GetAttrs("TOOLNT_Region_Start")[1]
-    end_time = tool.GetAttrs("TOOLNT_Region_End")[1]
-
-    start_time_code = tool.Output[start_time].Metadata["TimeCode"]
-    end_time_code = tool.Output[end_time].Metadata["TimeCode"]
-
-    itm["LE_Loader"].Text = tool.Name
-    itm["LE_Start_TC"].Text = start_time_code
-    itm["LE_End_TC"].Text = end_time_code
-    itm["SB_FrameRate"].Value = get_frame_rate(tool)
+    refill_fields(itm, tool)
 
 
 # Keys are pressed.
@@ -4,7 +4,7 @@ ar_VersionUp
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Version Up
-Version: 1.4.1
+Version: 1.7.1
 Description-US: Easily change between different versions.
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -15,6 +15,12 @@ Uses v character paired with digits to point out the version number (e.g. v1, v0
 File path syntax example: ../VERSIONS/ProjectName_v001/../../ProjectName_v001_0000.tif
 
 Changelog:
+1.7.1 (18.10.2026) - Versions in the file name are listed regardless of the frame number, probing is used only if the folder can't be listed.
+1.7.0 (18.10.2026) - All selected loaders (or all loaders if nothing is selected) are processed in one pass.
+                   - Changes are planned first and then applied, prints timing per loader.
+1.6.0 (18.10.2026) - Latest version lists existing version folders once and resolves selected loaders in parallel.
+                   - Each loader is updated only once with the newest found version.
+1.5.0 (18.10.2026) - Uses shared ar_lib.sequence index to get frame ranges (directory is scanned once and cached).
 1.4.1 (26.02.2026) - Fixed printed length value.
 1.4.0 (11.09.2025) - Added path mapping support (manual).
 1.3.6 (25.05.2025) - Fixed length value.
@@ -38,6 +44,17 @@ Changelog:
 # Libraries
 import os
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+from pathlib import Path
+
+script_dir = Path(inspect.getfile(lambda: None)).resolve().parent
+if str(script_dir) not in sys.path:
+    sys.path.append(str(script_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import sequence
 
 
 # Global variables
@@ -47,8 +64,14 @@ comp = comp  # comp = fusion.GetCurrentComp()
 
 pattern = r'(?:[^a-zA-Z]|^)v\d{1,4}(?:[^a-zA-Z]|$)'  # Searches v1, v01, v001, v0001 types of versioning.
 tries = 50  # Amount of tries for looking newer or older version number.
+max_workers = 8  # Amount of loaders resolved at the same time.
 path_mappings = {"\\server": "\\\\server"}  # Custom path mappings.
 
+UP: str = "UP"
+DOWN: str = "DOWN"
+LATEST: str = "LATEST"
+CUSTOM: str = "CUSTOM"
+
 ALT: str = "ALT"
 CTRL: str = "CTRL"
 SHIFT: str = "SHIFT"
@@ -117,10 +140,9 @@ def check_file(file_path: str) -> bool:
         return False
     
 
-def check_hold_frame(tool) -> bool:
+def check_hold_frame(settings: dict) -> bool:
     """Checks if loader is hold frame."""
 
-    settings = get_loader_settings(tool)
     duration = settings['TrimOut'] - settings['TrimIn']
     loop = settings['Loop']
 
@@ -147,36 +169,6 @@ def get_current_version(file_path: str) -> int:
             return number
         
 
-def get_frame_range(file_path: str) -> tuple[int, int]:
-    """Returns first and last frame numbers from given image sequence path."""
-
-    clean_path = re.sub(r'(.*?)(\d+)\.[a-zA-Z]+$', r'\1', file_path)
-    file_name = os.path.basename(clean_path)
-    dir_path = os.path.dirname(file_path)
-    extension = os.path.splitext(file_path)[1]
-
-    found = False
-    first_frame = 0
-    last_frame = 0
-
-    file_name_pattern = rf"{re.escape(file_name)}\d+{re.escape(extension)}"
-    digits_pattern = r'\d+(?!.*\d)'
-
-    if os.path.exists(dir_path) and os.path.isdir(dir_path):
-        for file in sorted(os.listdir(dir_path)):
-            match = re.search(file_name_pattern, file)
-
-            if match:
-                frame_number = int(re.search(digits_pattern, file).group())
-                if found == False:
-                    first_frame = frame_number
-                    found = True
-                else:
-                    last_frame = frame_number
-
-    return first_frame, last_frame
-
-
 def replace_frame_number(file_path: str, frame_number: int) -> str:
     """Replaces file paths frame number with given one."""
 
@@ -217,6 +209,99 @@ def update_file_path(file_path: str, position: int) -> str:
     return result_path
 
 
+def list_versions(file_path: str) -> list[int] | None:
+    """Lists existing version numbers of the file path, None if the folder couldn't be listed.
+    Scans only the folder that contains the first versioned part of the path (e.g. VERSIONS folder).
+    If the version is in the file name, the rest of the name (e.g. frame number) can differ, only the extension has to match."""
+
+    path = os.path.normpath(file_path)
+    splitted_path = path.split(os.sep)
+
+    for i, part in enumerate(splitted_path):
+        found = re.search(pattern, part)
+        if found is None:
+            continue
+
+        digits = re.search(r"\d+", found.group())
+        start = found.start() + digits.start()
+        end = found.start() + digits.end()
+        extension = os.path.splitext(part)[1]
+        if i == len(splitted_path) - 1 and len(extension) <= len(part) - end:
+            suffix = r"(?:\D.*)?" + re.escape(extension)
+        else:
+            suffix = re.escape(part[end:])
+        part_pattern = re.compile(re.escape(part[:start]) + r"(\d+)" + suffix)
+        parent_dir = os.sep.join(splitted_path[:i]) or os.sep
+
+        versions = set()
+        try:
+            with os.scandir(parent_dir) as entries:
+                for entry in entries:
+                    match = part_pattern.fullmatch(entry.name)
+                    if match:
+                        versions.add(int(match.group(1)))
+        except OSError:
+            return None
+
+        return sorted(versions)
+
+    return []
+
+
+def resolve_version_path(file_path: str, version: int, hold_frame: bool) -> str | None:
+    """Returns the existing file path of the given version or None."""
+
+    updated_path_version = update_file_path(file_path, version)
+
+    if hold_frame:
+        if check_file(updated_path_version):
+            return updated_path_version
+        return None
+
+    file_first_frame, _ = sequence.get_frame_range(updated_path_version)
+    updated_path_full = replace_frame_number(updated_path_version, file_first_frame)
+    if check_file(updated_path_full):
+        return updated_path_full
+    return None
+
+
+def get_candidate_versions(file_path: str, current_version: int, mode: str, custom_version: int = 0) -> list[int]:
+    """Returns versions to check in priority order."""
+
+    if mode == CUSTOM:
+        return [custom_version]
+
+    listed = list_versions(file_path)
+
+    if mode == DOWN:
+        if listed is None:  # Version folders couldn't be listed, fallback to probing.
+            versions = [v for v in range(current_version - tries, current_version) if v >= 0]
+        else:
+            versions = [v for v in listed if current_version - tries <= v < current_version]
+        return sorted(versions, reverse=True)
+
+    if listed is None:  # Version folders couldn't be listed, fallback to probing.
+        versions = list(range(current_version + 1, current_version + tries + 1))
+    else:
+        versions = [v for v in listed if current_version < v <= current_version + tries]
+
+    if mode == LATEST:
+        return sorted(versions, reverse=True)
+    return sorted(versions)
+
+
+def resolve_version(file_path: str, current_version: int, hold_frame: bool, mode: str, custom_version: int = 0) -> tuple[int, str] | None:
+    """Finds the version to change to and its existing file path.
+    Doesn't touch Fusion, so this can be run in a worker thread."""
+
+    for version in get_candidate_versions(file_path, current_version, mode, custom_version):
+        resolved_path = resolve_version_path(file_path, version, hold_frame)
+        if resolved_path is not None:
+            return version, resolved_path
+
+    return None
+
+
 def get_loader_settings(tool) -> dict:
     """Gets loader's settings."""
 
@@ -255,11 +340,11 @@ def print_data(pd) -> None:
     print(f"\tLength:\t\t\t{(old_len):<5} → {(new_len):<5} ({len_change} F)")
 
 
-def update_loader_settings(tool, settings: dict, path: str, lock_global_in: bool) -> dict:
-    """Updates loader settings by checking if image sequence length has changed."""
+def plan_loader_settings(settings: dict, path: str, lock_global_in: bool) -> tuple[dict, dict]:
+    """Calculates new loader settings by checking if image sequence length has changed."""
 
     # Get possibly changed start and end frames from file (extended or reduced).
-    file_start_frame, file_end_frame = get_frame_range(path)
+    file_start_frame, file_end_frame = sequence.get_frame_range(path)
     file_length = file_end_frame - file_start_frame + 1
 
     # Collect variables.
@@ -267,7 +352,7 @@ def update_loader_settings(tool, settings: dict, path: str, lock_global_in: bool
     old_global_out = settings['GlobalOut']
     clip_hold_last = settings['HoldLast']
     clip_hold_first = settings['HoldFirst']
-    old_start_frame = tool.GetAttrs()['TOOLIT_Clip_StartFrame'][1]
+    old_start_frame = settings['StartFrame']
     old_length = old_global_out - old_global_in
     new_start_frame = file_start_frame
 
@@ -280,12 +365,12 @@ def update_loader_settings(tool, settings: dict, path: str, lock_global_in: bool
     new_global_in = new_start_frame + offset
     new_global_out = file_end_frame + offset + clip_hold_first + clip_hold_last
 
-    # Update settings.
-    tool.SetInput("Clip", path + "")
-    settings['StartFrame'] = file_start_frame
-    settings['GlobalOut'] = new_global_out
-    settings['GlobalIn'] = new_global_in
-    settings['TrimOut'] = file_length-1
+    # New settings.
+    new_settings = dict(settings)
+    new_settings['StartFrame'] = file_start_frame
+    new_settings['GlobalOut'] = new_global_out
+    new_settings['GlobalIn'] = new_global_in
+    new_settings['TrimOut'] = file_length-1
 
     # Collect some data for printing.
     pd = {}
@@ -296,7 +381,7 @@ def update_loader_settings(tool, settings: dict, path: str, lock_global_in: bool
     pd['old_length'] = old_length+1
     pd['new_length'] = file_length
 
-    return settings, pd
+    return new_settings, pd
 
 
 def set_loader_settings(tool, settings: dict) -> bool:
@@ -325,296 +410,156 @@ def refresh_tool(tool) -> None:
     tool.SetAttrs({'TOOLB_PassThrough': current})
 
 
-def version_up_run(lock_global_in: bool) -> bool:
-    """Tries to get one newer version."""
+def get_loaders() -> list:
+    """Returns selected loaders or all loaders if nothing is selected."""
 
-    tools = comp.GetToolList(True, "Loader").values()
-    for tool in tools:
-        loader_name = tool.Name
-        file_path = tool.GetInput("Clip")
+    selected_loaders = list(comp.GetToolList(True, "Loader").values())
+    return selected_loaders or list(comp.GetToolList(False, "Loader").values())
 
-        if not check_path_compatibility(file_path):
-            break
 
-        file_path = apply_path_mapping(file_path)
-        current_version = get_current_version(file_path)
-
-        for i in range(1, tries + 1):
-            version_up = current_version + i
-            updated_path_version = update_file_path(file_path, version_up)
-            file_first_frame, _ = get_frame_range(updated_path_version)
-            updated_path_full = replace_frame_number(updated_path_version, file_first_frame)
-            hold_frame = check_hold_frame(tool)
-
-            if hold_frame:
-                if check_file(updated_path_version) == True:
-                    settings = get_loader_settings(tool)
-                    tool.SetInput("Clip", updated_path_version + "")
-                    set_loader_settings(tool, settings)
-                    refresh_tool(tool)
-                    restore_path_mapping(tool)
-
-                    # Print data to console.
-                    print("")
-                    print(f"{loader_name} - Updated!")
-                    print(f"\tVersion change:\tv{current_version} → v{version_up}")
-                    print(f"\tOld path:\t\t{file_path}")
-                    print(f"\tUpdated path:\t{updated_path_version}")
-                    print("\tHold frame")
-                    print("")
-                    break
-
-            else:
-                if check_file(updated_path_full) == True:
-                    settings = get_loader_settings(tool)
-                    settings, pd = update_loader_settings(tool, settings, updated_path_full, lock_global_in)
-                    set_loader_settings(tool, settings)
-                    refresh_tool(tool)                    
-                    restore_path_mapping(tool)
-
-                    # Print data to console.
-                    print("")
-                    print(f"{loader_name} - Updated!")
-                    print(f"\tVersion change:\tv{current_version} → v{version_up}")
-                    print(f"\tOld path:\t\t{file_path}")
-                    print(f"\tUpdated path:\t{updated_path_full}")
-                    print_data(pd)
-                    print("")
-                    break
+def plan_loader(job: dict, mode: str, custom_version: int, lock_global_in: bool) -> dict:
+    """Resolves the planned change for one loader.
+    Doesn't touch Fusion, so this can be run in a worker thread."""
 
+    start_time = time.perf_counter()
+
+    result = resolve_version(job['file_path'], job['current_version'], job['hold_frame'], mode, custom_version)
+    if result is not None:
+        job['new_version'], job['new_path'] = result
+        if job['hold_frame']:
+            job['new_settings'] = job['settings']
         else:
-            # Print errors to console.
-            print("")
-            print(f"{loader_name} - Newer version not found!")
-            print("")
-            return False
-        
-        return True
-        
+            job['new_settings'], job['pd'] = plan_loader_settings(job['settings'], job['new_path'], lock_global_in)
 
-def version_down_run(lock_global_in: bool) -> bool:
-    """Tries to get one older version."""
+    job['resolve_time'] = time.perf_counter() - start_time
 
-    tools = comp.GetToolList(True, "Loader").values()
+    return job
+
+
+def build_plan(tools: list, mode: str, custom_version: int, lock_global_in: bool) -> list[dict]:
+    """Collects the planned path and range changes of the given loaders."""
+
+    # Collect data from Fusion in the main thread.
+    jobs = []
     for tool in tools:
-        loader_name = tool.Name
         file_path = tool.GetInput("Clip")
 
         if not check_path_compatibility(file_path):
-            break
+            continue
 
         file_path = apply_path_mapping(file_path)
-        current_version = get_current_version(file_path)
-
-        for i in range(1, tries + 1):
-            version_down = current_version - i
-            updated_path_version = update_file_path(file_path, version_down)
-            file_first_frame, _ = get_frame_range(updated_path_version)
-            updated_path_full = replace_frame_number(updated_path_version, file_first_frame)
-            hold_frame = check_hold_frame(tool)
-
-            if hold_frame:
-                if check_file(updated_path_version) == True:
-                    settings = get_loader_settings(tool)
-                    tool.SetInput("Clip", updated_path_version + "")
-                    set_loader_settings(tool, settings)
-                    refresh_tool(tool)
-                    restore_path_mapping(tool)
-
-                    # Print data to console.
-                    print("")
-                    print(f"{loader_name} - Updated!")
-                    print(f"\tVersion change:\tv{current_version} → v{version_down}")
-                    print(f"\tOld path:\t\t{file_path}")
-                    print(f"\tUpdated path:\t{updated_path_version}")
-                    print("\tHold frame")
-                    print("")
-                    break
-
-            else:
-                if check_file(updated_path_full) == True:
-                    settings = get_loader_settings(tool)
-                    settings, pd = update_loader_settings(tool, settings, updated_path_full, lock_global_in)
-                    set_loader_settings(tool, settings)
-                    refresh_tool(tool)
-                    restore_path_mapping(tool)
-
-                    # Print data to console.
-                    print("")
-                    print(f"{loader_name} - Updated!")
-                    print(f"\tVersion change:\tv{current_version} → v{version_down}")
-                    print(f"\tOld path:\t\t{file_path}")
-                    print(f"\tUpdated path:\t{updated_path_full}")
-                    print_data(pd)
-                    print("")
-                    break
+        settings = get_loader_settings(tool)
 
-        else:
-            # Print errors to console.
-            print("")
-            print(f"{loader_name} - Older version not found!")
-            print("")
-            return False
-        
-        return True
-        
+        jobs.append({
+            "tool": tool,
+            "name": tool.Name,
+            "file_path": file_path,
+            "current_version": get_current_version(file_path),
+            "hold_frame": check_hold_frame(settings),
+            "settings": settings,
+            "new_version": None,
+            "new_path": None,
+            "new_settings": None,
+            "pd": None,
+            "resolve_time": 0.0,
+            "apply_time": 0.0,
+        })
 
-def latest_run(lock_global_in: bool) -> None:
-    """Tries to get the newest version."""
+    # Resolve the versions from the disk.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        plan = list(executor.map(lambda job: plan_loader(job, mode, custom_version, lock_global_in), jobs))
 
-    tools = comp.GetToolList(True, "Loader").values()
-    for tool in tools:
-        loader_name = tool.Name
-        file_path = tool.GetInput("Clip")
+    return plan
 
-        if not check_path_compatibility(file_path):
-            break
 
-        file_path = apply_path_mapping(file_path)
-        current_version = get_current_version(file_path)
-
-        found = False
-        last_valid_path = ""
-        last_valid_version = 0
-        pd = {}
-
-        old_settings = get_loader_settings(tool)
-
-        for i in range(1, tries + 1):
-            last_version = current_version + i
-            updated_path_version = update_file_path(file_path, last_version)
-            file_first_frame, _ = get_frame_range(updated_path_version)
-            updated_path_full = replace_frame_number(updated_path_version, file_first_frame)
-            hold_frame = check_hold_frame(tool)
-
-            if hold_frame:
-                if check_file(updated_path_version) == True:
-                    last_valid_path = updated_path_version
-                    last_valid_version = last_version
-
-                    settings = get_loader_settings(tool)
-                    tool.SetInput("Clip", updated_path_version + "")
-                    set_loader_settings(tool, settings)
-                    refresh_tool(tool)
-                    restore_path_mapping(tool)
-
-                    found = True
-
-            else:
-                if check_file(updated_path_full) == True:
-                    last_valid_path = updated_path_full
-                    last_valid_version = last_version
-
-                    settings = get_loader_settings(tool)
-                    settings, pd = update_loader_settings(tool, settings, last_valid_path, lock_global_in)
-                    set_loader_settings(tool, settings)
-                    refresh_tool(tool)
-                    restore_path_mapping(tool)
-                    
-                    found = True
-        
-        if found:
-            refresh_tool(tool)
-
-            if hold_frame:
-                    print("")
-                    print(f"{loader_name} - Updated!")
-                    print(f"\tVersion change:\tv{current_version} → v{last_valid_version}")
-                    print(f"\tOld path:\t\t{file_path}")
-                    print(f"\tUpdated path:\t{last_valid_path}")
-                    print("\tHold frame")
-                    print("")
-
-            else:
-                # Print data to console.
-                pd['old_global_in'] = old_settings['GlobalIn']
-                pd['old_global_out'] = old_settings['GlobalOut']
-                pd['old_length'] = (old_settings['GlobalOut'] - (old_settings['GlobalIn']))+1
-
-                print("")
-                print(f"{loader_name} - Updated!")
-                print(f"\tVersion change:\tv{current_version} → v{last_valid_version}")
-                print(f"\tOld path:\t\t{file_path}")
-                print(f"\tUpdated path:\t{last_valid_path}")
-                print_data(pd)
-                print("")
-
-        else:  # If newer version not found.
+def apply_plan(plan: list[dict]) -> None:
+    """Applies the planned changes. Each loader is updated only once."""
+
+    for change in plan:
+        if change['new_path'] is None:
+            continue
+
+        start_time = time.perf_counter()
+
+        tool = change['tool']
+        tool.SetInput("Clip", change['new_path'] + "")
+        set_loader_settings(tool, change['new_settings'])
+        refresh_tool(tool)
+        restore_path_mapping(tool)
+
+        change['apply_time'] = time.perf_counter() - start_time
+
+
+def print_plan(plan: list[dict], mode: str, custom_version: int, total_time: float) -> None:
+    """Prints the report of the applied plan to the console."""
+
+    not_found = {UP: "Newer version not found!",
+                 DOWN: "Older version not found!",
+                 LATEST: "Newer version not found!",
+                 CUSTOM: f"Given version ({custom_version}) not found!"}
+
+    for change in plan:
+        loader_name = change['name']
+        timing = f"\tTime:\t\t\t{change['resolve_time'] * 1000:.1f} ms (resolve) + {change['apply_time'] * 1000:.1f} ms (apply)"
+
+        print("")
+        if change['new_path'] is None:
             # Print errors to console.
+            print(f"{loader_name} - {not_found[mode]}")
+            print(timing)
             print("")
-            print(f"{loader_name} - Newer version not found!")
-            print("")
+            continue
+
+        print(f"{loader_name} - Updated!")
+        print(f"\tVersion change:\tv{change['current_version']} → v{change['new_version']}")
+        print(f"\tOld path:\t\t{change['file_path']}")
+        print(f"\tUpdated path:\t{change['new_path']}")
+        if change['hold_frame']:
+            print("\tHold frame")
+        else:
+            print_data(change['pd'])
+        print(timing)
+        print("")
 
+    updated = sum(1 for change in plan if change['new_path'] is not None)
+    print(f"VersionUp: {updated}/{len(plan)} loaders updated in {total_time * 1000:.1f} ms.")
 
-def custom_run(custom_version: int, lock_global_in: bool) -> bool:
-    """Tries to get specific version given by user."""
 
-    tools = comp.GetToolList(True, "Loader").values()
-    for tool in tools:
-        pd = {}
-        loader_name = tool.Name
-        file_path = tool.GetInput("Clip")
+def batch_run(mode: str, lock_global_in: bool, custom_version: int = 0) -> bool:
+    """Changes versions of all selected loaders (or all loaders) in one pass."""
 
-        if not check_path_compatibility(file_path):
-            break
+    start_time = time.perf_counter()
 
-        file_path = apply_path_mapping(file_path)
-        current_version = get_current_version(file_path)
-
-        updated_path_version = update_file_path(file_path, custom_version)
-        file_first_frame, _ = get_frame_range(updated_path_version)
-        updated_path_full = replace_frame_number(updated_path_version, file_first_frame)
-        hold_frame = check_hold_frame(tool)
-
-        if hold_frame:
-            if check_file(updated_path_version) == True:
-                settings = get_loader_settings(tool)
-                tool.SetInput("Clip", updated_path_version + "")
-                set_loader_settings(tool, settings)
-                refresh_tool(tool)
-                restore_path_mapping(tool)
-
-                # Print data to console.
-                print("")
-                print(f"{loader_name} - Updated!")
-                print(f"\tVersion change:\tv{current_version} → v{custom_version}")
-                print(f"\tOld path:\t\t{file_path}")
-                print(f"\tUpdated path:\t{updated_path_version}")
-                print("\tHold frame")
-                print("")
-                return True
-
-            else:
-                # Print errors to console.
-                print("")
-                print(f"{loader_name} - Given version ({custom_version}) not found!")
-                print("")
-                return False
+    plan = build_plan(get_loaders(), mode, custom_version, lock_global_in)
+    apply_plan(plan)
 
-        else:
-            if check_file(updated_path_full) == True:
-                settings = get_loader_settings(tool)
-                settings, pd = update_loader_settings(tool, settings, updated_path_full, lock_global_in)
-                set_loader_settings(tool, settings)
-                refresh_tool(tool)
-                restore_path_mapping(tool)
-
-                # Print data to console.
-                print("")
-                print(f"{loader_name} - Updated!")
-                print(f"\tVersion change:\tv{current_version} → v{custom_version}")
-                print(f"\tOld path:\t\t{file_path}")
-                print(f"\tUpdated path:\t{updated_path_full}")
-                print_data(pd)
-                print("")
-                return True
-
-            else:
-                # Print errors to console.
-                print("")
-                print(f"{loader_name} - Given version ({custom_version}) not found!")
-                print("")
-                return False
+    print_plan(plan, mode, custom_version, time.perf_counter() - start_time)
+
+    return any(change['new_path'] is not None for change in plan)
+
+
+def version_up_run(lock_global_in: bool) -> bool:
+    """Tries to get one newer version."""
+
+    return batch_run(UP, lock_global_in)
+
+
+def version_down_run(lock_global_in: bool) -> bool:
+    """Tries to get one older version."""
+
+    return batch_run(DOWN, lock_global_in)
+
+
+def latest_run(lock_global_in: bool) -> bool:
+    """Tries to get the newest version."""
+
+    return batch_run(LATEST, lock_global_in)
+
+
+def custom_run(custom_version: int, lock_global_in: bool) -> bool:
+    """Tries to get specific version given by user."""
+
+    return batch_run(CUSTOM, lock_global_in, custom_version)
 
 
 def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
@@ -0,0 +1,13 @@
+"""
+ar_lib
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Shared modules used by the ar_ scripts. These are not scripts themselves.
+
+Scripts add their own folder to sys.path and import the modules from here, e.g.:
+    from ar_lib import sequence
+
+Changelog:
+1.0.0 (18.10.2026) - Initial release.
+"""
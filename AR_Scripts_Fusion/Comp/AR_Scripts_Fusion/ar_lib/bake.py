@@ -0,0 +1,182 @@
+"""
+ar_lib.bake
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Bakes values to keyframes, replacing live expressions.
+
+Expressions are evaluated by Fusion on every frame of every render. Baking samples the source
+values once over the render range to NumPy arrays (frames, items, dimensions) and the scripts compute
+the results with array math. The splines are built as settings (ar_lib.settings) with their keyframes
+and connections, and pasted with the tools they animate in one comp.Paste() call.
+Points are animated with an XYPath (X and Y splines), numbers with a BezierSpline.
+
+Changelog:
+1.2.0 (18.10.2026) - Splines are pasted as settings (add_number, add_point, replace_tool) instead of
+                   - AddModifier and SetKeyFrames per input. Fixed sampling outputs.
+1.1.0 (18.10.2026) - Added get_gridwarp_points.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import numpy as np
+
+if __package__:
+    from . import settings
+else:
+    import settings
+
+
+# Functions
+def get_frames(comp) -> np.ndarray:
+    """Returns the frames of the render range."""
+
+    attrs = comp.GetAttrs()
+    start = int(attrs['COMPN_RenderStart'])
+    end = int(attrs['COMPN_RenderEnd'])
+
+    return np.arange(start, end + 1, dtype=np.int64)
+
+
+def to_values(value) -> list[float]:
+    """Converts a Fusion value (point table or number) to a list of floats."""
+
+    if isinstance(value, dict):
+        return [float(value.get(1, 0)), float(value.get(2, 0))]
+    if value is None:
+        return [0.0]
+
+    return [float(value)]
+
+
+def sample(sources: list, frames: np.ndarray) -> np.ndarray:
+    """Samples inputs or outputs (anything that can be read with [frame]) at the frames.
+    Returns an array of (frames, sources, dimensions). Inputs that aren't animated or
+    connected are read only once, outputs are always read on every frame."""
+
+    values = None
+    for column, source in enumerate(sources):
+        animated = True
+        if "INPS_ID" in source.GetAttrs():  # Input, outputs have OUTS_ID.
+            animated = source.GetConnectedOutput() is not None or bool(source.GetExpression())
+        if animated:
+            samples = [to_values(source[frame]) for frame in frames.tolist()]
+        else:
+            samples = [to_values(source[int(frames[0])])] * len(frames)
+        if values is None:
+            values = np.zeros((len(frames), len(sources), len(samples[0])), dtype=np.float64)
+        values[:, column, :] = samples
+
+    if values is None:
+        return np.zeros((len(frames), 0, 1), dtype=np.float64)
+
+    return values
+
+
+def key_table(frames: np.ndarray, values: np.ndarray) -> dict:
+    """Returns a BezierSpline KeyFrames table with linear keys."""
+
+    return {frame: {1: value, "Flags": {"Linear": True}} for frame, value in zip(frames.tolist(), values.tolist())}
+
+
+def get_gridwarp_points(gridwarp) -> list:
+    """Returns GridWarp's published points as (point number, input) pairs."""
+
+    points = []
+    for inp in gridwarp.GetInputList().values():
+        if inp.Name.startswith("Point "):
+            points.append((int(inp.Name.replace("Point ", "")), inp))
+
+    return points
+
+
+def get_input_id(inp) -> str:
+    """Returns the input's id."""
+
+    return inp.GetAttrs("INPS_ID")
+
+
+def get_unique_name(name: str, taken: set) -> str:
+    """Returns a tool name that isn't taken yet."""
+
+    unique = name
+    number = 1
+    while unique in taken:
+        number += 1
+        unique = f"{name}_{number}"
+    taken.add(unique)
+
+    return unique
+
+
+def add_number(tools: dict, name: str, frames: np.ndarray, values: np.ndarray) -> tuple[str, dict]:
+    """Adds a BezierSpline keyed at the frames to the tools (tool name: tool).
+    Returns the input connected to it."""
+
+    tools[name] = settings.make_tool("BezierSpline", extra={"KeyFrames": key_table(frames, values)})
+
+    return settings.make_connection(name, "Value")
+
+
+def add_point(tools: dict, name: str, frames: np.ndarray, values: np.ndarray) -> tuple[str, dict]:
+    """Adds an XYPath with X and Y splines keyed at the frames to the tools (tool name: tool). Values are (frames, 2).
+    Returns the input connected to it."""
+
+    inputs = {
+        "X": add_number(tools, f"{name}X", frames, values[:, 0]),
+        "Y": add_number(tools, f"{name}Y", frames, values[:, 1]),
+    }
+    tools[name] = settings.make_tool("XYPath", inputs)
+
+    return settings.make_connection(name, "Value")
+
+
+def get_outputs_by_id(tool) -> dict:
+    """Returns the tool's outputs by id."""
+
+    return {output.GetAttrs("OUTS_ID"): output for output in tool.GetOutputList().values()}
+
+
+def replace_tool(comp, bmd, tool, inputs: dict, tools: dict):
+    """Pastes the tool again with the inputs (input id: input) replaced, together with the tools (e.g. splines
+    from add_point) in one comp.Paste() call. The new tool takes the old one's connections and name.
+    Returns the new tool."""
+
+    name = tool.Name
+    copied = comp.CopySettings(tool)['Tools']  # Copied settings also include the tool's modifiers.
+    taken = {item.Name for item in comp.GetToolList(False).values()} | set(tools)
+    new_name = get_unique_name(f"{name}_baked", taken)
+
+    pasted = {}
+    for copied_name, copied_tool in copied.items():
+        pasted[new_name if copied_name == name else copied_name] = settings.from_settings(copied_tool)
+    tool_type, table = pasted[new_name]
+    table_inputs = table.setdefault('Inputs', {})
+    table_inputs.update(inputs)
+
+    # Inputs connected to tools outside of the paste are connected after the paste.
+    upstream = {}
+    for input_id, item in list(table_inputs.items()):
+        source_name = item[1].get('SourceOp') if isinstance(item, tuple) else None
+        if source_name is not None and source_name not in copied and source_name not in tools:
+            upstream[input_id] = (source_name, item[1].get('Source', "Output"))
+            del table_inputs[input_id]
+    downstream = [(output_id, list((output.GetConnectedInputs() or {}).values())) for output_id, output in get_outputs_by_id(tool).items()]
+
+    pasted.update(tools)
+    comp.CurrentFrame.FlowView.Select()
+    comp.Paste(bmd.readstring(settings.build_setting(pasted)))
+    new_tool = comp.FindTool(new_name)
+
+    for input_id, (source_name, source) in upstream.items():
+        source_tool = comp.FindTool(source_name)
+        if source_tool:
+            new_tool.ConnectInput(input_id, get_outputs_by_id(source_tool).get(source))
+    new_outputs = get_outputs_by_id(new_tool)
+    for output_id, connected in downstream:
+        for inp in connected:
+            inp.ConnectTo(new_outputs.get(output_id))
+
+    tool.Delete()
+    new_tool.SetAttrs({'TOOLS_Name': name})
+
+    return new_tool
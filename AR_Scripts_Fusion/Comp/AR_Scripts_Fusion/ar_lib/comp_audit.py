@@ -0,0 +1,157 @@
+"""
+ar_lib.comp_audit
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Command line tool that audits many composition files at once, without Fusion.
+
+Compositions are read with ar_lib.comp_file in a process pool and the results are printed
+as a table, JSON or CSV. Run it from the folder that has the ar_lib folder:
+
+    python -m ar_lib.comp_audit /path/to/show                   Summary per composition.
+    python -m ar_lib.comp_audit /path/to/show --report loaders  Every loader path (plates).
+    python -m ar_lib.comp_audit /path/to/show --report savers   Every saver path (renders).
+    python -m ar_lib.comp_audit a.comp b.comp --format json     JSON output.
+
+Changelog:
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import os
+import sys
+import csv
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+if __package__:
+    from . import comp_file
+else:
+    import comp_file
+
+
+# Global variables
+SUMMARY: str = "summary"
+LOADERS: str = "loaders"
+SAVERS: str = "savers"
+
+comp_extensions = {".comp"}
+
+
+# Functions
+def find_comps(paths: list[str]) -> list[str]:
+    """Returns composition files from the given files and folders (folders are searched recursively)."""
+
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for file_name in sorted(files):
+                    if os.path.splitext(file_name)[1].lower() in comp_extensions:
+                        found.append(os.path.join(root, file_name))
+        elif os.path.isfile(path):
+            found.append(path)
+
+    return found
+
+
+def analyze_all(comp_paths: list[str], workers: int | None = None) -> list[dict]:
+    """Analyzes the compositions in parallel. Results are in the same order as the paths."""
+
+    if len(comp_paths) < 2 or workers == 1:
+        return [comp_file.analyze(comp_path) for comp_path in comp_paths]
+
+    chunk_size = max(1, len(comp_paths) // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(comp_file.analyze, comp_paths, chunksize=chunk_size))
+
+
+def format_range(frame_range: tuple[int, int] | None) -> str:
+    """Formats frame range to readable string."""
+
+    if frame_range is None:
+        return ""
+    return f"{frame_range[0]}-{frame_range[1]}"
+
+
+def build_rows(summaries: list[dict], report: str) -> tuple[list[str], list[list]]:
+    """Returns headers and rows of the report."""
+
+    if report in (LOADERS, SAVERS):
+        headers = ["Comp", "Version", "Tool", "Status", "Path"]
+        rows = []
+        for summary in summaries:
+            for clip in summary[report]:
+                if not clip['connected']:
+                    status = "Not connected"
+                elif clip['enabled']:
+                    status = "Enabled"
+                else:
+                    status = "Disabled"
+                rows.append([summary['path'], summary['version'], clip['name'], status, clip['path']])
+        return headers, rows
+
+    headers = ["Comp", "Version", "Render Range", "Tools", "Loaders", "Savers", "Error"]
+    rows = []
+    for summary in summaries:
+        rows.append([
+            summary['path'],
+            summary['version'],
+            format_range(summary['render_range']),
+            summary['tools'],
+            len(summary['loaders']),
+            len(summary['savers']),
+            summary['error'] or "",
+        ])
+
+    return headers, rows
+
+
+def print_report(summaries: list[dict], report: str, output_format: str) -> None:
+    """Prints the report in the given format (table, json or csv)."""
+
+    if output_format == "json":
+        print(json.dumps(summaries, indent=2))
+        return
+
+    headers, rows = build_rows(summaries, report)
+
+    if output_format == "csv":
+        writer = csv.writer(sys.stdout)
+        writer.writerow(headers)
+        writer.writerows(rows)
+        return
+
+    try:
+        from tabulate import tabulate
+        print(tabulate(rows, headers=headers, tablefmt="github"))
+    except ImportError:
+        print("\t".join(headers))
+        for row in rows:
+            print("\t".join(str(value) for value in row))
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """The main function."""
+
+    parser = argparse.ArgumentParser(description="Audits Fusion composition files without Fusion.")
+    parser.add_argument("paths", nargs="+", help="Composition files or folders (searched recursively).")
+    parser.add_argument("--report", choices=[SUMMARY, LOADERS, SAVERS], default=SUMMARY, help="What to print.")
+    parser.add_argument("--format", choices=["table", "json", "csv"], default="table", help="Output format.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes (default: CPU count).")
+    args = parser.parse_args(arguments)
+
+    comp_paths = find_comps(args.paths)
+    if not comp_paths:
+        print("No composition files found.", file=sys.stderr)
+        return 1
+
+    summaries = analyze_all(comp_paths, args.workers)
+    print_report(summaries, args.report, args.format)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
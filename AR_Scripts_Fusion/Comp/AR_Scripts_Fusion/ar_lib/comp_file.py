@@ -0,0 +1,368 @@
+"""
+ar_lib.comp_file
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Reads Fusion composition (.comp) and settings (.setting) files without Fusion.
+
+The file is split to tokens with one regular expression and parsed to Python dicts, the same way
+Fusion converts Lua tables for Python: constructors are stored in "__ctor" (e.g. Loader { } ->
+{"__ctor": "Loader", ...}) and array items get 1-based integer keys. Tokens are generated only
+as the parser needs them, and iter_tools() yields tools one by one while parsing, so tools can
+be processed without keeping all tokens or the whole parsed composition (the file text is read
+at once).
+
+Parsed tools work with ar_lib.comp_graph (build_graph) like tools read from a live composition.
+
+Changelog:
+1.0.1 (18.10.2026) - Tokens are streamed to the parser instead of being collected to a list first.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import re
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+if __package__:
+    from . import comp_graph
+else:
+    import comp_graph
+
+
+# Global variables
+token_pattern = re.compile(r"""
+    (?P<space>\s+|--\[(?P<comment_eq>=*)\[.*?\](?P=comment_eq)\]|--[^\n]*)
+  | (?P<long>\[(?P<long_eq>=*)\[(?P<long_text>.*?)\](?P=long_eq)\])
+  | "(?P<double>(?:[^"\\]|\\.)*)"
+  | '(?P<single>(?:[^'\\]|\\.)*)'
+  | (?P<number>-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?))
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<symbol>[{}\[\]=,;()])
+""", re.DOTALL | re.VERBOSE)
+
+escape_pattern = re.compile(r"\\(\d{1,3}|.)", re.DOTALL)
+escapes = {"n": "\n", "t": "\t", "r": "\r", "a": "\a", "b": "\b", "f": "\f", "v": "\v", "\n": "\n"}
+
+version_pattern = re.compile(r"_v(\d+)", re.IGNORECASE)
+
+NAME: str = "name"
+STRING: str = "string"
+NUMBER: str = "number"
+SYMBOL: str = "symbol"
+END: str = "end"
+
+
+# Functions
+def unescape(text: str) -> str:
+    """Converts Lua string escapes to characters."""
+
+    if "\\" not in text:
+        return text
+
+    def replace(match: re.Match) -> str:
+        escape = match.group(1)
+        if escape.isdigit():
+            return chr(int(escape))
+        return escapes.get(escape, escape)
+
+    return escape_pattern.sub(replace, text)
+
+
+def tokenize(text: str) -> Iterator[tuple[str, object]]:
+    """Yields (kind, value) tokens of the Lua text."""
+
+    position = 0
+    length = len(text)
+    while position < length:
+        match = token_pattern.match(text, position)
+        if match is None:
+            raise ValueError(f"Unexpected character {text[position]!r} at position {position}.")
+        position = match.end()
+
+        kind = match.lastgroup
+        if kind in ("space", "comment_eq"):
+            continue
+        if kind in ("long", "long_eq", "long_text"):
+            yield STRING, match.group("long_text").lstrip("\n")
+        elif kind == "double":
+            yield STRING, unescape(match.group("double"))
+        elif kind == "single":
+            yield STRING, unescape(match.group("single"))
+        elif kind == "number":
+            number = match.group("number")
+            if "x" in number.lower():
+                yield NUMBER, int(number, 16)
+            elif "." in number or "e" in number.lower():
+                yield NUMBER, float(number)
+            else:
+                yield NUMBER, int(number)
+        elif kind == "name":
+            yield NAME, match.group("name")
+        else:
+            yield SYMBOL, match.group("symbol")
+
+    yield END, None
+
+
+def make_stream(tokens: Iterator[tuple[str, object]]) -> dict:
+    """Returns a token stream, tokens are taken from the iterator only when they are needed."""
+
+    return {"tokens": tokens, "buffer": deque()}
+
+
+def peek(stream: dict, offset: int = 0) -> tuple[str, object]:
+    """Returns the token at the offset from the current one without consuming it."""
+
+    buffer = stream['buffer']
+    while len(buffer) <= offset:
+        buffer.append(next(stream['tokens'], (END, None)))
+
+    return buffer[offset]
+
+
+def advance(stream: dict) -> tuple[str, object]:
+    """Consumes and returns the current token."""
+
+    token = peek(stream)
+    stream['buffer'].popleft()
+
+    return token
+
+
+def skip_separator(stream: dict) -> None:
+    """Consumes "," or ";" if it's the current token."""
+
+    if peek(stream) in ((SYMBOL, ","), (SYMBOL, ";")):
+        advance(stream)
+
+
+def parse_value(stream: dict) -> object:
+    """Parses a value starting from the current token."""
+
+    kind, value = peek(stream)
+
+    if kind in (STRING, NUMBER):
+        advance(stream)
+        return value
+
+    if kind == SYMBOL and value == "{":
+        return parse_table(stream)
+
+    if kind == NAME:
+        advance(stream)
+        if value == "true":
+            return True
+        if value == "false":
+            return False
+        if value == "nil":
+            return None
+
+        constructor = value
+        if peek(stream) == (SYMBOL, "("):  # E.g. ordered() { }.
+            while advance(stream) != (SYMBOL, ")"):
+                if peek(stream)[0] == END:
+                    raise ValueError("Unexpected end of file.")
+            constructor = None
+        if peek(stream) == (SYMBOL, "{"):
+            table = parse_table(stream)
+            if constructor is not None:
+                table['__ctor'] = constructor
+            return table
+        return constructor  # Bare name.
+
+    raise ValueError(f"Unexpected token {value!r}.")
+
+
+def parse_entry(stream: dict) -> tuple[object, object]:
+    """Parses a table entry. Returns key (None for array items) and value."""
+
+    kind, value = peek(stream)
+
+    if kind == NAME and peek(stream, 1) == (SYMBOL, "="):
+        advance(stream)
+        advance(stream)
+        return value, parse_value(stream)
+
+    if kind == SYMBOL and value == "[":
+        advance(stream)
+        key = parse_value(stream)
+        advance(stream)  # "]".
+        advance(stream)  # "=".
+        return key, parse_value(stream)
+
+    return None, parse_value(stream)
+
+
+def parse_table(stream: dict) -> dict:
+    """Parses a table starting from "{"."""
+
+    table = {}
+    array_index = 1
+    advance(stream)
+
+    while peek(stream) != (SYMBOL, "}"):
+        if peek(stream)[0] == END:
+            raise ValueError("Unexpected end of file.")
+        key, item = parse_entry(stream)
+        if key is None:
+            key = array_index
+            array_index += 1
+        table[key] = item
+        skip_separator(stream)
+
+    advance(stream)
+
+    return table
+
+
+def read_tokens(file_path: str) -> dict:
+    """Reads the file and returns its token stream."""
+
+    text = Path(file_path).read_text(encoding="utf-8", errors="replace")
+
+    return make_stream(tokenize(text))
+
+
+def loads(text: str) -> dict:
+    """Parses Lua table text (e.g. clipboard contents) to a dict."""
+
+    value = parse_value(make_stream(tokenize(text)))
+
+    return value if isinstance(value, dict) else {}
+
+
+def load(file_path: str) -> dict:
+    """Parses the whole composition or settings file."""
+
+    value = parse_value(read_tokens(file_path))
+
+    return value if isinstance(value, dict) else {}
+
+
+def iter_tools(file_path: str, info: dict | None = None) -> Iterator[tuple[str, dict]]:
+    """Yields (tool name, tool settings) from the file's Tools table as they are parsed.
+    Tools inside groups and macros are yielded after their group.
+    info: If given, the composition's other top level values (e.g. RenderRange) are stored there."""
+
+    stream = read_tokens(file_path)
+
+    # Find the top level table, e.g. Composition { or {.
+    while peek(stream)[0] != END and peek(stream) != (SYMBOL, "{"):
+        advance(stream)
+    if peek(stream)[0] == END:
+        raise ValueError("No table found.")
+    advance(stream)
+
+    while peek(stream) != (SYMBOL, "}"):
+        if peek(stream)[0] == END:
+            raise ValueError("Unexpected end of file.")
+        kind, value = peek(stream)
+        if kind == NAME and value == "Tools" and peek(stream, 1) == (SYMBOL, "="):
+            while advance(stream) != (SYMBOL, "{"):  # Skip "Tools =" and ordered().
+                if peek(stream)[0] == END:
+                    raise ValueError("Unexpected end of file.")
+            while peek(stream) != (SYMBOL, "}"):
+                if peek(stream)[0] == END:
+                    raise ValueError("Unexpected end of file.")
+                name, tool_settings = parse_entry(stream)
+                if isinstance(tool_settings, dict):
+                    yield from iter_group(str(name), tool_settings)
+                skip_separator(stream)
+            advance(stream)
+        else:
+            key, item = parse_entry(stream)
+            if info is not None and key is not None:
+                info[key] = item
+
+        skip_separator(stream)
+
+
+def iter_group(name: str, tool_settings: dict) -> Iterator[tuple[str, dict]]:
+    """Yields the tool and the tools inside it (groups and macros)."""
+
+    yield name, tool_settings
+
+    children = tool_settings.get("Tools")
+    if isinstance(children, dict):
+        for child_name, child_settings in children.items():
+            if isinstance(child_settings, dict):
+                yield from iter_group(str(child_name), child_settings)
+
+
+def get_range(info: dict, key: str) -> tuple[int, int] | None:
+    """Returns a frame range (e.g. RenderRange) from the composition info."""
+
+    frame_range = info.get(key)
+    start = comp_graph.get_array(frame_range, 1)
+    end = comp_graph.get_array(frame_range, 2)
+    if start is None or end is None:
+        return None
+
+    return int(start), int(end)
+
+
+def get_version(file_path: str) -> int | None:
+    """Returns the version number from the file name ('_v' delimiter)."""
+
+    found = version_pattern.findall(Path(file_path).stem)
+    if not found:
+        return None
+
+    return int(found[-1])
+
+
+def analyze(file_path: str) -> dict:
+    """Reads the composition and returns its summary:
+        "path", "version", "render_range", "global_range", "tools" (tool count),
+        "tool_ids" (tool type: count), "connections" (connection count),
+        "loaders" and "savers" (lists of {"name", "path", "enabled", "connected"}),
+        "error" (error message if the file couldn't be read)."""
+
+    summary = {
+        "path": str(file_path),
+        "version": get_version(file_path),
+        "render_range": None,
+        "global_range": None,
+        "tools": 0,
+        "tool_ids": {},
+        "connections": 0,
+        "loaders": [],
+        "savers": [],
+        "error": None,
+    }
+
+    info = {}
+    try:
+        tools_settings = dict(iter_tools(file_path, info))
+    except (OSError, ValueError, IndexError) as error:
+        summary['error'] = str(error) or type(error).__name__
+        return summary
+
+    graph = comp_graph.build_graph(tools_settings)
+
+    summary['render_range'] = get_range(info, "RenderRange")
+    summary['global_range'] = get_range(info, "GlobalRange")
+    summary['tools'] = len(graph['names'])
+    summary['connections'] = len(graph['edges'])
+
+    for tool_id in graph['ids']:
+        summary['tool_ids'][tool_id] = summary['tool_ids'].get(tool_id, 0) + 1
+
+    for index in comp_graph.get_tools(graph, "Loader"):
+        summary['loaders'].append({
+            "name": graph['names'][index],
+            "path": comp_graph.get_clip_path(graph, index),
+            "enabled": not graph['pass_through'][index],
+            "connected": bool(graph['outputs'][index]),
+        })
+
+    for index in comp_graph.get_tools(graph, "Saver"):
+        summary['savers'].append({
+            "name": graph['names'][index],
+            "path": comp_graph.get_clip_path(graph, index),
+            "enabled": not graph['pass_through'][index],
+            "connected": comp_graph.get_input_source(graph, index, "Input") is not None,
+        })
+
+    return summary
@@ -0,0 +1,223 @@
+"""
+ar_lib.comp_graph
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: In-memory snapshot of the composition's node graph.
+
+The tools are read with one comp.CopySettings() call (plus one for the selection),
+instead of asking names, positions, attributes and connections tool by tool.
+Scripts run their analysis on the snapshot and use the live API only to write changes
+(comp.FindTool(name) returns the live tool). Graphs can be built also from
+composition files without Fusion (see ar_lib.comp_file).
+
+Graph dictionary (tools are referred by index):
+    "names"        - Tool names.
+    "ids"          - Tool types (e.g. "Loader").
+    "x", "y"       - Flow positions in grid units (same as flow.GetPosTable).
+    "pass_through" - True if the tool is disabled.
+    "selected"     - Indexes of the selected tools.
+    "index"        - Tool name: index.
+    "edges"        - Connections as (source index, target index, input id) tuples.
+    "inputs"       - Per tool, indexes of the edges coming in.
+    "outputs"      - Per tool, indexes of the edges going out.
+    "settings"     - Per tool, the tool's settings table.
+
+Changelog:
+1.2.0 (18.10.2026) - Added snapshot_selection, captures only the selected tools and their direct neighbours.
+1.1.0 (18.10.2026) - Added build_graph, graphs can be built from any tools' settings (e.g. parsed comp files).
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+if __package__:
+    from . import settings as flow_settings
+else:
+    import settings as flow_settings
+
+
+# Functions
+def get_array(table, key: int, default=None):
+    """Returns an item of a Lua array (converted to a dict with 1-based keys, or a list)."""
+
+    if isinstance(table, dict):
+        return table.get(key, table.get(float(key), default))
+    if isinstance(table, (list, tuple)) and 0 < key <= len(table):
+        return table[key - 1]
+    return default
+
+
+def get_tools_settings(comp, selected: bool = False) -> dict:
+    """Returns settings of the tools (tool name: settings) with one call."""
+
+    tools = list(comp.GetToolList(selected).values())
+    if not tools:
+        return {}
+
+    copied = comp.CopySettings(tools) or {}
+
+    return copied.get("Tools") or {}
+
+
+def snapshot(comp) -> dict:
+    """Captures the composition's tools, positions, states and connections."""
+
+    tools_settings = get_tools_settings(comp)
+    selected_names = get_tools_settings(comp, True).keys()
+
+    return build_graph(tools_settings, selected_names)
+
+
+def snapshot_selection(comp) -> dict:
+    """Captures the selected tools and their direct neighbours (tools connected to them), instead of the whole composition."""
+
+    selected = list(comp.GetToolList(True).values())
+    if not selected:
+        return build_graph({})
+
+    tools_settings = dict((comp.CopySettings(selected) or {}).get("Tools") or {})
+
+    # Upstream neighbours are in the copied inputs, downstream ones are asked from the outputs.
+    neighbour_names = set()
+    for tool_settings in tools_settings.values():
+        for input_settings in (tool_settings.get("Inputs") or {}).values():
+            if isinstance(input_settings, dict) and input_settings.get("SourceOp"):
+                neighbour_names.add(input_settings['SourceOp'])
+    neighbours = [tool for tool in (comp.FindTool(name) for name in neighbour_names - tools_settings.keys()) if tool]
+    for tool in selected:
+        for output in tool.GetOutputList().values():
+            for inp in (output.GetConnectedInputs() or {}).values():
+                neighbour = inp.GetTool()
+                if neighbour.Name not in tools_settings and neighbour.Name not in neighbour_names:
+                    neighbour_names.add(neighbour.Name)
+                    neighbours.append(neighbour)
+
+    if neighbours:
+        tools_settings.update((comp.CopySettings(neighbours) or {}).get("Tools") or {})
+
+    return build_graph(tools_settings, [tool.Name for tool in selected])
+
+
+def build_graph(tools_settings: dict, selected_names=()) -> dict:
+    """Builds the graph from tools' settings (tool name: settings), e.g. copied from a composition or read from a file."""
+
+    graph = {
+        "names": [],
+        "ids": [],
+        "x": [],
+        "y": [],
+        "pass_through": [],
+        "selected": [],
+        "index": {},
+        "edges": [],
+        "inputs": [],
+        "outputs": [],
+        "settings": [],
+    }
+
+    for name, tool_settings in tools_settings.items():
+        if not isinstance(tool_settings, dict):
+            continue
+
+        position = (tool_settings.get("ViewInfo") or {}).get("Pos")
+        graph['index'][name] = len(graph['names'])
+        graph['names'].append(name)
+        graph['ids'].append(tool_settings.get("__ctor", ""))
+        graph['x'].append(get_array(position, 1, 0) / flow_settings.grid_width)
+        graph['y'].append(get_array(position, 2, 0) / flow_settings.grid_height)
+        graph['pass_through'].append(bool(tool_settings.get("PassThrough", False)))
+        graph['inputs'].append([])
+        graph['outputs'].append([])
+        graph['settings'].append(tool_settings)
+
+    for target, tool_settings in enumerate(graph['settings']):
+        for input_id, input_settings in (tool_settings.get("Inputs") or {}).items():
+            if not isinstance(input_settings, dict):
+                continue
+            source = graph['index'].get(input_settings.get("SourceOp"))
+            if source is None:
+                continue
+            graph['inputs'][target].append(len(graph['edges']))
+            graph['outputs'][source].append(len(graph['edges']))
+            graph['edges'].append((source, target, input_id))
+
+    graph['selected'] = [graph['index'][name] for name in selected_names if name in graph['index']]
+
+    return graph
+
+
+def get_tools(graph: dict, tool_id: str | None = None, selected: bool = False) -> list[int]:
+    """Returns indexes of the tools, optionally only the given type and/or the selected ones."""
+
+    indexes = graph['selected'] if selected else range(len(graph['names']))
+
+    return [i for i in indexes if tool_id is None or graph['ids'][i] == tool_id]
+
+
+def get_upstream(graph: dict, index: int) -> list[int]:
+    """Returns indexes of the tools connected to the tool's inputs."""
+
+    return [graph['edges'][edge][0] for edge in graph['inputs'][index]]
+
+
+def get_downstream(graph: dict, index: int) -> list[int]:
+    """Returns indexes of the tools connected to the tool's outputs."""
+
+    return [graph['edges'][edge][1] for edge in graph['outputs'][index]]
+
+
+def get_input_source(graph: dict, index: int, input_id: str) -> int | None:
+    """Returns index of the tool connected to the given input, or None."""
+
+    for edge in graph['inputs'][index]:
+        source, _, edge_input = graph['edges'][edge]
+        if edge_input == input_id:
+            return source
+    return None
+
+
+def get_position(graph: dict, index: int) -> tuple[float, float]:
+    """Returns the tool's flow position."""
+
+    return graph['x'][index], graph['y'][index]
+
+
+def get_clip_path(graph: dict, index: int) -> str:
+    """Returns the file path of a Loader or a Saver."""
+
+    tool_settings = graph['settings'][index]
+
+    clip = get_array(tool_settings.get("Clips"), 1)  # Loader.
+    if clip is None:
+        clip_input = (tool_settings.get("Inputs") or {}).get("Clip") or {}  # Saver.
+        clip = clip_input.get("Value") if isinstance(clip_input, dict) else None
+
+    if isinstance(clip, dict):
+        return clip.get("Filename", "")
+    if isinstance(clip, str):
+        return clip
+    return ""
+
+
+def sort_by_flow(graph: dict, indexes: list[int]) -> list[int]:
+    """Sorts the tools from upstream to downstream (by connections between the given tools, then by position)."""
+
+    remaining = set(indexes)
+    incoming = {i: sum(1 for source in get_upstream(graph, i) if source in remaining) for i in indexes}
+    order_key = lambda i: (graph['x'][i], graph['y'][i])
+
+    ordered = []
+    ready = sorted((i for i in indexes if incoming[i] == 0), key=order_key)
+    while ready:
+        index = ready.pop(0)
+        ordered.append(index)
+        remaining.discard(index)
+        for target in get_downstream(graph, index):
+            if target in incoming and target in remaining:
+                incoming[target] -= 1
+                if incoming[target] == 0:
+                    ready.append(target)
+                    ready.sort(key=order_key)
+
+    ordered.extend(sorted(remaining, key=order_key))  # Cycles, shouldn't happen.
+
+    return ordered
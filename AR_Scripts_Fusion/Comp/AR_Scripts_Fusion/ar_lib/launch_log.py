@@ -0,0 +1,185 @@
+"""
+ar_lib.launch_log
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Launch log of the scripts run from ar_ScriptLauncher.
+
+Every launch is appended as one JSON line to a local log file. When the log grows over
+max_log_size it is rotated (launch_log.jsonl → launch_log.1.jsonl ...).
+The log is used to rank search results by frecency (frequency + recency) and
+to print launch statistics (ar_PrintScriptLauncherStats).
+
+Record dictionary:
+    "name"     - Script name.
+    "path"     - Script path.
+    "time"     - Launch time (seconds since epoch).
+    "duration" - Wall-clock time from starting the script to the end of its main() (seconds).
+    "ok"       - False if the script raised an error.
+    "dialog"   - True if the script runs a dialog. The duration includes the time the dialog was open,
+                 so it isn't used in the statistics.
+
+Changelog:
+1.1.0 (18.10.2026) - Launches of dialog scripts are flagged, their durations are left out of the report.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import os
+import json
+import math
+import time
+import threading
+from pathlib import Path
+
+
+# Global variables
+log_folder = Path(os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or Path.home()) / "ar_Scripts_Fusion"
+log_name = "launch_log"
+max_log_size = 512 * 1024  # Bytes, the log is rotated when it grows bigger than this.
+max_log_files = 3  # Amount of rotated log files kept.
+half_life = 14.0  # Days, how fast old launches lose their weight in frecency.
+
+_log_lock = threading.Lock()
+
+
+# Functions
+def get_log_file(number: int = 0) -> Path:
+    """Returns path of the log file. Number 0 is the current log, higher numbers are older logs."""
+
+    if number == 0:
+        return log_folder / f"{log_name}.jsonl"
+    return log_folder / f"{log_name}.{number}.jsonl"
+
+
+def rotate_logs() -> None:
+    """Rotates the log files, the oldest log is removed."""
+
+    oldest = get_log_file(max_log_files)
+    if oldest.exists():
+        oldest.unlink()
+
+    for number in range(max_log_files - 1, -1, -1):
+        log_file = get_log_file(number)
+        if log_file.exists():
+            log_file.replace(get_log_file(number + 1))
+
+
+def record_launch(name: str, path: str, duration: float, ok: bool = True, dialog: bool = False) -> None:
+    """Appends a launch to the log. Logging errors are ignored, they shouldn't stop the scripts."""
+
+    record = {
+        "name": name,
+        "path": str(path),
+        "time": round(time.time(), 3),
+        "duration": round(duration, 6),
+        "ok": ok,
+        "dialog": dialog,
+    }
+
+    try:
+        with _log_lock:
+            log_folder.mkdir(parents=True, exist_ok=True)
+            log_file = get_log_file()
+            if log_file.exists() and log_file.stat().st_size > max_log_size:
+                rotate_logs()
+            with log_file.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+
+def read_records(all_logs: bool = True) -> list[dict]:
+    """Reads launch records, oldest first. If all_logs is False, only the current log is read."""
+
+    records = []
+    for number in range(max_log_files if all_logs else 0, -1, -1):
+        try:
+            with get_log_file(number).open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue  # Skip broken lines.
+        except OSError:
+            continue
+
+    return records
+
+
+def get_stats(records: list[dict] | None = None) -> dict[str, dict]:
+    """Returns launch statistics per script:
+    "count", "last_used", "durations" (sorted, dialog launches left out), "dialog" and "frecency"."""
+
+    if records is None:
+        records = read_records()
+
+    now = time.time()
+    stats: dict[str, dict] = {}
+
+    for record in records:
+        name = record.get("name")
+        if not name:
+            continue
+
+        stat = stats.setdefault(name, {"count": 0, "last_used": 0.0, "durations": [], "dialog": False, "frecency": 0.0})
+        launch_time = record.get("time", 0.0)
+        age = max(now - launch_time, 0.0) / 86400.0
+
+        stat['count'] += 1
+        stat['last_used'] = max(stat['last_used'], launch_time)
+        stat['frecency'] += 0.5 ** (age / half_life)
+        stat['dialog'] = record.get("dialog", False)  # The latest launch tells if the script has a dialog now.
+        if record.get("ok", True) and not stat['dialog'] and "duration" in record:
+            stat['durations'].append(record['duration'])
+
+    for stat in stats.values():
+        stat['durations'].sort()
+
+    return stats
+
+
+def get_frecency(stats: dict[str, dict] | None = None) -> dict[str, float]:
+    """Returns frecency per script normalized to 0-1 range."""
+
+    if stats is None:
+        stats = get_stats()
+
+    highest = max((stat['frecency'] for stat in stats.values()), default=0.0)
+    if highest <= 0:
+        return {}
+
+    return {name: stat['frecency'] / highest for name, stat in stats.items()}
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Returns percentile from sorted values (linear interpolation)."""
+
+    if not values:
+        return 0.0
+
+    position = (len(values) - 1) * percent / 100.0
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return values[lower]
+
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def get_report(stats: dict[str, dict] | None = None) -> list[list]:
+    """Returns report rows [name, launches, p50, p95, last used], slowest scripts first (by p95).
+    Scripts with a dialog have None as p50 and p95 and are listed last."""
+
+    if stats is None:
+        stats = get_stats()
+
+    rows = []
+    for name, stat in stats.items():
+        p50 = None if stat['dialog'] else percentile(stat['durations'], 50)
+        p95 = None if stat['dialog'] else percentile(stat['durations'], 95)
+        last_used = time.strftime("%d.%m.%Y %H:%M", time.localtime(stat['last_used']))
+        rows.append([name, stat['count'], p50, p95, last_used])
+
+    rows.sort(key=lambda row: -1.0 if row[3] is None else row[3], reverse=True)
+
+    return rows
@@ -0,0 +1,277 @@
+"""
+ar_lib.layout
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Node layout engine.
+
+Positions of the selected nodes are read once (one comp.CopySettings call) to a NumPy array.
+Align, flip, rotate, distribute, move and grid snap are computed on the array, and only the
+nodes that actually move are written back, queued to the flow and flushed at once while
+the composition is locked.
+
+Layout dictionary:
+    "names"     - Node names.
+    "positions" - Flow positions (grid units) as an (n, 2) array.
+    "pivot"     - Active tool's position, or None if the active tool is not selected.
+
+Changelog:
+1.1.0 (18.10.2026) - The benchmark counts the real API calls (count_calls) of both methods, per operation.
+1.0.1 (18.10.2026) - Removed estimated API call counts, the benchmark compares time only.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+if __package__:
+    from . import comp_graph
+    from . import settings as flow_settings
+else:
+    import comp_graph
+    import settings as flow_settings
+
+
+# Global variables
+LEFT: str = "LEFT"
+RIGHT: str = "RIGHT"
+UP: str = "UP"
+DOWN: str = "DOWN"
+HORIZONTAL: str = "HORIZONTAL"
+VERTICAL: str = "VERTICAL"
+
+counted_methods = {
+    "comp": ("GetToolList", "CopySettings", "FindTool", "Lock", "Unlock"),
+    "flow": ("GetPosTable", "SetPos", "QueueSetPos", "FlushSetPosQueue"),
+}
+
+
+# Functions
+def get_layout(comp) -> dict:
+    """Reads positions of the selected nodes."""
+
+    tools_settings = comp_graph.get_tools_settings(comp, True)  # GetToolList + CopySettings.
+    graph = comp_graph.build_graph(tools_settings, tools_settings.keys())
+    nodes = [i for i in graph['selected'] if "ViewInfo" in graph['settings'][i]]  # Skip modifiers.
+
+    pivot = None
+    active_tool = comp.ActiveTool
+    if active_tool:
+        index = graph['index'].get(active_tool.Name)
+        if index is not None:
+            pivot = comp_graph.get_position(graph, index)
+
+    return {
+        "names": [graph['names'][i] for i in nodes],
+        "positions": np.array([comp_graph.get_position(graph, i) for i in nodes], dtype=np.float64).reshape(-1, 2),
+        "pivot": pivot,
+    }
+
+
+def get_center(positions: np.ndarray, pivot: tuple[float, float] | None = None) -> np.ndarray:
+    """Returns the pivot, or the center of the positions' bounding box."""
+
+    if pivot is not None:
+        return np.asarray(pivot, dtype=np.float64)
+
+    return (positions.min(axis=0) + positions.max(axis=0)) / 2
+
+
+def align(positions: np.ndarray, direction: str, gap: float, origin: tuple[float, float] | None = None) -> np.ndarray:
+    """Lines the nodes up to the direction, gap apart, keeping their order.
+    The line starts from the origin, or from the outermost node against the direction."""
+
+    if positions.size == 0:
+        return positions
+
+    axis = 0 if direction in (LEFT, RIGHT) else 1
+    sign = 1 if direction in (RIGHT, DOWN) else -1
+    order = np.argsort(positions[:, axis] * sign, kind="stable")
+    first = positions[order[0]]
+    start = first if origin is None else np.asarray(origin, dtype=np.float64)
+
+    aligned = np.empty_like(positions)
+    aligned[order, axis] = start[axis] + sign * gap * np.arange(len(order))
+    aligned[:, 1 - axis] = first[1 - axis]
+
+    return aligned
+
+
+def flip(positions: np.ndarray, axis: str, pivot: tuple[float, float] | None = None) -> np.ndarray:
+    """Mirrors the nodes horizontally or vertically around the pivot (or the center)."""
+
+    if positions.size == 0:
+        return positions
+
+    column = 0 if axis == HORIZONTAL else 1
+    flipped = positions.copy()
+    flipped[:, column] = 2 * get_center(positions, pivot)[column] - positions[:, column]
+
+    return flipped
+
+
+def rotate(positions: np.ndarray, angle: float, pivot: tuple[float, float] | None = None) -> np.ndarray:
+    """Rotates the nodes by the angle (degrees, clockwise in the flow) around the pivot (or the average position)."""
+
+    if positions.size == 0:
+        return positions
+
+    center = positions.mean(axis=0) if pivot is None else np.asarray(pivot, dtype=np.float64)
+    radians = np.radians(angle)
+    cos, sin = np.cos(radians), np.sin(radians)
+    matrix = np.array([[cos, sin], [-sin, cos]])
+
+    return (positions - center) @ matrix + center
+
+
+def distribute(positions: np.ndarray, axis: str) -> np.ndarray:
+    """Spaces the nodes evenly between the outermost ones, keeping their order."""
+
+    if len(positions) < 3:
+        return positions
+
+    column = 0 if axis == HORIZONTAL else 1
+    order = np.argsort(positions[:, column], kind="stable")
+    distributed = positions.copy()
+    distributed[order, column] = np.linspace(positions[order[0], column], positions[order[-1], column], len(order))
+
+    return distributed
+
+
+def move(positions: np.ndarray, x: float, y: float) -> np.ndarray:
+    """Moves the nodes by the given amount."""
+
+    return positions + np.array([x, y], dtype=np.float64)
+
+
+def snap(positions: np.ndarray, step: float = 1.0) -> np.ndarray:
+    """Snaps the nodes to the grid (step in grid units)."""
+
+    return np.round(positions / step) * step
+
+
+def apply(comp, layout: dict, positions: np.ndarray) -> int:
+    """Moves the nodes to the new positions. Only moved nodes are written, in one locked batch.
+    Returns the number of moved nodes."""
+
+    moved = np.flatnonzero(np.any(np.abs(positions - layout['positions']) > 1e-6, axis=1))
+    if moved.size == 0:
+        return 0
+
+    flow = comp.CurrentFrame.FlowView
+    comp.Lock()
+    for i, (x, y) in zip(moved.tolist(), positions[moved].tolist()):
+        tool = comp.FindTool(layout['names'][i])
+        if tool:
+            flow.QueueSetPos(tool, x, y)
+    flow.FlushSetPosQueue()
+    comp.Unlock()
+
+    layout['positions'] = positions
+
+    return int(moved.size)
+
+
+def counted(function, name: str, counts: dict):
+    """Returns the function wrapped to count its calls to counts (name: calls)."""
+
+    def call(*args, **kwargs):
+        counts[name] = counts.get(name, 0) + 1
+        return function(*args, **kwargs)
+
+    return call
+
+
+def count_calls(comp, counts: dict) -> SimpleNamespace:
+    """Returns a stand-in for the composition that counts the calls (method name: calls) made to the composition
+    and its flow view through it. Has the members the layout functions use."""
+
+    flow = comp.CurrentFrame.FlowView
+    flow_calls = {name: counted(getattr(flow, name), name, counts) for name in counted_methods['flow']}
+    comp_calls = {name: counted(getattr(comp, name), name, counts) for name in counted_methods['comp']}
+
+    return SimpleNamespace(
+        ActiveTool=comp.ActiveTool,
+        CurrentFrame=SimpleNamespace(FlowView=SimpleNamespace(**flow_calls)),
+        **comp_calls,
+    )
+
+
+def apply_per_node(comp, operation) -> None:
+    """Moves the selected nodes the per node way: GetPosTable and SetPos for every node."""
+
+    flow = comp.CurrentFrame.FlowView
+    tools = list(comp.GetToolList(True).values())
+    positions = np.array([list(flow.GetPosTable(tool).values()) for tool in tools], dtype=np.float64).reshape(-1, 2)
+    for tool, (x, y) in zip(tools, operation(positions).tolist()):
+        flow.SetPos(tool, x, y)
+
+
+def apply_batched(comp, operation) -> None:
+    """Moves the selected nodes with the layout engine."""
+
+    layout = get_layout(comp)
+    apply(comp, layout, operation(layout['positions']))
+
+
+def benchmark(comp, bmd, count: int = 1000) -> list[list]:
+    """Compares the per node method (GetPosTable and SetPos per node) with the layout engine for every operation,
+    on a column of Background tools. The calls are counted with count_calls(). The tools are removed afterwards.
+    Returns [operation, method, time, calls (method name: calls)] rows."""
+
+    names = [f"BenchmarkLayout{i + 1}" for i in range(count)]
+    tools = {name: flow_settings.make_tool("Background", {}, position=(i % 7, i)) for i, name in enumerate(names)}
+    comp.Paste(bmd.readstring(flow_settings.build_setting(tools)))  # Pasted tools are selected.
+    original = get_layout(comp)['positions']
+
+    operations = (
+        ("Align", lambda p: align(p, DOWN, 1)),
+        ("Flip", lambda p: flip(p, HORIZONTAL)),
+        ("Rotate", lambda p: rotate(p, 90)),
+        ("Distribute", lambda p: distribute(p, VERTICAL)),
+        ("Move", lambda p: move(p, 1, 0)),
+        ("Snap", lambda p: snap(p * 1.5)),
+    )
+
+    rows = []
+    for operation_name, operation in operations:
+        for method, function in (("Per node", apply_per_node), ("Layout engine", apply_batched)):
+            apply(comp, get_layout(comp), original)  # Same start for both methods.
+            counts = {}
+            start_time = time.perf_counter()
+            function(count_calls(comp, counts), operation)
+            rows.append([operation_name, method, time.perf_counter() - start_time, counts])
+
+    for name in names:
+        tool = comp.FindTool(name)
+        if tool:
+            tool.Delete()
+
+    print("")
+    print(f"Layout Benchmark ({count} nodes):")
+    print(f"{'Operation':<12}{'Method':<16}{'Time (ms)':>12}{'Calls':>8}  Calls per method")
+    for operation_name, method, duration, counts in rows:
+        calls = ", ".join(f"{name} {number}" for name, number in counts.items())
+        print(f"{operation_name:<12}{method:<16}{duration * 1000:>12.1f}{sum(counts.values()):>8}  {calls}")
+    print("")
+
+    return rows
+
+
+if __name__ == "__main__":
+    # Layout math only (reading and writing needs Fusion, see benchmark()).
+    rng = np.random.default_rng(0)
+    positions = rng.integers(-500, 500, size=(100000, 2)).astype(np.float64)
+
+    for name, operation in (
+        ("align", lambda p: align(p, RIGHT, 1)),
+        ("flip", lambda p: flip(p, HORIZONTAL)),
+        ("rotate", lambda p: rotate(p, 90)),
+        ("distribute", lambda p: distribute(p, VERTICAL)),
+        ("snap", lambda p: snap(p + 0.4)),
+    ):
+        start_time = time.perf_counter()
+        operation(positions)
+        print(f"{name:<12}{len(positions)} nodes: {(time.perf_counter() - start_time) * 1000:.1f} ms")
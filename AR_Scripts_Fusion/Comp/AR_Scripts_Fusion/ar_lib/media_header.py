@@ -0,0 +1,503 @@
+"""
+ar_lib.media_header
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Reads timecode, frame rate and metadata from media file headers without decoding pixels.
+
+Reading tool.Output[frame].Metadata makes Fusion evaluate the tool at that frame, which can take
+seconds with big images or deep node trees. Supported files are read straight from the disk instead:
+OpenEXR (memory-mapped attribute table, multi-part too), DPX (file, film and TV headers) and
+QuickTime/MP4 (timecode track). Results are cached per file (path, modification time and size).
+
+Header dictionary (do not modify, it's shared through the cache):
+    "format"     - "exr", "dpx" or "mov".
+    "width"      - Image width, or None.
+    "height"     - Image height, or None.
+    "timecode"   - Timecode of the file (the first frame of a movie), or None.
+    "drop_frame" - True if the timecode is drop frame.
+    "frame_rate" - Frame rate, or None.
+    "attributes" - Other values of the header (e.g. custom EXR attributes).
+    "parts"      - EXR only: attributes of every part (e.g. "name", "channels").
+
+Changelog:
+1.1.1 (18.10.2026) - DPX timecode is decoded as plain BCD (frames over 39 at 50 and 60 fps), drop frame comes from the frame rate.
+1.1.0 (18.10.2026) - Timecode conversions come from ar_lib.timecode.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import os
+import mmap
+import math
+import struct
+from functools import lru_cache
+
+if __package__:
+    from . import sequence
+    from . import timecode
+else:
+    import sequence
+    import timecode
+
+
+# Global variables
+cache_size = 512
+
+movie_extensions = [".mov", ".mp4", ".m4v"]
+
+exr_magic = b"\x76\x2f\x31\x01"
+exr_multipart_flag = 0x1000
+
+exr_values = {
+    "int": "<i",
+    "float": "<f",
+    "double": "<d",
+    "v2i": "<2i",
+    "v2f": "<2f",
+    "v2d": "<2d",
+    "v3i": "<3i",
+    "v3f": "<3f",
+    "v3d": "<3d",
+    "box2i": "<4i",
+    "box2f": "<4f",
+    "m33f": "<9f",
+    "m44f": "<16f",
+    "chromaticities": "<8f",
+    "keycode": "<7i",
+    "compression": "<B",
+    "lineOrder": "<B",
+    "envmap": "<B",
+    "deepImageState": "<B",
+}
+
+exr_pixel_types = {0: "UINT", 1: "HALF", 2: "FLOAT"}
+
+
+# Functions
+def decode_bcd(value: int, shift: int, tens_mask: int) -> int:
+    """Decodes a two digit BCD number from the value."""
+
+    return ((value >> (shift + 4)) & tens_mask) * 10 + ((value >> shift) & 0xF)
+
+
+def decode_bcd_timecode(value: int) -> tuple[str, bool] | None:
+    """Decodes SMPTE 12M packed timecode (EXR timeCode) to "hh:mm:ss:ff" and drop frame flag.
+    Frame tens have 2 bits, bit 0x40 is the drop frame flag."""
+
+    if value in (0xFFFFFFFF, None):
+        return None
+
+    frames = decode_bcd(value, 0, 0x3)
+    seconds = decode_bcd(value, 8, 0x7)
+    minutes = decode_bcd(value, 16, 0x7)
+    hours = decode_bcd(value, 24, 0x3)
+    drop_frame = bool(value & 0x40)
+
+    return timecode.format_timecode(hours, minutes, seconds, frames, drop_frame), drop_frame
+
+
+def decode_dpx_timecode(value: int, frame_rate: float | None) -> tuple[str, bool] | None:
+    """Decodes DPX timecode (plain BCD 0xHHMMSSFF, frames up to 59) to "hh:mm:ss:ff" and drop frame flag.
+    DPX doesn't store a drop frame flag, 29.97 and 59.94 fps are read as drop frame."""
+
+    if value in (0xFFFFFFFF, None):
+        return None
+
+    frames = decode_bcd(value, 0, 0x7)
+    seconds = decode_bcd(value, 8, 0x7)
+    minutes = decode_bcd(value, 16, 0x7)
+    hours = decode_bcd(value, 24, 0x3)
+    drop_frame = bool(frame_rate) and timecode.get_drop_count(frame_rate, True) > 0
+
+    return timecode.format_timecode(hours, minutes, seconds, frames, drop_frame), drop_frame
+
+
+def read_exr_channels(data, position: int, end: int) -> list[dict]:
+    """Reads an EXR channel list."""
+
+    channels = []
+    while position < end and data[position] != 0:
+        name_end = data.find(b"\x00", position, end)
+        name = bytes(data[position:name_end]).decode("utf-8", errors="replace")
+        pixel_type, linear, x_sampling, y_sampling = struct.unpack_from("<iB3xii", data, name_end + 1)
+        channels.append({
+            "name": name,
+            "type": exr_pixel_types.get(pixel_type, pixel_type),
+            "linear": bool(linear),
+            "sampling": (x_sampling, y_sampling),
+        })
+        position = name_end + 17
+
+    return channels
+
+
+def read_exr_value(data, attribute_type: str, position: int, size: int):
+    """Decodes an EXR attribute value. Unknown types return None."""
+
+    end = position + size
+    if attribute_type == "string":
+        return bytes(data[position:end]).decode("utf-8", errors="replace")
+    if attribute_type == "stringvector":
+        strings = []
+        while position + 4 <= end:
+            length, = struct.unpack_from("<i", data, position)
+            strings.append(bytes(data[position + 4:position + 4 + length]).decode("utf-8", errors="replace"))
+            position += 4 + length
+        return strings
+    if attribute_type == "chlist":
+        return read_exr_channels(data, position, end)
+    if attribute_type == "rational":
+        numerator, denominator = struct.unpack_from("<iI", data, position)
+        return numerator / denominator if denominator else None
+    if attribute_type == "timecode":
+        return struct.unpack_from("<II", data, position)
+    if attribute_type in exr_values:
+        value = struct.unpack_from(exr_values[attribute_type], data, position)
+        return value[0] if len(value) == 1 else value
+
+    return None
+
+
+def read_exr_attributes(data, position: int) -> tuple[dict, int]:
+    """Reads one attribute table. Returns attributes and the position after the table."""
+
+    attributes = {}
+    while data[position] != 0:
+        name_end = data.find(b"\x00", position)
+        type_end = data.find(b"\x00", name_end + 1)
+        if name_end < 0 or type_end < 0:
+            raise ValueError("Broken EXR header.")
+        name = bytes(data[position:name_end]).decode("utf-8", errors="replace")
+        attribute_type = bytes(data[name_end + 1:type_end]).decode("utf-8", errors="replace")
+        size, = struct.unpack_from("<i", data, type_end + 1)
+        position = type_end + 5
+        attributes[name] = read_exr_value(data, attribute_type, position, size)
+        position += size
+
+    return attributes, position + 1
+
+
+def read_exr(data) -> dict:
+    """Reads the EXR header(s)."""
+
+    version, = struct.unpack_from("<I", data, 4)
+    parts = []
+    position = 8
+    while True:
+        attributes, position = read_exr_attributes(data, position)
+        parts.append(attributes)
+        if not version & exr_multipart_flag or data[position] == 0:
+            break  # Single part, or the empty header ending the multi-part header list.
+
+    attributes = dict(parts[0])
+    attributes.pop("channels", None)  # Channels are in the parts.
+    header = {
+        "format": "exr",
+        "width": None,
+        "height": None,
+        "timecode": None,
+        "drop_frame": False,
+        "frame_rate": attributes.pop("framesPerSecond", None),
+        "attributes": attributes,
+        "parts": parts,
+    }
+
+    window = attributes.get("dataWindow") or attributes.get("displayWindow")
+    if window:
+        header['width'] = window[2] - window[0] + 1
+        header['height'] = window[3] - window[1] + 1
+
+    packed = attributes.pop("timeCode", None)
+    if packed:
+        decoded = decode_bcd_timecode(packed[0])
+        if decoded:
+            header['timecode'], header['drop_frame'] = decoded
+
+    return header
+
+
+def read_dpx(data) -> dict:
+    """Reads the DPX file, image, orientation, film and TV headers."""
+
+    endian = ">" if data[:4] == b"SDPX" else "<"
+
+    def number(code: str, position: int):
+        value, = struct.unpack_from(endian + code, data, position)
+        if code == "I" and value == 0xFFFFFFFF:
+            return None
+        if code == "f" and not math.isfinite(value):
+            return None
+        return value
+
+    def text(position: int, size: int) -> str:
+        return bytes(data[position:position + size]).split(b"\x00", 1)[0].decode("ascii", errors="replace").strip()
+
+    attributes = {
+        "file_name": text(36, 100),
+        "creation_time": text(136, 24),
+        "creator": text(160, 100),
+        "project": text(260, 200),
+        "copyright": text(460, 200),
+        "input_device": text(1556, 32),
+        "input_serial": text(1588, 32),
+        "film_frame_position": number("I", 1712),
+        "film_sequence_length": number("I", 1716),
+        "film_frame_id": text(1732, 32),
+        "film_slate": text(1764, 100),
+        "user_bits": number("I", 1924),
+    }
+    film_rate = number("f", 1724)
+    tv_rate = number("f", 1940)
+
+    header = {
+        "format": "dpx",
+        "width": number("I", 772),
+        "height": number("I", 776),
+        "timecode": None,
+        "drop_frame": False,
+        "frame_rate": film_rate or tv_rate or None,
+        "attributes": {key: value for key, value in attributes.items() if value not in ("", None)},
+    }
+
+    decoded = decode_dpx_timecode(number("I", 1920), header['frame_rate'])
+    if decoded:
+        header['timecode'], header['drop_frame'] = decoded
+
+    return header
+
+
+def iter_atoms(data: bytes, start: int = 0, end: int | None = None):
+    """Yields (type, payload start, payload end) of the QuickTime atoms in the data."""
+
+    end = len(data) if end is None else end
+    position = start
+    while position + 8 <= end:
+        size, atom_type = struct.unpack_from(">I4s", data, position)
+        header_size = 8
+        if size == 1:
+            size, = struct.unpack_from(">Q", data, position + 8)
+            header_size = 16
+        elif size == 0:
+            size = end - position
+        if size < header_size:
+            break
+        yield atom_type, position + header_size, min(position + size, end)
+        position += size
+
+
+def find_atom(data: bytes, start: int, end: int, atom_type: bytes) -> tuple[int, int] | None:
+    """Returns the payload range of the first child atom of the type."""
+
+    for found_type, payload_start, payload_end in iter_atoms(data, start, end):
+        if found_type == atom_type:
+            return payload_start, payload_end
+    return None
+
+
+def read_movie_atom(file) -> bytes | None:
+    """Reads the movie (moov) atom, skipping the media data."""
+
+    file.seek(0, os.SEEK_END)
+    file_size = file.tell()
+    position = 0
+    while position + 8 <= file_size:
+        file.seek(position)
+        size, atom_type = struct.unpack(">I4s", file.read(8))
+        header_size = 8
+        if size == 1:
+            size, = struct.unpack(">Q", file.read(8))
+            header_size = 16
+        elif size == 0:
+            size = file_size - position
+        if size < header_size:
+            return None
+        if atom_type == b"moov":
+            return file.read(size - header_size)
+        position += size
+
+    return None
+
+
+def read_mov(file) -> dict:
+    """Reads the frame rate and the size of the video track and the start timecode of the timecode track."""
+
+    header = {
+        "format": "mov",
+        "width": None,
+        "height": None,
+        "timecode": None,
+        "drop_frame": False,
+        "frame_rate": None,
+        "attributes": {},
+    }
+
+    movie = read_movie_atom(file)
+    if movie is None:
+        return header
+
+    for atom_type, track_start, track_end in iter_atoms(movie):
+        if atom_type != b"trak":
+            continue
+        media = find_atom(movie, track_start, track_end, b"mdia")
+        if media is None:
+            continue
+        handler = find_atom(movie, *media, b"hdlr")
+        media_header = find_atom(movie, *media, b"mdhd")
+        media_info = find_atom(movie, *media, b"minf")
+        table = find_atom(movie, *media_info, b"stbl") if media_info else None
+        if handler is None or media_header is None or table is None:
+            continue
+
+        handler_type = movie[handler[0] + 8:handler[0] + 12]
+        version = movie[media_header[0]]
+        timescale, = struct.unpack_from(">I", movie, media_header[0] + (20 if version == 1 else 12))
+        description = find_atom(movie, *table, b"stsd")
+        entry = description[0] + 8 if description else None  # Skip version, flags and entry count.
+
+        if handler_type == b"vide" and header['width'] is None and entry is not None:
+            codec = movie[entry + 4:entry + 8].decode("ascii", errors="replace").strip()
+            header['width'], header['height'] = struct.unpack_from(">HH", movie, entry + 32)
+            header['attributes']['codec'] = codec
+            sample_times = find_atom(movie, *table, b"stts")
+            if sample_times and header['frame_rate'] is None:
+                count, delta = struct.unpack_from(">II", movie, sample_times[0] + 8)
+                if count and delta:
+                    header['frame_rate'] = timescale / delta
+
+        elif handler_type == b"tmcd" and entry is not None:
+            flags, tc_timescale, frame_duration, frame_count = struct.unpack_from(">IIIB", movie, entry + 20)
+            drop_frame = bool(flags & 0x1)
+            offsets = find_atom(movie, *table, b"stco") or find_atom(movie, *table, b"co64")
+            if offsets is None or not frame_count:
+                continue
+            wide = movie[offsets[0] - 4:offsets[0]] == b"co64"
+            chunk_offset, = struct.unpack_from(">Q" if wide else ">I", movie, offsets[0] + 8)
+            file.seek(chunk_offset)
+            counter, = struct.unpack(">I", file.read(4))
+            header['timecode'] = timecode.to_timecode(counter, tc_timescale / frame_duration if frame_duration else frame_count, drop_frame)
+            header['drop_frame'] = drop_frame
+            if frame_duration:
+                header['attributes']['timecode_rate'] = tc_timescale / frame_duration
+            header['attributes']['timecode_frames'] = counter
+
+    return header
+
+
+@lru_cache(maxsize=cache_size)
+def read_file(file_path: str, mtime: int, size: int) -> dict | None:
+    """Reads the header (cached by path, modification time and size)."""
+
+    try:
+        with open(file_path, "rb") as file:
+            magic = file.read(4)
+            if magic == exr_magic:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return read_exr(data)
+            if magic in (b"SDPX", b"XPDS"):
+                file.seek(0)
+                return read_dpx(file.read(2048))
+            if os.path.splitext(file_path)[1].lower() in movie_extensions:
+                return read_mov(file)
+    except (OSError, ValueError, struct.error, IndexError):
+        return None
+
+    return None
+
+
+def read_header(file_path: str) -> dict | None:
+    """Returns the header of the file, or None if the file can't be read or isn't supported."""
+
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    return read_file(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def clear_cache() -> None:
+    """Clears the cached headers."""
+
+    read_file.cache_clear()
+
+
+def get_loader_file(comp, tool, time: float) -> tuple[str, int] | None:
+    """Returns the loader's file at the composition time and the frame inside the file (movies).
+    Hold, loop and reverse settings are not taken into account."""
+
+    if tool.ID != "Loader":
+        return None
+
+    clip_names = tool.GetAttrs("TOOLST_Clip_Name")
+    if not clip_names or not clip_names.get(1):
+        return None
+
+    file_path = comp.MapPath(clip_names[1])
+    trim_in = int(tool.ClipTimeStart[time])
+    trim_out = int(tool.ClipTimeEnd[time])
+    frame = min(max(trim_in + int(time - tool.GlobalIn[time]), trim_in), trim_out)
+
+    if os.path.splitext(file_path)[1].lower() in movie_extensions:
+        return file_path, frame
+
+    clip_sequence = sequence.get_sequence(file_path)
+    if clip_sequence is None or not clip_sequence['frames']:
+        return file_path, 0
+
+    frames = clip_sequence['frames']
+    return sequence.sequence_path(clip_sequence, frames[min(frame, len(frames) - 1)]), 0
+
+
+def get_header_metadata(comp, tool, time: float) -> dict | None:
+    """Returns the loader's metadata at the time read from the file header, or None."""
+
+    found = get_loader_file(comp, tool, time)
+    if found is None:
+        return None
+
+    file_path, frame = found
+    header = read_header(file_path)
+    if header is None:
+        return None
+
+    metadata = {key: value for key, value in header['attributes'].items() if value is not None}
+    if header['timecode']:
+        metadata['TimeCode'] = header['timecode']
+        if frame and header['frame_rate']:
+            metadata['TimeCode'] = timecode.offset(header['timecode'], frame, header['frame_rate'], header['drop_frame'])
+    if header['frame_rate']:
+        metadata['FrameRate'] = header['frame_rate']
+    if header['width']:
+        metadata['ImageWidth'] = header['width']
+        metadata['ImageHeight'] = header['height']
+
+    return metadata
+
+
+def get_metadata(comp, tool, time: float | None = None) -> dict:
+    """Returns the tool's metadata at the time (default: current time).
+    Loaders' supported files are read from the header, otherwise the tool is rendered (Output.Metadata)."""
+
+    time = comp.CurrentTime if time is None else time
+
+    metadata = get_header_metadata(comp, tool, time)
+    if metadata:
+        return metadata
+
+    outputs = tool.GetOutputList()  # Output port can be also MainOutput1 or Output1 (macros and groups).
+    if not outputs:
+        return {}
+
+    return outputs[1][time].Metadata or {}
+
+
+if __name__ == "__main__":
+    # Timecode decoding checks.
+    assert decode_bcd_timecode(0x01020304) == ("01:02:03:04", False)
+    assert decode_bcd_timecode(0x01020344) == ("01:02:03;04", True)  # 12M drop frame flag.
+    assert decode_dpx_timecode(0x01020345, 50.0) == ("01:02:03:45", False)
+    assert decode_dpx_timecode(0x01020359, 60.0) == ("01:02:03:59", False)
+    assert decode_dpx_timecode(0x01020345, 60000 / 1001) == ("01:02:03;45", True)
+    assert decode_dpx_timecode(0x01020312, None) == ("01:02:03:12", False)
+    assert decode_dpx_timecode(0xFFFFFFFF, 25.0) is None
+    print("Timecode decoding OK.")
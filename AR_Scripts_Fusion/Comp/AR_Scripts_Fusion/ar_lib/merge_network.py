@@ -0,0 +1,198 @@
+"""
+ar_lib.merge_network
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Builds merge networks that layer many tools on top of each other.
+
+Topologies (the first tool is at the bottom, the last one on top):
+    "Chain"        - Every tool is merged over the previous merge. Depth grows linearly (n - 1 merges deep).
+    "Tree"         - Balanced binary tree of Merges. Depth grows logarithmically (ceil(log2(n))).
+    "MultiMerge"   - One MultiMerge with a layer per tool. Depth stays at 1.
+
+The networks are returned as settings tools (see ar_lib.settings) so they can be pasted
+together with the tools they merge. Render times of the topologies can be compared
+with benchmark() from Fusion's console:
+
+    from ar_lib import merge_network
+    merge_network.benchmark(comp, bmd)
+
+Changelog:
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import math
+import time
+
+if __package__:
+    from . import settings
+else:
+    import settings
+
+
+# Global variables
+CHAIN: str = "Chain"
+TREE: str = "Tree"
+MULTIMERGE: str = "MultiMerge"
+
+topologies = [CHAIN, TREE, MULTIMERGE]
+
+
+# Functions
+def build_chain(names: list[str], positions: dict[str, tuple[float, float]], prefix: str = "") -> dict[str, tuple[str, dict]]:
+    """Merges every tool over the previous merge."""
+
+    tools = {}
+    background = names[0]
+    for i, name in enumerate(names[1:], start=1):
+        merge_name = f"{prefix}Merge{i}"
+        x, y = positions[name]
+        inputs = {
+            "Background": settings.make_connection(background),
+            "Foreground": settings.make_connection(name),
+        }
+        tools[merge_name] = settings.make_tool("Merge", inputs, position=(x + 1, y))
+        background = merge_name
+
+    return tools
+
+
+def build_tree(names: list[str], positions: dict[str, tuple[float, float]], prefix: str = "") -> dict[str, tuple[str, dict]]:
+    """Merges the tools pairwise, level by level, until one merge is left."""
+
+    tools = {}
+    level = [(name, positions[name]) for name in names]
+    merge_count = 0
+
+    while len(level) > 1:
+        next_level = []
+        for i in range(0, len(level) - 1, 2):
+            (background, _), (foreground, (x, y)) = level[i], level[i + 1]
+            merge_count += 1
+            merge_name = f"{prefix}Merge{merge_count}"
+            inputs = {
+                "Background": settings.make_connection(background),
+                "Foreground": settings.make_connection(foreground),
+            }
+            position = (max(x, level[i][1][0]) + 1, y)
+            tools[merge_name] = settings.make_tool("Merge", inputs, position=position)
+            next_level.append((merge_name, position))
+
+        if len(level) % 2:
+            next_level.append(level[-1])  # Odd one out goes to the next level as it is.
+        level = next_level
+
+    return tools
+
+
+def build_multimerge(names: list[str], positions: dict[str, tuple[float, float]], prefix: str = "") -> dict[str, tuple[str, dict]]:
+    """Connects the first tool to the background and the rest to layers of one MultiMerge."""
+
+    inputs = {"Background": settings.make_connection(names[0])}
+    for layer_index, name in enumerate(names[1:], start=1):
+        inputs[f"Layer{layer_index}.Foreground"] = settings.make_connection(name)
+
+    x, y = positions[names[0]]
+
+    return {f"{prefix}MultiMerge1": settings.make_tool("MultiMerge", inputs, position=(x + 1, y))}
+
+
+def build_merges(names: list[str], positions: dict[str, tuple[float, float]], topology: str = CHAIN, prefix: str = "") -> dict[str, tuple[str, dict]]:
+    """Returns merge tools that layer the given tools (bottom first) with the given topology.
+    positions: Tool name: flow grid position, used to place the merges.
+    prefix: Added to the merge names."""
+
+    if len(names) < 2:
+        return {}
+
+    if topology == TREE:
+        return build_tree(names, positions, prefix)
+    if topology == MULTIMERGE:
+        return build_multimerge(names, positions, prefix)
+    return build_chain(names, positions, prefix)
+
+
+def get_depth(count: int, topology: str = CHAIN) -> int:
+    """Returns the number of merges between the deepest tool and the output."""
+
+    if count < 2:
+        return 0
+    if topology == TREE:
+        return math.ceil(math.log2(count))
+    if topology == MULTIMERGE:
+        return 1
+    return count - 1
+
+
+def get_output_name(tools: dict[str, tuple[str, dict]], names: list[str]) -> str:
+    """Returns the name of the tool that outputs the whole network."""
+
+    if not tools:
+        return names[-1]
+    return list(tools)[-1]
+
+
+def benchmark(comp, bmd, counts: tuple[int, ...] = (10, 50, 200), frames: int = 5, size: int = 512) -> list[list]:
+    """Renders merge networks of Background tools with every topology and prints the timings.
+    Timings are the average render time per frame, and the render time after changing the bottom tool.
+    The tools are removed from the composition after the benchmark. Returns [topology, tools, depth, frame time, update time] rows."""
+
+    rows = []
+    for count in counts:
+        for topology in topologies:
+            prefix = f"Benchmark{topology}{count}_"
+            names = [f"{prefix}Background{i + 1}" for i in range(count)]
+            positions = {name: (0, i) for i, name in enumerate(names)}
+            tools = {}
+            for i, name in enumerate(names):
+                inputs = {
+                    "Width": settings.make_input(size),
+                    "Height": settings.make_input(size),
+                    "TopLeftAlpha": settings.make_input(0.1),
+                    "TopLeftRed": settings.make_input(i / count),
+                }
+                tools[name] = settings.make_tool("Background", inputs, position=positions[name])
+            merges = build_merges(names, positions, topology, prefix)
+            tools.update(merges)
+
+            comp.Paste(bmd.readstring(settings.build_setting(tools)))
+            pasted = [comp.FindTool(name) for name in tools]
+
+            output_tool = comp.FindTool(get_output_name(merges, names))
+            bottom_tool = comp.FindTool(names[0])
+
+            start_time = time.perf_counter()
+            for frame in range(frames):
+                output_tool.Output[frame]
+            frame_time = (time.perf_counter() - start_time) / frames
+
+            bottom_tool.SetInput("TopLeftRed", 1.0, frames)
+            start_time = time.perf_counter()
+            output_tool.Output[frames]
+            update_time = time.perf_counter() - start_time
+
+            for tool in pasted:
+                if tool:
+                    tool.Delete()
+
+            rows.append([topology, count, get_depth(count, topology), frame_time, update_time])
+
+    print("")
+    print("Merge Network Benchmark:")
+    print(f"{'Topology':<12}{'Tools':>8}{'Depth':>8}{'Frame (ms)':>14}{'Update (ms)':>14}")
+    for topology, count, depth, frame_time, update_time in rows:
+        print(f"{topology:<12}{count:>8}{depth:>8}{frame_time * 1000:>14.1f}{update_time * 1000:>14.1f}")
+    print("")
+
+    return rows
+
+
+if __name__ == "__main__":
+    # Graph size per topology (rendering needs Fusion, see benchmark()).
+    print(f"{'Topology':<12}{'Tools':>8}{'Merges':>8}{'Depth':>8}")
+    for count in (10, 50, 200, 1000):
+        names = [f"Loader{i + 1}" for i in range(count)]
+        positions = {name: (0, i) for i, name in enumerate(names)}
+        for topology in topologies:
+            merges = build_merges(names, positions, topology)
+            print(f"{topology:<12}{count:>8}{len(merges):>8}{get_depth(count, topology):>8}")
@@ -0,0 +1,167 @@
+"""
+ar_lib.project_index
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Persistent index of project versions (composition files with '_v' delimiter).
+
+The index is stored per root folder in a local JSON file. It keeps every folder's
+modification time, subfolders and composition files. On refresh, a folder is listed
+again only if its modification time has changed, unchanged folders are only checked
+with a stat call. Folders are read in parallel with a thread pool.
+
+Projects dictionary (versions are sorted, oldest first):
+    {project name: {"v001": comp path, "v002": comp path, ...}}
+
+Changelog:
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import os
+import re
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+# Global variables
+index_folder = Path(os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or Path.home()) / "ar_Scripts_Fusion" / "project_index"
+index_version = 1
+max_workers = 16
+
+comp_pattern = re.compile(r"(.+)_v(\d+)\.comp$", re.IGNORECASE)
+
+
+# Functions
+def get_index_file(root_path: str) -> Path:
+    """Returns the index file of the root folder."""
+
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(root_path)).encode("utf-8")).hexdigest()[:16]
+
+    return index_folder / f"{key}.json"
+
+
+def load_index(root_path: str) -> dict | None:
+    """Loads the saved index of the root folder, or None if there isn't a valid one."""
+
+    try:
+        with get_index_file(root_path).open("r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("version") != index_version or index.get("root") != os.path.abspath(root_path):
+        return None
+
+    return index
+
+
+def save_index(index: dict) -> None:
+    """Saves the index. Errors are ignored, the index is only a cache."""
+
+    index_file = get_index_file(index['root'])
+    temp_file = index_file.with_suffix(".tmp")
+    try:
+        index_folder.mkdir(parents=True, exist_ok=True)
+        with temp_file.open("w", encoding="utf-8") as f:
+            json.dump(index, f)
+        temp_file.replace(index_file)
+    except OSError:
+        pass
+
+
+def read_folder(dir_path: str, cached: dict | None) -> dict | None:
+    """Returns the folder's entry {"mtime", "dirs", "comps"}.
+    The folder is listed only if it has changed since the cached entry. Returns None if it can't be read."""
+
+    try:
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return None
+
+    if cached is not None and cached.get("mtime") == mtime:
+        return cached
+
+    dirs = []
+    comps = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.name)
+                elif comp_pattern.match(entry.name):
+                    comps.append(entry.name)
+    except OSError:
+        return None
+
+    return {"mtime": mtime, "dirs": sorted(dirs), "comps": sorted(comps)}
+
+
+def walk(root_path: str, cached_folders: dict[str, dict]) -> tuple[dict[str, dict], int]:
+    """Walks the folder tree level by level, folders of a level are read in parallel.
+    Returns folders (relative path: entry) and the number of folders that were listed again."""
+
+    folders = {}
+    listed = 0
+    level = ["."]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            paths = [os.path.join(root_path, relative) for relative in level]
+            entries = executor.map(read_folder, paths, [cached_folders.get(relative) for relative in level])
+
+            next_level = []
+            for relative, entry in zip(level, entries):
+                if entry is None:
+                    continue
+                if entry is not cached_folders.get(relative):
+                    listed += 1
+                folders[relative] = entry
+                next_level.extend(os.path.normpath(os.path.join(relative, name)) for name in entry['dirs'])
+            level = next_level
+
+    return folders, listed
+
+
+def build_projects(root_path: str, folders: dict[str, dict]) -> dict[str, dict[str, str]]:
+    """Builds the projects dictionary from the folders. Versions are sorted, oldest first."""
+
+    projects: dict[str, dict[str, str]] = {}
+    for relative in sorted(folders):
+        for file_name in folders[relative]['comps']:
+            match = comp_pattern.match(file_name)
+            project_name = match.group(1)
+            version = f"v{match.group(2)}"
+            projects.setdefault(project_name, {})[version] = os.path.normpath(os.path.join(root_path, relative, file_name))
+
+    return {
+        project_name: dict(sorted(versions.items(), key=lambda item: int(item[0][1:])))
+        for project_name, versions in sorted(projects.items())
+    }
+
+
+def get_projects(root_path: str) -> dict[str, dict[str, str]]:
+    """Returns the projects of the root folder, the saved index is refreshed first."""
+
+    if not root_path or not os.path.isdir(root_path):
+        return {}
+
+    root_path = os.path.abspath(root_path)
+    index = load_index(root_path)
+
+    cached_folders = index['folders'] if index is not None else {}
+    folders, listed = walk(root_path, cached_folders)
+
+    if index is not None and listed == 0 and len(folders) == len(cached_folders):
+        return index['projects']  # Nothing has changed.
+
+    index = {
+        "version": index_version,
+        "root": root_path,
+        "folders": folders,
+        "projects": build_projects(root_path, folders),
+    }
+    save_index(index)
+
+    return index['projects']
@@ -0,0 +1,41 @@
+"""
+ar_lib.rename
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Rewrites tool names in expressions and scripts after tools are renamed.
+
+All of the old names are compiled once to a single pattern (longest names first),
+so every string is rewritten with one scan, however many tools were renamed.
+A name is rewritten only when it's a whole name followed by a dot (e.g. "Merge1.Blend"),
+so "Merge1" doesn't touch "MyMerge1." or "Merge10.". Rewritten names are not rewritten
+again (renaming A → B and B → C doesn't turn A into C).
+
+Changelog:
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import re
+
+
+# Functions
+def build_pattern(name_map: dict[str, str]) -> re.Pattern | None:
+    """Compiles the old names of the name map (old name: new name) to one pattern.
+    Returns None if no name was changed."""
+
+    old_names = sorted((old for old, new in name_map.items() if old != new), key=len, reverse=True)
+    if not old_names:
+        return None
+
+    alternation = "|".join(re.escape(name) for name in old_names)
+
+    return re.compile(rf"(?<![\w])({alternation})(?=\.)")
+
+
+def rewrite(text: str, pattern: re.Pattern | None, name_map: dict[str, str]) -> tuple[str, int]:
+    """Replaces old names with new names in a single scan. Returns the new text and the number of replacements."""
+
+    if pattern is None or not text:
+        return text, 0
+
+    return pattern.subn(lambda match: name_map[match.group(1)], text)
@@ -0,0 +1,109 @@
+"""
+ar_lib.script_cache
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Execution cache for the scripts run from ar_ScriptLauncher.
+
+The module stays loaded in Fusion's Python between script runs, so the compiled code
+of each script is kept here (keyed by path, modification time and size). Running the
+same script again skips reading and compiling, the cached code is executed in a new module
+with the Fusion variables (comp, fu, key_modifiers...), so nothing is left over from the
+previous run. Optional heavy libraries can be imported in the background.
+
+Changelog:
+1.1.0 (18.10.2026) - Added has_dialog.
+1.0.1 (18.10.2026) - Every run gets a new module, only the compiled code is cached.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import importlib
+import os
+import threading
+import types
+
+
+# Global variables
+prewarm_modules = ["pyperclip", "tabulate", "PIL.Image", "PIL.ImageGrab", "tkinter"]  # Optional libraries used by the scripts.
+
+_code_cache: dict[str, tuple[int, int, types.CodeType]] = {}  # Script path: (mtime, size, code).
+_prewarm_started = False
+
+
+# Functions
+def get_code(file_path: str) -> types.CodeType:
+    """Returns compiled code of the script. Compiles only if the file has changed."""
+
+    file_path = os.path.normpath(str(file_path))
+    stat = os.stat(file_path)
+
+    cached = _code_cache.get(file_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(file_path, "rb") as f:
+        source = f.read()
+    code = compile(source, file_path, "exec")
+
+    _code_cache[file_path] = (stat.st_mtime_ns, stat.st_size, code)
+
+    return code
+
+
+def uses_name(code: types.CodeType, name: str) -> bool:
+    """Returns True if the code (or any function in it) uses the name."""
+
+    if name in code.co_names:
+        return True
+
+    return any(uses_name(const, name) for const in code.co_consts if isinstance(const, types.CodeType))
+
+
+def has_dialog(file_path: str) -> bool:
+    """Returns True if the script runs a dialog (UIDispatcher RunLoop), its run time depends on the user."""
+
+    return uses_name(get_code(file_path), "RunLoop")
+
+
+def load(file_path: str, variables: dict) -> types.ModuleType:
+    """Executes the script in a new module with the given variables (e.g. comp, fu, key_modifiers) and returns the module.
+    The module isn't added to sys.modules."""
+
+    file_path = os.path.normpath(str(file_path))
+    code = get_code(file_path)
+
+    module = types.ModuleType(os.path.splitext(os.path.basename(file_path))[0])
+    module.__file__ = file_path
+    module.__dict__.update(variables)
+    exec(code, module.__dict__)
+
+    return module
+
+
+def clear_cache() -> None:
+    """Clears cached code."""
+
+    _code_cache.clear()
+
+
+def _import_modules(module_names: list[str]) -> None:
+    """Imports the given modules, missing ones are ignored."""
+
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+
+
+def prewarm(module_names: list[str] | None = None) -> None:
+    """Imports optional heavy libraries in a background thread (once per Fusion session)."""
+
+    global _prewarm_started
+
+    if _prewarm_started:
+        return
+    _prewarm_started = True
+
+    thread = threading.Thread(target=_import_modules, args=(module_names or prewarm_modules,), daemon=True)
+    thread.start()
@@ -0,0 +1,224 @@
+"""
+ar_lib.script_index
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Script collection index used by ar_ScriptLauncher and ar_UpdateScriptCollection.
+
+The collection is a JSON list of script entries, keyed by the script's path. Paths are stored
+relative to the collection file. The scripts' modification times and sizes are machine specific,
+so they are kept in a local cache file (next to the launch log) instead of the collection.
+Updating the collection re-parses only the scripts that have changed since the last update.
+
+Entry dictionary:
+    "name"   - Script name (Name-US).
+    "desc"   - Script description (Description-US).
+    "path"   - Script path, relative to the collection file.
+    "icon"   - Icon path, relative to the collection file.
+    "search" - Precomputed lowercase search text (name, file name and description).
+
+Changelog:
+1.1.0 (18.10.2026) - Modification times and sizes are cached locally, not stored in the collection.
+                   - The collection is written only if it changes. Line breaks in descriptions are decoded.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import os
+import json
+from pathlib import Path
+
+
+# Global variables
+cache_file = Path(os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or Path.home()) / "ar_Scripts_Fusion" / "script_collection_cache.json"
+lib_folder_name = "ar_lib"  # Shared modules, not scripts.
+default_icon_name = "default_script"
+
+
+# Functions
+def extract_metadata(py_file: Path) -> dict[str, str]:
+    """Parses script name and description from the script file's header."""
+
+    name: str | None = None
+    desc: str | None = None
+
+    try:
+        with py_file.open("r", encoding="utf-8") as f:
+            for line in f:
+                stripped = line.strip()
+
+                if stripped.startswith("Name-US:"):
+                    name = stripped.removeprefix("Name-US:").strip()
+
+                elif stripped.startswith("Description-US:"):
+                    desc = stripped.removeprefix("Description-US:").strip()
+
+                if name and desc:
+                    break
+
+                if stripped.startswith('"""') and name is not None:  # End of the header.
+                    break
+
+    except Exception as e:
+        print(f"Couldn't read the file {py_file}: {e}")
+
+    return {
+        "name": name if name else py_file.stem,
+        "desc": (desc or "").replace("\\n", "\n"),  # Description-US can have line breaks as \n.
+    }
+
+
+def search_text(name: str, stem: str, desc: str) -> str:
+    """Returns the lowercase text that is used for searching."""
+
+    return f"{name}\n{stem}\n{desc}".lower()
+
+
+def relative_path(path: Path, root: Path) -> str:
+    """Returns path relative to root, or absolute path if it is outside of root."""
+
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def build_icon_map(icon_root: Path) -> tuple[dict[str, Path], Path | None]:
+    """Maps icon file names (without extension) to icon paths."""
+
+    icon_map: dict[str, Path] = {}
+    default_icon: Path | None = None
+
+    if not icon_root.is_dir():
+        return icon_map, default_icon
+
+    for dir_path, _, file_names in os.walk(icon_root):
+        for file_name in file_names:
+            stem, extension = os.path.splitext(file_name)
+            if extension.lower() != ".png":
+                continue
+
+            icon_path = Path(dir_path) / file_name
+            if stem == default_icon_name:
+                default_icon = icon_path
+            else:
+                icon_map[stem] = icon_path
+
+    return icon_map, default_icon
+
+
+def scan_scripts(root_folder: Path) -> list[tuple[Path, os.stat_result]]:
+    """Walks the script folder once and returns script paths with their stats."""
+
+    scripts = []
+    for dir_path, dir_names, file_names in os.walk(root_folder):
+        dir_names[:] = sorted(d for d in dir_names if d != lib_folder_name and d != "__pycache__")
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py"):
+                continue
+            py_file = Path(dir_path) / file_name
+            try:
+                scripts.append((py_file, py_file.stat()))
+            except OSError:
+                continue
+
+    return scripts
+
+
+def load_collection(json_file: Path) -> list[dict]:
+    """Loads the script collection. Returns an empty list if it doesn't exist or is broken."""
+
+    try:
+        with json_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+
+    return data if isinstance(data, list) else []
+
+
+def load_cache(json_file: Path) -> dict[str, list[int]]:
+    """Loads the collection's cached script stats (script path: [modification time (ns), size])."""
+
+    try:
+        with cache_file.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    stats = cache.get(str(json_file.resolve())) if isinstance(cache, dict) else None
+
+    return stats if isinstance(stats, dict) else {}
+
+
+def save_cache(json_file: Path, stats: dict[str, list[int]]) -> None:
+    """Saves the collection's script stats to the cache. Errors are ignored, it's only a cache."""
+
+    try:
+        with cache_file.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    cache[str(json_file.resolve())] = stats
+
+    temp_file = cache_file.with_suffix(".tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with temp_file.open("w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        temp_file.replace(cache_file)
+    except OSError:
+        pass
+
+
+def update_collection(root_folder: Path, icon_folder: Path, json_file: Path) -> tuple[list[dict], int]:
+    """Updates the script collection. Only new and changed scripts are parsed.
+    Returns the collection and the amount of parsed scripts."""
+
+    root = json_file.parent
+    old_data = load_collection(json_file)
+    old_entries = {entry.get("path"): entry for entry in old_data}
+    old_stats = load_cache(json_file)
+    icon_map, default_icon = build_icon_map(icon_folder)
+
+    data: list[dict] = []
+    stats: dict[str, list[int]] = {}
+    parsed = 0
+
+    for py_file, stat in scan_scripts(root_folder):
+        path = relative_path(py_file, root)
+        entry = old_entries.get(path)
+        stats[path] = [stat.st_mtime_ns, stat.st_size]
+
+        if entry is None or old_stats.get(path) != stats[path]:
+            metadata = extract_metadata(py_file)
+            parsed += 1
+            entry = {
+                "name": metadata["name"],
+                "desc": metadata["desc"],
+                "path": path,
+            }
+
+        icon_path = icon_map.get(py_file.stem, default_icon)
+        data.append({
+            "name": entry["name"],
+            "desc": entry["desc"],
+            "path": path,
+            "icon": relative_path(icon_path, root) if icon_path else "",
+            "search": search_text(entry["name"], py_file.stem, entry["desc"]),
+        })
+
+    if data != old_data:
+        with json_file.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+    if stats != old_stats:
+        save_cache(json_file, stats)
+
+    return data, parsed
+
+
+def resolve_path(path: str, root: Path) -> Path:
+    """Resolves path stored in the collection (relative or absolute)."""
+
+    return root / path
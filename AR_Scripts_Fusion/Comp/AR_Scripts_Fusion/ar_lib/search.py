@@ -0,0 +1,165 @@
+"""
+ar_lib.search
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: In-memory search engine used by ar_ScriptLauncher.
+
+Items are searched by name, file name (stem) and description. The index is built once:
+    - Character (1-gram) index: items containing the character, used to drop items that can't match.
+    - Prefix index: items that have a word in the name starting with the prefix.
+
+Every keyword has to match the item, either as a substring or as a subsequence
+(e.g. "vup" matches "Version Up"). Results are ranked by score, optional boosts
+(e.g. frecency) are added to the score. When the new query extends the previous one
+(typing), only the previous results are searched again.
+
+Changelog:
+1.1.0 (18.10.2026) - Support for score boosts (frecency).
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import re
+
+
+# Global variables
+max_prefix_length = 8  # Longest word prefix stored to the prefix index.
+
+word_pattern = re.compile(r"[a-z0-9]+")
+
+# Scores.
+SCORE_NAME_START: int = 120
+SCORE_WORD_PREFIX: int = 100
+SCORE_NAME: int = 60
+SCORE_STEM: int = 40
+SCORE_NAME_FUZZY: int = 20
+SCORE_STEM_FUZZY: int = 10
+SCORE_DESC: int = 5
+SCORE_BOOST: int = 30  # Maximum score added by a boost (boost values are 0-1).
+
+
+# Functions
+def build_index(items: dict[str, str]) -> dict:
+    """Builds the search index.
+    items: Item name: lowercase search text, fields separated by new lines (name, stem, description)."""
+
+    index = {
+        "names": [],
+        "fields": [],
+        "chars": {},
+        "prefixes": {},
+        "last_query": None,
+        "last_ids": None,
+    }
+
+    for item_id, (name, text) in enumerate(items.items()):
+        fields = (text.split("\n") + ["", "", ""])[:3]
+        index['names'].append(name)
+        index['fields'].append(fields)
+
+        joined = " ".join(fields)
+        for char in set(joined):
+            index['chars'].setdefault(char, set()).add(item_id)
+        for word in word_pattern.findall(fields[0]):
+            for i in range(1, min(len(word), max_prefix_length) + 1):
+                index['prefixes'].setdefault(word[:i], set()).add(item_id)
+
+    return index
+
+
+def subsequence_span(keyword: str, text: str) -> int:
+    """Returns the length of the shortest text span starting from the first match
+    that contains the keyword's characters in order, or 0 if not found."""
+
+    position = text.find(keyword[0])
+    if position == -1:
+        return 0
+
+    start = position
+    for char in keyword[1:]:
+        position = text.find(char, position + 1)
+        if position == -1:
+            return 0
+
+    return position - start + 1
+
+
+def score_keyword(keyword: str, fields: list[str], prefix_match: bool) -> float:
+    """Scores a single keyword against the item's fields. Returns 0 if the keyword doesn't match."""
+
+    name, stem, desc = fields
+
+    if name.startswith(keyword):
+        return SCORE_NAME_START
+    if prefix_match:
+        return SCORE_WORD_PREFIX
+    if keyword in name:
+        return SCORE_NAME
+    if keyword in stem:
+        return SCORE_STEM
+
+    span = subsequence_span(keyword, name)
+    if span:
+        return SCORE_NAME_FUZZY * len(keyword) / span
+    span = subsequence_span(keyword, stem)
+    if span:
+        return SCORE_STEM_FUZZY * len(keyword) / span
+
+    if keyword in desc:
+        return SCORE_DESC
+
+    return 0
+
+
+def candidate_ids(index: dict, keywords: list[str], pool: set[int] | None) -> set[int]:
+    """Returns items that contain all of the keywords' characters."""
+
+    candidates = set(range(len(index['names']))) if pool is None else set(pool)
+    for char in set("".join(keywords)):
+        candidates &= index['chars'].get(char, set())
+        if not candidates:
+            break
+
+    return candidates
+
+
+def search(index: dict, query: str, boosts: dict[str, float] | None = None) -> list[str]:
+    """Returns item names that match the query, best match first.
+    boosts: Item name: 0-1 value that raises the item's rank (e.g. frecency)."""
+
+    query = query.lower()
+    keywords = query.split()
+
+    if not keywords:
+        index['last_query'], index['last_ids'] = None, None
+        return list(index['names'])
+
+    # Typing more narrows down the previous results.
+    pool = None
+    if index['last_query'] is not None and query.startswith(index['last_query']):
+        pool = index['last_ids']
+
+    candidates = candidate_ids(index, keywords, pool)
+
+    scored = []
+    for item_id in candidates:
+        fields = index['fields'][item_id]
+        total = 0.0
+        for keyword in keywords:
+            prefix_match = len(keyword) <= max_prefix_length and item_id in index['prefixes'].get(keyword, ())
+            score = score_keyword(keyword, fields, prefix_match)
+            if score == 0:
+                break
+            total += score
+        else:
+            if boosts:
+                total += SCORE_BOOST * boosts.get(index['names'][item_id], 0.0)
+            scored.append((-total, len(fields[0]), item_id))
+
+    scored.sort()
+
+    index['last_query'] = query
+    index['last_ids'] = {item_id for _, _, item_id in scored}
+
+    return [index['names'][item_id] for _, _, item_id in scored]
+
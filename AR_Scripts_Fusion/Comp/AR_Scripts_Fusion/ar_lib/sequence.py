@@ -0,0 +1,216 @@
+"""
+ar_lib.sequence
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Image sequence index shared by the scripts.
+
+A directory is listed once with os.scandir and the files are grouped into sequences
+by (prefix, padding, extension). The result is cached per directory and the cache
+is invalidated when the directory's modification time changes. Folder trees can be
+walked with walk_listings, which yields listings while the walk is still going.
+
+Sequence dictionary:
+    "directory" - Folder of the sequence.
+    "prefix"    - File name before the frame number (e.g. "shot_v001_").
+    "padding"   - Frame number padding (e.g. 4 for 0001).
+    "extension" - File extension with the dot (e.g. ".exr").
+    "first"     - First frame number.
+    "last"      - Last frame number.
+    "frames"    - Sorted list of the frame numbers.
+    "gaps"      - List of missing frame ranges as (start, end) tuples, inclusive.
+
+Changelog:
+1.1.0 (18.10.2026) - Added walk_listings and scan_listing (listing includes subdirectories and files without frame numbers).
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import os
+import re
+import threading
+from collections.abc import Iterator
+
+
+# Global variables
+frame_pattern = re.compile(r'^(.*?)(\d+)(\.[a-zA-Z][a-zA-Z0-9]*)$')  # prefix, frame number, extension.
+
+_cache: dict[str, tuple[int, dict]] = {}  # Directory path: (mtime, listing).
+_cache_lock = threading.Lock()
+
+
+# Functions
+def split_file_name(file_name: str) -> tuple[str, str, str] | None:
+    """Splits file name to prefix, frame number digits and extension."""
+
+    match = frame_pattern.match(file_name)
+    if match is None:
+        return None
+    return match.group(1), match.group(2), match.group(3)
+
+
+def resolve_padding(digits: str, paddings: list[int]) -> int:
+    """Returns the padding the given frame number digits belong to.
+    Numbers with a leading zero are always padded to their own length,
+    other numbers belong to the largest known padding that fits them (e.g. 10000 in a 4-padded sequence)."""
+
+    if digits.startswith("0") or not paddings:
+        return len(digits)
+    fitting = [padding for padding in paddings if padding <= len(digits)]
+    if fitting:
+        return max(fitting)
+    return len(digits)
+
+
+def get_gaps(frames: list[int]) -> list[tuple[int, int]]:
+    """Returns missing frame ranges from sorted frame numbers."""
+
+    gaps = []
+    for previous, current in zip(frames, frames[1:]):
+        if current - previous > 1:
+            gaps.append((previous + 1, current - 1))
+    return gaps
+
+
+def group_files(dir_path: str, file_names) -> dict[tuple[str, int, str], dict]:
+    """Groups file names to sequences by (prefix, padding, extension)."""
+
+    buckets: dict[tuple[str, str], list[str]] = {}
+    for file_name in file_names:
+        parts = split_file_name(file_name)
+        if parts is None:
+            continue
+        prefix, digits, extension = parts
+        buckets.setdefault((prefix, extension), []).append(digits)
+
+    index = {}
+    for (prefix, extension), digits_list in buckets.items():
+        # Paddings defined by numbers with leading zeros, or by the shortest number if nothing is padded.
+        paddings = sorted({len(digits) for digits in digits_list if digits.startswith("0")})
+        if not paddings:
+            paddings = [min(len(digits) for digits in digits_list)]
+
+        grouped: dict[int, set[int]] = {}
+        for digits in digits_list:
+            padding = resolve_padding(digits, paddings)
+            grouped.setdefault(padding, set()).add(int(digits))
+
+        for padding, frame_set in grouped.items():
+            frames = sorted(frame_set)
+            index[(prefix, padding, extension)] = {
+                "directory": dir_path,
+                "prefix": prefix,
+                "padding": padding,
+                "extension": extension,
+                "first": frames[0],
+                "last": frames[-1],
+                "frames": frames,
+                "gaps": get_gaps(frames),
+            }
+
+    return index
+
+
+def scan_listing(dir_path: str) -> dict:
+    """Lists the directory once and returns its listing:
+        "sequences" - Sequence index (see scan_directory).
+        "files"     - File names that don't have a frame number.
+        "dirs"      - Subdirectory names.
+    The directory is listed only when it has changed since the last scan."""
+
+    dir_path = os.path.normpath(dir_path)
+    empty = {"sequences": {}, "files": [], "dirs": []}
+
+    try:
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return empty
+
+    with _cache_lock:
+        cached = _cache.get(dir_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    file_names = []
+    dir_names = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dir_names.append(entry.name)
+                else:
+                    file_names.append(entry.name)
+    except OSError:
+        return empty
+
+    listing = {
+        "sequences": group_files(dir_path, file_names),
+        "files": sorted(name for name in file_names if split_file_name(name) is None),
+        "dirs": sorted(dir_names),
+    }
+
+    with _cache_lock:
+        _cache[dir_path] = (mtime, listing)
+
+    return listing
+
+
+def scan_directory(dir_path: str) -> dict[tuple[str, int, str], dict]:
+    """Returns all sequences of the given directory.
+    The directory is listed only when it has changed since the last scan."""
+
+    return scan_listing(dir_path)['sequences']
+
+
+def walk_listings(root_path: str, recursive: bool = True) -> Iterator[tuple[str, dict]]:
+    """Yields (dir_path, listing) for the root directory and its subdirectories (if recursive).
+    Every directory is listed only once, listings are yielded as soon as they are ready."""
+
+    stack = [os.path.normpath(root_path)]
+    while stack:
+        dir_path = stack.pop()
+        listing = scan_listing(dir_path)
+        yield dir_path, listing
+
+        if recursive:
+            stack.extend(os.path.join(dir_path, name) for name in reversed(listing['dirs']))
+
+
+def clear_cache() -> None:
+    """Clears the cached directory indexes."""
+
+    with _cache_lock:
+        _cache.clear()
+
+
+def get_sequence(file_path: str) -> dict | None:
+    """Returns the sequence the given file path belongs to.
+    The file itself does not have to exist, only the sequence."""
+
+    dir_path, file_name = os.path.split(file_path)
+    parts = split_file_name(file_name)
+    if parts is None:
+        return None
+
+    prefix, digits, extension = parts
+    index = scan_directory(dir_path or ".")
+
+    paddings = sorted(padding for (p, padding, e) in index if p == prefix and e == extension)
+    padding = resolve_padding(digits, paddings)
+
+    return index.get((prefix, padding, extension))
+
+
+def get_frame_range(file_path: str) -> tuple[int, int]:
+    """Returns first and last frame numbers from given image sequence path."""
+
+    sequence = get_sequence(file_path)
+    if sequence is None:
+        return 0, 0
+    return sequence['first'], sequence['last']
+
+
+def sequence_path(sequence: dict, frame_number: int) -> str:
+    """Returns the file path of the given frame of the sequence."""
+
+    file_name = f"{sequence['prefix']}{str(frame_number).zfill(sequence['padding'])}{sequence['extension']}"
+    return os.path.join(sequence['directory'], file_name)
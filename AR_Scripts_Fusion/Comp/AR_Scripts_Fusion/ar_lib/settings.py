@@ -0,0 +1,194 @@
+"""
+ar_lib.settings
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: Builds Fusion settings (the Lua table format used by copy/paste and .setting files).
+
+A whole node network is written to one settings table and pasted with a single
+comp.Paste() call, instead of adding tools and setting their inputs one by one.
+Connections refer to the tool names inside the table, Fusion renames the tools
+if the names are already taken in the composition.
+
+Lua values:
+    str, bool, int, float       - Written as Lua literals.
+    list, tuple                 - Written as arrays (e.g. positions { 110, 33 }).
+    dict                        - Written as tables, keys that aren't identifiers are written as ["Key"].
+    (constructor, dict)         - Written as constructor { table }, e.g. ("Input", {"Value": 1}) -> Input { Value = 1 }.
+                                  Use make_tool(), make_input() and make_connection() to build these.
+Settings copied from a composition (comp.CopySettings) or read from a file (ar_lib.comp_file) store
+constructors in "__ctor", from_settings() converts them to the format above.
+
+Changelog:
+1.2.0 (18.10.2026) - Small tables (e.g. keyframes) are written on one line.
+1.1.0 (18.10.2026) - Added from_settings, numeric table keys are written as [1].
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import re
+
+
+# Global variables
+grid_width = 110  # Flow grid unit in settings coordinates (AddTool uses grid units).
+grid_height = 33
+
+inline_size = 3  # Tables with up to this many items, none on multiple lines (e.g. keyframes { [1] = 0.5, Flags = { Linear = true } }), are written on one line.
+identifier_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+format_ids = {
+    ".exr": "OpenEXRFormat",
+    ".dpx": "DPXFormat",
+    ".png": "PNGFormat",
+    ".jpg": "JpegFormat",
+    ".jpeg": "JpegFormat",
+    ".tif": "TiffFormat",
+    ".tiff": "TiffFormat",
+    ".tga": "TargaFormat",
+    ".psd": "PSDFormat",
+    ".bmp": "BMPFormat",
+}
+
+
+# Functions
+def lua_string(text: str) -> str:
+    """Returns the text as a quoted Lua string."""
+
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
+    return f'"{escaped}"'
+
+
+def lua_key(key) -> str:
+    """Returns the table key in Lua syntax."""
+
+    key_type = type(key)
+    if key_type is int or key_type is float:
+        return f"[{key!r}]"
+    if isinstance(key, (int, float)) and not isinstance(key, bool):
+        return f"[{key!r}]"
+    key = str(key)
+    if identifier_pattern.match(key):
+        return key
+    return f"[{lua_string(key)}]"
+
+
+def to_lua(value, indent: int = 0) -> str:
+    """Converts the value to Lua text."""
+
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return repr(value)
+    if value_type is str:
+        return lua_string(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return lua_string(value)
+    if value is None:
+        return "nil"
+
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str) and isinstance(value[1], dict):
+        constructor, table = value
+        return f"{constructor} {to_lua(table, indent)}"
+
+    if isinstance(value, (list, tuple)):
+        return "{ " + ", ".join(to_lua(item, indent) for item in value) + " }"
+
+    if isinstance(value, dict):
+        if not value:
+            return "{ }"
+        items = [f"{lua_key(key)} = {to_lua(item, indent + 1)}" for key, item in value.items()]
+        if len(items) <= inline_size and not any("\n" in item for item in items):
+            return "{ " + ", ".join(items) + " }"
+        tab = "\t" * (indent + 1)
+        return "{\n" + "".join(f"{tab}{item},\n" for item in items) + "\t" * indent + "}"
+
+    raise TypeError(f"Can't convert {type(value).__name__} to Lua.")
+
+
+def from_settings(value):
+    """Converts copied settings (constructors in "__ctor") to values to_lua() writes back the same way."""
+
+    if isinstance(value, dict):
+        table = {key: from_settings(item) for key, item in value.items() if key != "__ctor"}
+        constructor = value.get("__ctor")
+        return (constructor, table) if constructor else table
+    if isinstance(value, (list, tuple)):
+        return [from_settings(item) for item in value]
+
+    return value
+
+
+def flow_position(x: float, y: float) -> list[float]:
+    """Converts flow grid position (the one AddTool uses) to settings position."""
+
+    return [x * grid_width, y * grid_height]
+
+
+def make_input(value) -> tuple[str, dict]:
+    """Returns an input with the given value."""
+
+    return ("Input", {"Value": value})
+
+
+def make_connection(tool_name: str, output: str = "Output") -> tuple[str, dict]:
+    """Returns an input connected to the given tool's output."""
+
+    return ("Input", {"SourceOp": tool_name, "Source": output})
+
+
+def make_tool(tool_type: str, inputs: dict | None = None, position: tuple[float, float] | None = None, extra: dict | None = None) -> tuple[str, dict]:
+    """Returns a tool. Position is in flow grid units, extra has additional tool fields (e.g. Clips)."""
+
+    table = {}
+    if extra:
+        table.update(extra)
+    if inputs:
+        table['Inputs'] = inputs
+    if position is not None:
+        table['ViewInfo'] = ("OperatorInfo", {"Pos": flow_position(*position)})
+
+    return (tool_type, table)
+
+
+def make_clip(file_path: str, trim_in: int = 0, trim_out: int = 0, global_start: int = 0, global_end: int = 0,
+              start_frame: int | None = None, length: int | None = None, loop: bool = False,
+              extend_first: int = 0, extend_last: int = 0) -> tuple[str, dict]:
+    """Returns a Loader clip. Start frame and length of the sequence are detected by Fusion if they are not given."""
+
+    clip = {"ID": "Clip1", "Filename": file_path}
+
+    extension = "." + file_path.rsplit(".", 1)[-1].lower() if "." in file_path else ""
+    if extension in format_ids:
+        clip['FormatID'] = format_ids[extension]
+    if start_frame is not None:
+        clip['StartFrame'] = start_frame
+    if length is not None:
+        clip['Length'] = length
+        clip['LengthSetManually'] = True
+
+    clip.update({
+        "TrimIn": trim_in,
+        "TrimOut": trim_out,
+        "ExtendFirst": extend_first,
+        "ExtendLast": extend_last,
+        "Loop": int(loop),
+        "AspectMode": 0,
+        "Depth": 0,
+        "TimeCode": 0,
+        "GlobalStart": global_start,
+        "GlobalEnd": global_end,
+    })
+
+    return ("Clip", clip)
+
+
+def build_setting(tools: dict[str, tuple[str, dict]], active_tool: str | None = None) -> str:
+    """Returns settings text of the tools (tool name: tool), ready to be pasted."""
+
+    setting = {"Tools": ("ordered()", tools)}
+    if active_tool is not None:
+        setting['ActiveTool'] = active_tool
+
+    return to_lua(setting)
@@ -0,0 +1,231 @@
+"""
+ar_lib.timecode
+
+Author: Arttu Rautio (aturtur)
+Website: http://aturtur.com/
+Description: SMPTE timecode conversions, drop frame and fractional frame rates.
+
+Timecode is counted with the nominal frame rate (30 for 29.97, 24 for 23.976). Drop frame
+timecode (29.97 and 59.94, written with ";" before the frames) skips 2 or 4 frame numbers at
+the start of every minute except every tenth minute. Single values are parsed with one compiled
+regular expression, arrays of frames or timecodes are converted with NumPy.
+
+Changelog:
+1.0.1 (18.10.2026) - Integer 30 and 60 fps don't drop frames, only 29.97 and 59.94.
+1.0.0 (18.10.2026) - Initial release.
+"""
+# Libraries
+import re
+import time
+
+import numpy as np
+
+
+# Global variables
+frame_rates = [24000 / 1001, 24.0, 25.0, 30000 / 1001, 30.0, 48.0, 50.0, 60000 / 1001, 60.0]
+drop_frame_bases = [30, 60]  # Nominal rates of the rates that have drop frame timecode (29.97 and 59.94).
+
+timecode_pattern = re.compile(r"^\s*(-?)(\d{1,2})[:.](\d{1,2})[:.](\d{1,2})([:;.,])(\d{1,3})\s*$")
+separators = b":;.,"
+
+
+# Functions
+def normalize_rate(frame_rate: float) -> float:
+    """Snaps a rounded frame rate (e.g. 23.98 or 29.97) to the exact standard rate (e.g. 24000/1001)."""
+
+    frame_rate = float(frame_rate)
+    for standard in frame_rates:
+        if abs(frame_rate - standard) < 0.01:
+            return standard
+
+    return frame_rate
+
+
+def get_timebase(frame_rate: float) -> int:
+    """Returns the nominal frame rate the timecode is counted with (30 for 29.97)."""
+
+    return max(int(round(frame_rate)), 1)
+
+
+def get_drop_count(frame_rate: float, drop_frame: bool) -> int:
+    """Returns frame numbers skipped per minute (0 if the rate doesn't have drop frame timecode).
+    Only 30000/1001 (29.97) and 60000/1001 (59.94) have drop frame timecode, integer 30 and 60 don't."""
+
+    timebase = get_timebase(frame_rate)
+    if not drop_frame or timebase not in drop_frame_bases or abs(frame_rate - timebase * 1000 / 1001) > 0.01:
+        return 0
+
+    return timebase // 15
+
+
+def parse(timecode: str) -> tuple[int, int, int, int, bool]:
+    """Parses "hh:mm:ss:ff" or "hh:mm:ss;ff" to (hours, minutes, seconds, frames, drop frame).
+    Negative timecode (-hh:mm:ss:ff) returns negative fields."""
+
+    match = timecode_pattern.match(timecode)
+    if match is None:
+        raise ValueError(f"Invalid timecode: {timecode!r}")
+
+    sign, hours, minutes, seconds, separator, frames = match.groups()
+    sign = -1 if sign else 1
+
+    return sign * int(hours), sign * int(minutes), sign * int(seconds), sign * int(frames), separator in ";,"
+
+
+def format_timecode(hours: int, minutes: int, seconds: int, frames: int, drop_frame: bool = False) -> str:
+    """Formats timecode, drop frame timecode uses ";" before the frames."""
+
+    return f"{hours:02}:{minutes:02}:{seconds:02}{';' if drop_frame else ':'}{frames:02}"
+
+
+def to_frames(timecode: str, frame_rate: float, drop_frame: bool | None = None) -> int:
+    """Converts timecode to frames. If drop_frame is None, it's read from the separator (";" is drop frame)."""
+
+    hours, minutes, seconds, frames, parsed_drop = parse(timecode)
+    if drop_frame is None:
+        drop_frame = parsed_drop
+
+    timebase = get_timebase(frame_rate)
+    total_minutes = hours * 60 + minutes
+    drop = get_drop_count(frame_rate, drop_frame)
+
+    return (total_minutes * 60 + seconds) * timebase + frames - drop * (total_minutes - total_minutes // 10)
+
+
+def to_timecode(frame_number: int, frame_rate: float, drop_frame: bool = False, wrap: bool = True) -> str:
+    """Converts frames to timecode. Timecode rolls over at 24 hours if wrap is True."""
+
+    timebase = get_timebase(frame_rate)
+    drop = get_drop_count(frame_rate, drop_frame)
+    frame_number = int(frame_number)
+
+    if drop:
+        frames_per_ten_minutes = timebase * 600 - drop * 9
+        frames_per_minute = timebase * 60 - drop
+        tens, remainder = divmod(frame_number, frames_per_ten_minutes)
+        frame_number += drop * 9 * tens
+        if remainder > drop:
+            frame_number += drop * ((remainder - drop) // frames_per_minute)
+
+    frames = frame_number % timebase
+    seconds = frame_number // timebase % 60
+    minutes = frame_number // (timebase * 60) % 60
+    hours = frame_number // (timebase * 3600)
+    if wrap:
+        hours %= 24
+
+    return format_timecode(hours, minutes, seconds, frames, bool(drop))
+
+
+def to_frames_array(timecodes, frame_rate: float, drop_frame: bool | None = None) -> np.ndarray:
+    """Converts timecodes (list or array of "hh:mm:ss:ff" strings) to an array of frames.
+    Timecodes in the exact 11 character format are converted with NumPy, others with parse()."""
+
+    texts = np.asarray(timecodes)
+    if texts.dtype.kind not in "US":
+        texts = texts.astype(str)
+    texts = np.ascontiguousarray(texts.ravel())
+    count = len(texts)
+    result = np.zeros(count, dtype=np.int64)
+    if count == 0:
+        return result
+
+    # Characters as numbers (unicode strings are 4 bytes per character), no string objects are created.
+    unicode = texts.dtype.kind == "U"
+    width = texts.dtype.itemsize // (4 if unicode else 1)
+    codes = texts.view(np.uint32 if unicode else np.uint8).reshape(count, width)
+    if width < 11:
+        codes = np.zeros((count, 11), dtype=codes.dtype)
+    chars = codes[:, :11].astype(np.int64)
+    fixed = chars[:, 10] != 0
+    if width > 11:
+        fixed &= codes[:, 11] == 0
+
+    digits = chars[:, [0, 1, 3, 4, 6, 7, 9, 10]] - 48
+    valid = fixed & np.all((digits >= 0) & (digits <= 9), axis=1)
+    for column in (2, 5, 8):
+        valid &= np.isin(chars[:, column], np.frombuffer(separators, dtype=np.uint8))
+
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 2] * 10 + digits[:, 3]
+    seconds = digits[:, 4] * 10 + digits[:, 5]
+    frames = digits[:, 6] * 10 + digits[:, 7]
+    if drop_frame is None:
+        is_drop = (chars[:, 8] == ord(";")) | (chars[:, 8] == ord(","))
+    else:
+        is_drop = np.full(count, bool(drop_frame))
+
+    timebase = get_timebase(frame_rate)
+    drop = get_drop_count(frame_rate, True)
+    total_minutes = hours * 60 + minutes
+    result[:] = (total_minutes * 60 + seconds) * timebase + frames - is_drop * drop * (total_minutes - total_minutes // 10)
+
+    for i in np.flatnonzero(~valid).tolist():
+        result[i] = to_frames(str(texts[i]), frame_rate, drop_frame)
+
+    return result
+
+
+def to_timecode_array(frame_numbers, frame_rate: float, drop_frame: bool = False, wrap: bool = True) -> np.ndarray:
+    """Converts an array of frames to an array of timecode strings.
+    Hours over 99 (without wrap) are not supported."""
+
+    frame_numbers = np.asarray(frame_numbers, dtype=np.int64).ravel()
+    timebase = get_timebase(frame_rate)
+    drop = get_drop_count(frame_rate, drop_frame)
+
+    if drop:
+        frames_per_ten_minutes = timebase * 600 - drop * 9
+        frames_per_minute = timebase * 60 - drop
+        tens, remainder = np.divmod(frame_numbers, frames_per_ten_minutes)
+        frame_numbers = frame_numbers + drop * 9 * tens + np.where(remainder > drop, drop * ((remainder - drop) // frames_per_minute), 0)
+
+    frames = frame_numbers % timebase
+    seconds = frame_numbers // timebase % 60
+    minutes = frame_numbers // (timebase * 60) % 60
+    hours = frame_numbers // (timebase * 3600)
+    hours = hours % 24 if wrap else np.clip(hours, 0, 99)
+
+    chars = np.empty((len(frame_numbers), 11), dtype=np.uint8)
+    for column, values in ((0, hours), (3, minutes), (6, seconds), (9, frames)):
+        chars[:, column] = values // 10 + 48
+        chars[:, column + 1] = values % 10 + 48
+    chars[:, 2] = chars[:, 5] = ord(":")
+    chars[:, 8] = ord(";") if drop else ord(":")
+
+    return chars.view("S11").ravel().astype(str)
+
+
+def offset(timecode: str, frames: int, frame_rate: float, drop_frame: bool | None = None) -> str:
+    """Returns the timecode moved by the given amount of frames."""
+
+    if drop_frame is None:
+        drop_frame = parse(timecode)[4]
+
+    return to_timecode(to_frames(timecode, frame_rate, drop_frame) + frames, frame_rate, drop_frame)
+
+
+if __name__ == "__main__":
+    # Benchmark: one million frames to timecode and back, per frame rate.
+    count = 1000000
+    frame_numbers = np.arange(count, dtype=np.int64) * 7 % (24 * 3600 * 24)
+    print(f"{'Rate':>8}{'DF':>4}{'To TC (ms)':>12}{'To frames (ms)':>16}{'Python loop (ms)':>18}")
+    for frame_rate in frame_rates:
+        for drop_frame in (False, True) if get_drop_count(frame_rate, True) else (False,):
+            numbers = frame_numbers % (get_timebase(frame_rate) * 3600 * 24 - 1)
+
+            start_time = time.perf_counter()
+            timecodes = to_timecode_array(numbers, frame_rate, drop_frame)
+            timecode_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            converted = to_frames_array(timecodes, frame_rate)
+            frames_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for number in numbers[:10000].tolist():
+                to_frames(to_timecode(number, frame_rate, drop_frame), frame_rate)
+            python_time = (time.perf_counter() - start_time) * count / 10000
+
+            assert np.array_equal(converted, numbers), "Round trip failed."
+            print(f"{frame_rate:>8.3f}{'DF' if drop_frame else '':>4}{timecode_time * 1000:>12.0f}{frames_time * 1000:>16.0f}{python_time * 1000:>18.0f}")
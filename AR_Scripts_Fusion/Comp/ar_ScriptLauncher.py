@@ -4,7 +4,7 @@ ar_ScriptLauncher
 Author: Arttu Rautio (aturtur)
 Website: http://aturtur.com/
 Name-US: Script Launcher
-Version: 1.5.0
+Version: 1.9.2
 Description-US: Search and run sripts easily.
 
 Written for Blackmagic Design Fusion Studio 19.0 build 59.
@@ -19,6 +19,17 @@ Highly recommended to add this script to hotkey:
             Scripts → ar_ScriptLauncher
 
 Changelog:
+1.9.2 (18.10.2026) - Launches of scripts with a dialog are flagged in the launch log.
+1.9.1 (18.10.2026) - script_collection.json is updated at start up, only new and changed scripts are parsed.
+1.9.0 (18.10.2026) - Records launch count, last used time and duration of the scripts to a local log.
+                   - Search results are ranked also by frecency (frequency and recency).
+1.8.0 (18.10.2026) - Compiled scripts are cached (by modification time) and run without stale sys.modules entries.
+                   - Optional libraries used by the scripts are imported in the background.
+1.7.0 (18.10.2026) - Ranked fuzzy search (name, file name and description), typing narrows the previous results.
+                   - The tree is rebuilt only when the results change, icons are loaded once.
+1.6.0 (18.10.2026) - Loads precomputed search text from script_collection.json, search matches also file name and description.
+                   - Builds script_collection.json if it's missing. Supports relative paths.
+                   - Screen size is cached for the session.
 1.5.0 (17.05.2026) - The script uses now script_collection.json file to populate the tree.
 1.4.0 (22.01.2026) - Switched pyautogui to keyboard library, to speed up the start up time.
 1.3.1 (25.09.2025) - Added unicode_escape decoding for tooltips, allows multi-line tooltips.
@@ -34,13 +45,19 @@ Changelog:
 1.0.0 (26.09.2024) - Initial realease.
 """
 # Libraries
-import re
 import sys
+import time
 import inspect
 from pathlib import Path
-import importlib.util
-from collections import Counter
-import json
+
+lib_dir = Path(inspect.getfile(lambda: None)).resolve().parent / "AR_Scripts_Fusion"
+if str(lib_dir) not in sys.path:
+    sys.path.append(str(lib_dir))  # Allows importing shared modules from ar_lib folder.
+
+from ar_lib import script_index
+from ar_lib import search
+from ar_lib import script_cache
+from ar_lib import launch_log
 
 try:
     #import pyautogui
@@ -57,6 +74,8 @@ fusion = fu  # fusion = bmd.scriptapp("Fusion")
 comp = comp  # comp = fusion.GetCurrentComp()
 
 script_dir  = Path(inspect.getfile(lambda: None)).resolve().parent
+icon_folder = script_dir / "icons"
+screen_size_key = "ar_ScriptLauncher.ScreenSize"  # Fusion data key for the cached screen size.
 
 use_icons = True  # Set this to False, if you want to disable icons.
 
@@ -65,6 +84,10 @@ CTRL: str = "CTRL"
 SHIFT: str = "SHIFT"
 
 scripts = {}
+search_index = {}
+frecency = {}  # Script name: 0-1 value from the launch log.
+icons = {}  # Created ui.Icons, so icons are loaded only once.
+shown_scripts = []  # Script names currently in the tree.
 
 
 # Functions
@@ -108,37 +131,48 @@ def get_script_info(script) -> tuple[str, str]:
 
 
 def get_scripts(json_file: Path) -> None:
-    """Loads scripts from a JSON file and fills the scripts dictionary."""
-
-    if not json_file.exists():
-        raise FileNotFoundError(f"JSON file not found: {json_file}")
+    """Loads scripts from a JSON file and fills the scripts dictionary.
+    The JSON file is updated first, only new and changed scripts are parsed."""
 
-    with json_file.open("r", encoding="utf-8") as f:
-        data: list[dict] = json.load(f)
+    data, _ = script_index.update_collection(script_dir, icon_folder, json_file)
 
     scripts.clear()
 
     for entry in data:
         name = entry.get("name")
         desc = entry.get("desc", "")
-        path = Path(entry.get("path", ""))
+        path = entry.get("path")
         icon = entry.get("icon")
 
         if not name or not path:
             continue  # Skip invalid entries.
 
+        path = script_index.resolve_path(path, json_file.parent)
+        search_text = entry.get("search") or script_index.search_text(name, path.stem, desc)
+
         scripts[name] = {
             "FileName": path.stem,
             "Extension": path.suffix,
             "Description": desc,
             "Path": path,
-            "Icon": Path(icon) if icon else None,
+            "Icon": script_index.resolve_path(icon, json_file.parent) if icon else None,
+            "Search": search_text,
         }
 
 
+def get_icon(script_name: str, icon_path: Path):
+    """Returns ui.Icon for the script, creates it only once."""
+
+    if script_name not in icons:
+        icons[script_name] = ui.Icon({"ID": script_name, "File": str(icon_path)})
+    return icons[script_name]
+
+
 def populate_tree(tree, scripts: dict) -> None:
     """Populates ui.Tree with script names."""
 
+    shown_scripts[:] = list(scripts)
+
     for script_name, details in scripts.items():
         itRow = tree.NewItem()
         itRow.Text[0] = "  " + script_name
@@ -148,7 +182,7 @@ def populate_tree(tree, scripts: dict) -> None:
             continue
         if use_icons:
             icon_path = details['Icon']
-            itRow.Icon[0] = ui.Icon({"ID": script_name, "File": str(icon_path)})
+            itRow.Icon[0] = get_icon(script_name, icon_path)
         tree.AddTopLevelItem(itRow)
 
 
@@ -167,58 +201,80 @@ def select_first_item(tree)-> None:
         item.Selected = True
 
 
-def search(string: str, keyword: str) -> None:
-    """Checks if the given keywords can be found in the string."""
-
-    keywords = keyword.split()
-    keyword_counts = Counter(keywords)
-    return all(len(re.findall(re.escape(k), string, re.IGNORECASE)) >= count
-            for k, count in keyword_counts.items())
-
-
 def get_script_path(name: str) -> str | None:
     """Gets script path by given script name."""
 
     return scripts.get(name.strip(), {}).get("Path")
 
 
-def run_script(file_path: str, key_modifiers: list) -> None:
-    """Runs script file from given file path."""
+def run_script(file_path: Path, key_modifiers: list) -> None:
+    """Runs script file from given file path.
+    Compiled scripts are cached, so running the same script again skips compiling."""
 
-    spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
-    module = importlib.util.module_from_spec(spec)
-    
     # Set important variables.
-    module.bmd = bmd
-    module.app = app
-    module.fusion = fusion
-    module.fu = fu
-    module.comp = comp
-    module.key_modifiers = key_modifiers
-    
-    sys.modules[file_path.stem] = module
+    variables = {
+        "bmd": bmd,
+        "app": app,
+        "fusion": fusion,
+        "fu": fu,
+        "comp": comp,
+        "key_modifiers": key_modifiers,
+    }
 
     # Run the external python script.
-    spec.loader.exec_module(module)
+    module = script_cache.load(file_path, variables)
     if hasattr(module, 'main'):
         module.main()
 
 
-def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
-    """Maps GUI position with 0-1 values.
-    0.5 being in the center of the screen.
-    Uses tkinter to get screen resolution."""
+def launch_script(script_name: str, key_modifiers: list) -> None:
+    """Runs the script by its name and records the launch (duration from run_script through main()).
+    Scripts with a dialog are flagged, their duration includes the time the dialog was open."""
 
-    import tkinter as tk
+    script_name = script_name.strip()
+    file_path = get_script_path(script_name)
 
-    def lerp(a: float, b: float, t: float) -> float:
-        return a + t * (b - a)
+    ok = False
+    dialog = False
+    start_time = time.perf_counter()
+    try:
+        dialog = script_cache.has_dialog(file_path)
+        run_script(file_path, key_modifiers)
+        ok = True
+    finally:
+        launch_log.record_launch(script_name, file_path, time.perf_counter() - start_time, ok, dialog)
+
+
+def get_screen_size() -> tuple[int, int]:
+    """Returns screen resolution.
+    Cached to Fusion's data for the session, so tkinter is used only on the first launch."""
+
+    cached = fusion.GetData(screen_size_key)
+    if cached:
+        return int(cached['Width']), int(cached['Height'])
+
+    import tkinter as tk
 
     temp_win = tk.Tk()
     screen_width = temp_win.winfo_screenwidth()
     screen_height = temp_win.winfo_screenheight()
     temp_win.destroy()
 
+    fusion.SetData(screen_size_key, {"Width": screen_width, "Height": screen_height})
+
+    return screen_width, screen_height
+
+
+def gui_geometry(width: int, height: int, x: float, y: float) -> dict:
+    """Maps GUI position with 0-1 values.
+    0.5 being in the center of the screen.
+    Uses cached screen resolution."""
+
+    def lerp(a: float, b: float, t: float) -> float:
+        return a + t * (b - a)
+
+    screen_width, screen_height = get_screen_size()
+
     gui_width = width
     gui_height = height
 
@@ -299,6 +355,11 @@ itm['Search'].SetStyleSheet(search_style)
 # Scan and collect scipts.
 json_file = script_dir / "script_collection.json"
 get_scripts(json_file)
+search_index = search.build_index({name: data['Search'] for name, data in scripts.items()})
+frecency = launch_log.get_frecency(launch_log.get_stats(launch_log.read_records(all_logs=False)))
+
+# Import optional libraries used by the scripts in the background.
+script_cache.prewarm()
 
 # Build the tree.
 script_tree = itm['Tree']
@@ -346,7 +407,7 @@ def _func(ev):
         dlg.Hide()
 
         if script_name:
-            run_script(get_script_path(script_name), key_modifiers)
+            launch_script(script_name, key_modifiers)
 dlg.On.MyWin.KeyPress = _func
 
 
@@ -355,24 +416,18 @@ def _func(ev):
     key_modifiers = get_key_modifiers(ev)
     disp.ExitLoop()
     dlg.Hide()
-    run_script(get_script_path(str(ev['item'].Text[0])), key_modifiers)
+    launch_script(str(ev['item'].Text[0]), key_modifiers)
 dlg.On.Tree.ItemDoubleClicked = _func
 
 
 # LineEdit changed.
 def _func(ev):
-    if itm['Search'].Text == "":
-        clear_tree(script_tree)
-        populate_tree(script_tree, scripts)
-    else:
-        clear_tree(script_tree)
-        filtered_scripts = {}
-        keyword = itm['Search'].Text
-        for script_name, script_data in scripts.items():
-            if search(script_name, keyword):
-                filtered_scripts[script_name] = script_data
-        populate_tree(script_tree, filtered_scripts)
-        select_first_item(script_tree)
+    results = search.search(search_index, itm['Search'].Text, frecency)
+    if results == shown_scripts:  # Nothing changed, no need to rebuild the tree.
+        return
+    clear_tree(script_tree)
+    populate_tree(script_tree, {name: scripts[name] for name in results})
+    select_first_item(script_tree)
 dlg.On['Search'].TextChanged = _func
 
 